@@ -5,8 +5,18 @@ from flask import Flask
 from flask_restx import Api
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from config import config
-from app.models.db import db
+from app.models.db import compile_serializers, db
+from app.persistence.cache import create_backend, entity_cache
+from app.persistence.routing import init_db
+from app.persistence.shared_store import create_shared_client
+from app.services.login_throttle import create_bucket_store, login_throttle
+from app.services.token_store import create_revocation_store, token_revocations
+from app.utils.json_output import output_json
+from app.utils.passwords import hasher
+from app.utils.query_timing import init_query_timing
+from app.utils.sqlite_tuning import init_sqlite_pragmas
 
 
 def create_app(config_name='development'):
@@ -18,34 +28,58 @@ def create_app(config_name='development'):
     # Load configuration from config object
     app.config.from_object(config[config_name])
     
-    # Initialize database
-    db.init_app(app)
-    
-    # Create tables and initial data
-    with app.app_context():
-        db.create_all()
-        
-        # Check if admin exists, if not create it
-        from app.models.user import User
-        admin = User.query.filter_by(email='admin@hbnb.com').first()
-        
-        if not admin:
-            admin = User(
-                first_name='Admin',
-                last_name='User',
-                email='admin@hbnb.com',
-                password='secret123',
-                is_admin=True
-            )
-            db.session.add(admin)
-            db.session.commit()
-            print("✅ Admin user created: admin@hbnb.com / secret123")
+    # Configure the password hashing pool before any user is created
+    hasher.configure(
+        rounds=app.config['BCRYPT_LOG_ROUNDS'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        queue_limit=app.config['PASSWORD_HASH_QUEUE_LIMIT']
+    )
+    
+    # Initialize database, SQLite pragmas and per-request query timing
+    init_db(app, db)
+    init_sqlite_pragmas(app, db)
+    init_query_timing(app, db)
+    
+    # Client for the 'shared' backends; without one they fall back to a
+    # store private to this process
+    shared_client = create_shared_client(app.config['SHARED_STORE_URL'],
+                                         base_dir=app.instance_path)
+    
+    # Entity cache; a fresh backend per app keeps instances isolated
+    entity_cache.configure(create_backend(
+        app.config['ENTITY_CACHE_BACKEND'],
+        ttl=app.config['ENTITY_CACHE_TTL'],
+        max_size=app.config['ENTITY_CACHE_SIZE'],
+        client=shared_client
+    ))
+    
+    # Login throttle; like the entity cache, each app gets fresh buckets
+    login_throttle.configure(
+        create_bucket_store(app.config['LOGIN_THROTTLE_BACKEND'], shared_client),
+        ip_limit=app.config['LOGIN_THROTTLE_PER_IP'],
+        email_limit=app.config['LOGIN_THROTTLE_PER_EMAIL']
+    )
+    
+    # Schema creation and the admin account are one-off CLI steps
+    # (flask hbnb init-db / seed-admin), not part of every worker's boot
+    compile_serializers()
     
     # Enable CORS
     CORS(app)
     
-    # Initialize JWT
+    # Behind trusted proxies, remote_addr comes from X-Forwarded-For
+    hops = app.config['TRUSTED_PROXY_HOPS']
+    if hops:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
+    
+    # Initialize JWT; revoked sessions and spent refresh tokens are refused
     jwt = JWTManager(app)
+    token_revocations.configure(
+        create_revocation_store(app.config['TOKEN_REVOCATION_BACKEND'], shared_client),
+        family_ttl=int(app.config['JWT_REFRESH_TOKEN_EXPIRES']),
+        reuse_grace=app.config['JWT_REFRESH_REUSE_GRACE']
+    )
+    jwt.token_in_blocklist_loader(token_revocations.is_revoked)
     
     # Initialize Flask-RESTX
     api = Api(
@@ -55,6 +89,7 @@ def create_app(config_name='development'):
         description='HBnB Application API',
         doc='/api/v1/'
     )
+    api.representation('application/json')(output_json)
     
     # Register namespaces
     from app.api.v1.users import api as users_ns
@@ -62,11 +97,39 @@ def create_app(config_name='development'):
     from app.api.v1.places import api as places_ns
     from app.api.v1.reviews import api as reviews_ns
     from app.api.v1.auth import api as auth_ns
+    from app.api.v1.admin import api as admin_ns
     
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
     api.add_namespace(places_ns, path='/api/v1/places')
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
     api.add_namespace(auth_ns, path='/api/v1/auth')
+    api.add_namespace(admin_ns, path='/api/v1/admin')
+    
+    # Facade services: stats snapshot, role-change cache and response cache
+    from app.services import shared_facade
+    shared_facade.response_cache.configure(
+        create_backend(
+            app.config['RESPONSE_CACHE_BACKEND'],
+            ttl=app.config['RESPONSE_CACHE_STALE_TTL'],
+            max_size=app.config['RESPONSE_CACHE_SIZE'],
+            client=shared_client,
+            prefix='hbnb:response:'
+        ),
+        ttl=app.config['RESPONSE_CACHE_TTL'],
+        stale_ttl=app.config['RESPONSE_CACHE_STALE_TTL']
+    )
+    shared_facade.stats.ttl = app.config['ADMIN_STATS_TTL']
+    # Role changes live next to the revocations, shared or per process
+    shared_facade.role_changes.configure(
+        getattr(token_revocations.store, 'client', None),
+        max_age=int(app.config['JWT_ACCESS_TOKEN_EXPIRES'])
+    )
+    if app.config['ADMIN_STATS_BACKGROUND_REFRESH']:
+        shared_facade.stats.start_background_refresh(app)
+    
+    # Register CLI commands
+    from app.cli import hbnb_cli
+    app.cli.add_command(hbnb_cli)
     
     return app
\ No newline at end of file
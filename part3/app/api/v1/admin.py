@@ -1,13 +1,28 @@
 """
 Admin-only endpoints.
 """
+from datetime import datetime
+from flask import Response, current_app, request, stream_with_context
 from flask_restx import Namespace, Resource
 from flask_jwt_extended import jwt_required
 from app.services import shared_facade
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
 from app.utils.decorators import admin_required
+from app.utils.export import EXPORT_FORMATS, encode_rows
 
 api = Namespace('admin', description='Admin operations')
 
+# Exportable entities by URL name
+EXPORT_MODELS = {
+    'users': User,
+    'places': Place,
+    'reviews': Review,
+    'amenities': Amenity
+}
+
 
 @api.route('/stats')
 class AdminStats(Resource):
@@ -16,29 +31,92 @@ class AdminStats(Resource):
     @jwt_required()
     @admin_required()
     def get(self):
-        """Get system statistics (Admin only)."""
-        users = shared_facade.get_all_users()
-        places = shared_facade.get_all_places()
-        reviews = shared_facade.get_all_reviews()
-        amenities = shared_facade.get_all_amenities()
+        """Get system statistics from a cached snapshot (Admin only)."""
+        return shared_facade.get_stats(), 200
+
+
+@api.route('/cache')
+class AdminCacheStats(Resource):
+    
+    @api.doc('get_cache_stats', security='Bearer Auth')
+    @jwt_required()
+    @admin_required()
+    def get(self):
+        """Get entity cache hit/miss counters (Admin only)."""
+        return shared_facade.get_cache_stats(), 200
+
+
+@api.route('/cache/responses')
+class AdminResponseCacheStats(Resource):
+    
+    @api.doc('get_response_cache_stats', security='Bearer Auth')
+    @jwt_required()
+    @admin_required()
+    def get(self):
+        """Get public response cache hits, stale hits, misses and hit ratio (Admin only)."""
+        return shared_facade.get_response_cache_stats(), 200
+
+
+@api.route('/metrics')
+class AdminQueryMetrics(Resource):
+    
+    @api.doc('get_query_metrics', security='Bearer Auth')
+    @jwt_required()
+    @admin_required()
+    def get(self):
+        """Get per-endpoint query counts, DB time and slow queries (Admin only)."""
+        return current_app.extensions['query_metrics'].snapshot(), 200
+
+
+@api.route('/export/<entity>')
+@api.param('entity', 'One of users, places, reviews, amenities')
+class AdminExport(Resource):
+    
+    @api.doc('export_entities', security='Bearer Auth', params={
+        'format': 'ndjson (default) or csv',
+        'updated_since': 'ISO 8601 time; only rows updated at or after it'
+    })
+    @jwt_required()
+    @admin_required()
+    def get(self, entity):
+        """Stream a whole table as NDJSON or CSV (Admin only)."""
+        model_class = EXPORT_MODELS.get(entity)
+        if model_class is None:
+            return {'error': f'Unknown entity: {entity}'}, 404
         
-        return {
-            'total_users': len(users),
-            'total_places': len(places),
-            'total_reviews': len(reviews),
-            'total_amenities': len(amenities),
-            'admin_users': len([u for u in users if u.is_admin])
-        }, 200
+        fmt = request.args.get('format', 'ndjson')
+        if fmt not in EXPORT_FORMATS:
+            return {'error': 'format must be ndjson or csv'}, 400
+        
+        updated_since = request.args.get('updated_since')
+        if updated_since:
+            try:
+                updated_since = datetime.fromisoformat(updated_since)
+            except ValueError:
+                return {'error': 'updated_since must be an ISO 8601 datetime'}, 400
+        
+        objects = shared_facade.stream_entities(
+            model_class.__name__, updated_since or None,
+            current_app.config.get('EXPORT_BATCH_SIZE', 1000)
+        )
+        response = Response(
+            stream_with_context(encode_rows(fmt, model_class, objects)),
+            mimetype=EXPORT_FORMATS[fmt]
+        )
+        response.headers['Content-Disposition'] = (
+            f'attachment; filename={entity}.{fmt}'
+        )
+        return response
 
 
-@api.route('/users/<int:user_id>/toggle-admin')
+@api.route('/users/<user_id>/toggle-admin')
 class ToggleAdmin(Resource):
     
     @api.doc('toggle_admin', security='Bearer Auth')
     @jwt_required()
     @admin_required()
     def put(self, user_id):
-        """Toggle admin status (Admin only)."""
+        """Toggle admin status (Admin only); the user's old tokens stop working."""
         user = shared_facade.get_user(user_id)
         if not user:
             return {'error': 'User not found'}, 404
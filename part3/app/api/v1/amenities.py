@@ -4,7 +4,10 @@ Amenity API with admin protection.
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required
 from app.services import shared_facade
-from app.utils.decorators import admin_required
+from app.utils.batch import batch_create, missing_fields, unknown_fields
+from app.utils.decorators import admin_required, public_cache
+from app.utils.conditional import Validators
+from app.utils.pagination import PAGINATION_PARAMS, get_page_args, page_response
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -29,23 +32,73 @@ class AmenityList(Resource):
         except Exception as e:
             return {'error': str(e)}, 400
     
-    @api.doc('list_amenities')
+    @api.doc('list_amenities', params=PAGINATION_PARAMS)
+    @api.response(400, 'Invalid pagination parameters')
+    @public_cache('amenities')
     def get(self):
-        """Get all amenities."""
-        amenities = shared_facade.get_all_amenities()
-        return [a.to_dict() for a in amenities], 200
+        """Get a page of amenities."""
+        validators = Validators.for_collection(
+            'amenities', *shared_facade.get_collection_version('Amenity')
+        )
+        not_modified = validators.not_modified()
+        if not_modified:
+            return not_modified
+        try:
+            limit, cursor = get_page_args()
+            amenities, next_cursor = shared_facade.get_amenities_page(limit, cursor)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response(amenities, next_cursor), 200, validators.headers()
+
+
+@api.route('/batch')
+class AmenityBatch(Resource):
+    
+    @api.doc('create_amenities_batch', security='Bearer Auth')
+    @api.expect([amenity_model])
+    @api.response(201, 'All amenities created')
+    @api.response(207, 'Some amenities rejected; see per-item results')
+    @api.response(400, 'Invalid batch')
+    @jwt_required()
+    @admin_required()
+    def post(self):
+        """Create many amenities in one transaction (Admin only)."""
+        seen_names = set()
+        
+        def validate(amenity_data):
+            error = (unknown_fields(amenity_data, ('name',))
+                     or missing_fields(amenity_data, ('name',)))
+            if error:
+                return error
+            name = amenity_data['name']
+            if not isinstance(name, str) or not name.strip():
+                return 'Name must be a non-empty string'
+            if name in seen_names or shared_facade.get_amenity_by_name(name):
+                return 'Amenity already exists'
+            seen_names.add(name)
+            return None
+        
+        return batch_create(api.payload, validate, shared_facade.create_amenities)
 
 
-@api.route('/<int:amenity_id>')
+@api.route('/<amenity_id>')
 class AmenityResource(Resource):
     
     @api.doc('get_amenity')
     def get(self, amenity_id):
         """Get amenity by ID."""
+        updated_at = shared_facade.get_entity_version('Amenity', amenity_id)
+        if updated_at is None:
+            return {'error': 'Amenity not found'}, 404
+        not_modified = Validators.for_entity('Amenity', amenity_id, updated_at).not_modified()
+        if not_modified:
+            return not_modified
+        
         amenity = shared_facade.get_amenity(amenity_id)
         if not amenity:
             return {'error': 'Amenity not found'}, 404
-        return amenity.to_dict(), 200
+        validators = Validators.for_entity('Amenity', amenity.id, amenity.updated_at)
+        return amenity.to_dict(), 200, validators.headers()
     
     @api.doc('update_amenity', security='Bearer Auth')
     @api.expect(amenity_model)
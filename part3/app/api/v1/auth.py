@@ -1,9 +1,13 @@
 """
 Authentication endpoints.
 """
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token
+from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
 from app.services import shared_facade
+from app.services.login_throttle import login_throttle
+from app.services.token_store import issue_tokens, token_revocations
+from app.utils.passwords import HasherBusyError
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -18,25 +22,82 @@ class Login(Resource):
     
     @api.doc('login')
     @api.expect(login_model)
-    @api.response(200, 'Login successful')
+    @api.response(200, 'Login successful; returns access and refresh tokens')
     @api.response(401, 'Invalid credentials')
+    @api.response(429, 'Too many login attempts')
+    @api.response(503, 'Too many concurrent logins')
     def post(self):
-        """Authenticate user and return JWT token."""
+        """Authenticate user and return an access and a refresh token."""
         data = api.payload
         
+        # Throttle before any lookup or bcrypt work
+        retry_after = login_throttle.check(request.remote_addr, data.get('email'))
+        if retry_after:
+            return ({'error': 'Too many login attempts, please retry later'}, 429,
+                    {'Retry-After': str(retry_after)})
+        
         # Authenticate user
         user = shared_facade.get_user_by_email(data['email'])
         
-        if not user or not user.verify_password(data['password']):
-            return {'error': 'Invalid credentials'}, 401
+        try:
+            if not user or not user.verify_password(data['password']):
+                return {'error': 'Invalid credentials'}, 401
+            
+            # Transparently upgrade hashes made with an older bcrypt cost
+            if user.password_needs_rehash():
+                shared_facade.update_user(user.id, {'password': data['password']})
+        except HasherBusyError:
+            return {'error': 'Server busy, please retry'}, 503, {'Retry-After': '1'}
+        
+        # Access token carries the is_admin claim; refresh starts a session
+        tokens = issue_tokens(user)
+        tokens['user'] = user.to_dict()
+        return tokens, 200
+
+
+@api.route('/refresh')
+class Refresh(Resource):
+    """Refresh-token rotation endpoint."""
+    
+    @api.doc('refresh', security='Bearer Auth')
+    @api.response(200, 'New access and refresh tokens')
+    @api.response(401, 'Refresh token invalid, expired, already used or revoked')
+    @jwt_required(refresh=True)
+    def post(self):
+        """
+        Exchange a refresh token for a new token pair, without a password.
         
-        # Create JWT token with is_admin claim
-        access_token = create_access_token(
-            identity=str(user.id),
-            additional_claims={'is_admin': user.is_admin}  # ← ADD THIS
-        )
+        Each refresh token works once. Reusing one revokes its whole
+        session, since only a copied token can be presented twice, except
+        within the reuse grace, where the pair already issued is returned.
+        """
+        claims = get_jwt()
         
-        return {
-            'access_token': access_token,
-            'user': user.to_dict()
-        }, 200
\ No newline at end of file
+        # The role comes from the user record, so role changes apply here
+        user = shared_facade.get_user(get_jwt_identity())
+        if not user:
+            token_revocations.revoke_family(claims)
+            return {'error': 'User not found'}, 401
+        
+        tokens = issue_tokens(user, family=claims['fam'])
+        if not token_revocations.spend(claims, tokens):
+            reissued = token_revocations.reissued(claims)
+            if reissued is not None:
+                return reissued, 200
+            token_revocations.revoke_family(claims)
+            return {'error': 'Refresh token already used'}, 401
+        return tokens, 200
+
+
+@api.route('/logout')
+class Logout(Resource):
+    """Session revocation endpoint."""
+    
+    @api.doc('logout', security='Bearer Auth')
+    @api.response(200, 'Session revoked')
+    @api.response(401, 'Refresh token invalid, expired or revoked')
+    @jwt_required(refresh=True)
+    def post(self):
+        """Revoke the refresh token's session, including its access tokens."""
+        token_revocations.revoke_family(get_jwt())
+        return {'message': 'Logged out successfully'}, 200
\ No newline at end of file
@@ -1,9 +1,15 @@
 """
 Place API endpoints.
 """
+from flask import current_app, request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services import shared_facade
+from app.utils.batch import batch_create, missing_fields, unknown_fields
+from app.utils.conditional import Validators
+from app.utils.decorators import public_cache
+from app.utils.expand import expanded_dict, expansion_tree, parse_expand
+from app.utils.pagination import PAGINATION_PARAMS, get_page_args, page_response
 
 api = Namespace('places', description='Place operations')
 facade = shared_facade
@@ -20,6 +26,41 @@ place_model = api.model('Place', {
     'updated_at': fields.DateTime(readonly=True)
 })
 
+# Fields a client may set; rating aggregates are kept by the server
+PLACE_FIELDS = ('title', 'description', 'price', 'latitude', 'longitude')
+
+PLACE_FILTER_PARAMS = {
+    'min_price': 'Minimum price per night',
+    'max_price': 'Maximum price per night',
+    'amenities': 'Comma-separated amenity IDs the place must all have',
+    'min_rating': 'Minimum average review rating',
+    'owner_id': 'Owner user ID',
+    'sort': 'price, created_at or rating; prefix with - for descending'
+}
+
+
+def _optional_float(args, name):
+    """Read an optional float query parameter."""
+    value = args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a number')
+
+
+def place_filters(args):
+    """Build the place filter dict from query parameters."""
+    amenities = args.get('amenities', '')
+    return {
+        'min_price': _optional_float(args, 'min_price'),
+        'max_price': _optional_float(args, 'max_price'),
+        'min_rating': _optional_float(args, 'min_rating'),
+        'owner_id': args.get('owner_id') or None,
+        'amenity_ids': [a for a in amenities.split(',') if a]
+    }
+
 
 @api.route('/')
 class PlaceList(Resource):
@@ -53,11 +94,170 @@ class PlaceList(Resource):
         new_place = facade.create_place(place_data)
         return new_place.to_dict(), 201
     
-    @api.doc('list_places')
+    @api.doc('list_places', params=dict(PAGINATION_PARAMS, **PLACE_FILTER_PARAMS))
+    @api.response(400, 'Invalid pagination, filter or sort parameters')
+    @public_cache('places')
+    def get(self):
+        """Get a filtered, sorted page of places (public endpoint)."""
+        try:
+            limit, cursor = get_page_args()
+            filters = place_filters(request.args)
+            sort = request.args.get('sort', 'created_at')
+            validators = Validators.for_collection('places', *facade.get_places_version(filters))
+            not_modified = validators.not_modified()
+            if not_modified:
+                return not_modified
+            places, next_cursor = facade.get_places_page(limit, cursor, filters, sort)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response(places, next_cursor), 200, validators.headers()
+
+
+def _float_arg(name, low, high):
+    """Read a required float query parameter within [low, high]."""
+    try:
+        value = float(request.args[name])
+    except KeyError:
+        raise ValueError(f'{name} is required')
+    except ValueError:
+        raise ValueError(f'{name} must be a number')
+    if not (low <= value <= high):
+        raise ValueError(f'{name} must be between {low} and {high}')
+    return value
+
+
+# Relationships the place detail view may embed with ?expand=
+PLACE_EXPANSIONS = ('owner', 'amenities', 'reviews', 'reviews.author')
+
+
+def _place_error(place_data):
+    """Return a validation error for a new place, or None."""
+    error = (unknown_fields(place_data, PLACE_FIELDS)
+             or missing_fields(place_data, PLACE_FIELDS))
+    if error:
+        return error
+    for name in ('price', 'latitude', 'longitude'):
+        if isinstance(place_data[name], bool) or \
+                not isinstance(place_data[name], (int, float)):
+            return f'{name} must be a number'
+    if place_data['price'] <= 0:
+        return 'Price must be positive'
+    if not (-90 <= place_data['latitude'] <= 90):
+        return 'Invalid latitude'
+    if not (-180 <= place_data['longitude'] <= 180):
+        return 'Invalid longitude'
+    return None
+
+
+@api.route('/batch')
+class PlaceBatch(Resource):
+    """Batch place creation endpoint."""
+    
+    @api.doc('create_places_batch')
+    @api.expect([place_model])
+    @api.response(201, 'All places created')
+    @api.response(207, 'Some places rejected; see per-item results')
+    @api.response(400, 'Invalid batch')
+    @jwt_required()
+    def post(self):
+        """Create many places in one transaction (requires authentication)."""
+        current_user_id = get_jwt_identity()
+        
+        def create_many(items):
+            return facade.create_places(
+                [dict(item, owner_id=current_user_id) for item in items]
+            )
+        
+        return batch_create(api.payload, _place_error, create_many)
+
+
+def _text_search():
+    """Answer ?q= with ranked, paginated full-text matches."""
+    try:
+        limit, cursor = get_page_args()
+        results, next_cursor = facade.search_places_text(
+            request.args['q'], limit, cursor
+        )
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    items = []
+    for place, rank, snippet in results:
+        place_dict = place.to_dict()
+        place_dict['rank'] = rank
+        place_dict['snippet'] = snippet
+        items.append(place_dict)
+    return {'items': items, 'next_cursor': next_cursor}, 200
+
+
+@api.route('/search')
+class PlaceSearch(Resource):
+    """Keyword and radius search endpoint."""
+    
+    @api.doc('search_places', params=dict(PAGINATION_PARAMS, **{
+        'q': 'Keywords to match in title and description (keyword search)',
+        'lat': 'Latitude of the centre (radius search)',
+        'lng': 'Longitude of the centre (radius search)',
+        'radius_km': 'Search radius in kilometres, up to SEARCH_RADIUS_MAX_KM (radius search)'
+    }))
+    @api.response(200, 'Success')
+    @api.response(400, 'Invalid search parameters')
+    @public_cache('places')
+    def get(self):
+        """
+        Search places (public endpoint).
+        
+        With q: keyword matches, best first, with a highlighted snippet
+        and cursor pagination. Otherwise: places within radius_km of
+        lat/lng, nearest first.
+        """
+        if 'q' in request.args:
+            return _text_search()
+        try:
+            lat = _float_arg('lat', -90, 90)
+            lng = _float_arg('lng', -180, 180)
+            radius_km = _float_arg(
+                'radius_km', 0, current_app.config.get('SEARCH_RADIUS_MAX_KM', 500)
+            )
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        
+        limit = current_app.config.get('PAGE_SIZE_MAX', 200)
+        results = facade.search_places_near(lat, lng, radius_km, limit)
+        items = []
+        for place, distance in results:
+            place_dict = place.to_dict()
+            place_dict['distance_km'] = round(distance, 3)
+            items.append(place_dict)
+        return {'items': items}, 200
+
+
+@api.route('/search/bbox')
+class PlaceBoundingBoxSearch(Resource):
+    """Bounding-box search endpoint."""
+    
+    @api.doc('search_places_in_bbox', params={
+        'min_lat': 'Southern edge', 'min_lng': 'Western edge',
+        'max_lat': 'Northern edge',
+        'max_lng': 'Eastern edge; below min_lng when the box crosses the antimeridian'
+    })
+    @api.response(200, 'Success')
+    @api.response(400, 'Invalid search parameters')
     def get(self):
-        """Get all places (public endpoint)."""
-        places = facade.get_all_places()
-        return [p.to_dict() for p in places], 200
+        """Get places inside a bounding box (public endpoint)."""
+        try:
+            min_lat = _float_arg('min_lat', -90, 90)
+            min_lng = _float_arg('min_lng', -180, 180)
+            max_lat = _float_arg('max_lat', -90, 90)
+            max_lng = _float_arg('max_lng', -180, 180)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        
+        if min_lat > max_lat:
+            return {'error': 'min_lat must not exceed max_lat'}, 400
+        
+        limit = current_app.config.get('PAGE_SIZE_MAX', 200)
+        places = facade.search_places_in_bbox(min_lat, min_lng, max_lat, max_lng, limit)
+        return {'items': [p.to_dict() for p in places]}, 200
 
 
 @api.route('/<place_id>')
@@ -65,15 +265,41 @@ class PlaceList(Resource):
 class PlaceResource(Resource):
     """Place resource endpoint."""
     
-    @api.doc('get_place')
+    @api.doc('get_place', params={
+        'expand': 'Comma-separated relationships to embed: ' + ', '.join(PLACE_EXPANSIONS)
+    })
     @api.response(200, 'Success')
+    @api.response(304, 'Not modified')
+    @api.response(400, 'Invalid expand parameter')
     @api.response(404, 'Place not found')
     def get(self, place_id):
-        """Get a place by ID (public endpoint)."""
-        place = facade.get_place(place_id)
+        """Get a place by ID, optionally with related data (public endpoint)."""
+        try:
+            expand = parse_expand(request.args.get('expand'), PLACE_EXPANSIONS)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        
+        if not expand:
+            updated_at = facade.get_entity_version('Place', place_id)
+            if updated_at is None:
+                return {'error': 'Place not found'}, 404
+            not_modified = Validators.for_entity('Place', place_id, updated_at).not_modified()
+            if not_modified:
+                return not_modified
+            
+            place = facade.get_place(place_id)
+            if not place:
+                return {'error': 'Place not found'}, 404
+            validators = Validators.for_entity('Place', place.id, place.updated_at)
+            return place.to_dict(), 200, validators.headers()
+        
+        # Embedded rows have their own versions, so the tag covers the body
+        place = facade.get_place_expanded(place_id, expand)
         if not place:
             return {'error': 'Place not found'}, 404
-        return place.to_dict(), 200
+        data = expanded_dict(place, expansion_tree(expand))
+        validators = Validators.for_body(data)
+        return validators.not_modified() or (data, 200, validators.headers())
     
     @api.doc('update_place')
     @api.expect(place_model)
@@ -95,6 +321,10 @@ class PlaceResource(Resource):
         if place.owner_id != current_user_id:
             return {'error': 'Unauthorized action'}, 403
         
+        unknown = sorted(set(place_data) - set(PLACE_FIELDS))
+        if unknown:
+            return {'error': f'Fields cannot be updated: {", ".join(unknown)}'}, 400
+        
         # Validate price if provided
         if 'price' in place_data and place_data['price'] <= 0:
             return {'error': 'Price must be positive'}, 400
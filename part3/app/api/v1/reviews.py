@@ -3,7 +3,12 @@ Review API endpoints.
 """
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.persistence.review_repository import DuplicateReviewError
 from app.services import shared_facade
+from app.utils.batch import batch_create, missing_fields, unknown_fields
+from app.utils.conditional import Validators
+from app.utils.decorators import public_cache
+from app.utils.pagination import PAGINATION_PARAMS, get_page_args, page_response
 
 api = Namespace('reviews', description='Review operations')
 facade = shared_facade
@@ -25,6 +30,9 @@ review_update_model = api.model('ReviewUpdate', {
     'rating': fields.Integer(description='Rating (1-5)')
 })
 
+# Fields an author may change; a review stays on its place and author
+UPDATABLE_REVIEW_FIELDS = ('text', 'rating')
+
 
 @api.route('/')
 class ReviewList(Resource):
@@ -57,23 +65,76 @@ class ReviewList(Resource):
             return {'error': 'You cannot review your own place'}, 400
         
         # Business rule: Cannot review same place twice
-        existing_reviews = facade.get_reviews_by_place(review_data['place_id'])
-        if not isinstance(existing_reviews, list):
-            existing_reviews = [existing_reviews] if existing_reviews else []
-            
-        for review in existing_reviews:
-            if review.user_id == current_user_id:
-                return {'error': 'You have already reviewed this place'}, 400
-        
-        # Create review
-        new_review = facade.create_review(review_data)
+        if facade.has_reviewed(place.id, current_user_id):
+            return {'error': 'You have already reviewed this place'}, 400
+        
+        # Create review; the unique index catches concurrent duplicates
+        try:
+            new_review = facade.create_review(review_data)
+        except DuplicateReviewError as e:
+            return {'error': str(e)}, 400
         return new_review.to_dict(), 201
     
-    @api.doc('list_reviews')
+    @api.doc('list_reviews', params=PAGINATION_PARAMS)
+    @api.response(400, 'Invalid pagination parameters')
+    @public_cache('reviews')
     def get(self):
-        """Get all reviews (public endpoint)."""
-        reviews = facade.get_all_reviews()
-        return [review.to_dict() for review in reviews], 200
+        """Get a page of reviews (public endpoint)."""
+        validators = Validators.for_collection('reviews', *facade.get_collection_version('Review'))
+        not_modified = validators.not_modified()
+        if not_modified:
+            return not_modified
+        try:
+            limit, cursor = get_page_args()
+            reviews, next_cursor = facade.get_reviews_page(limit, cursor)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response(reviews, next_cursor), 200, validators.headers()
+
+
+REVIEW_FIELDS = ('text', 'rating', 'place_id')
+
+
+@api.route('/batch')
+class ReviewBatch(Resource):
+    """Batch review creation endpoint."""
+    
+    @api.doc('create_reviews_batch')
+    @api.expect([review_model])
+    @api.response(201, 'All reviews created')
+    @api.response(207, 'Some reviews rejected; see per-item results')
+    @api.response(400, 'Invalid batch')
+    @jwt_required()
+    def post(self):
+        """Create many reviews in one transaction (requires authentication)."""
+        current_user_id = get_jwt_identity()
+        seen_places = set()
+        
+        def validate(review_data):
+            error = (unknown_fields(review_data, REVIEW_FIELDS)
+                     or missing_fields(review_data, REVIEW_FIELDS))
+            if error:
+                return error
+            rating = review_data['rating']
+            if isinstance(rating, bool) or not isinstance(rating, int) \
+                    or not (1 <= rating <= 5):
+                return 'Rating must be between 1 and 5'
+            place = facade.get_place(review_data['place_id'])
+            if not place:
+                return 'Place not found'
+            if place.owner_id == current_user_id:
+                return 'You cannot review your own place'
+            if place.id in seen_places or facade.has_reviewed(place.id, current_user_id):
+                return 'You have already reviewed this place'
+            seen_places.add(place.id)
+            return None
+        
+        def create_many(items):
+            return facade.create_reviews(
+                [dict(item, user_id=current_user_id) for item in items]
+            )
+        
+        return batch_create(api.payload, validate, create_many)
 
 
 @api.route('/<review_id>')
@@ -83,13 +144,22 @@ class ReviewResource(Resource):
     
     @api.doc('get_review')
     @api.response(200, 'Success')
+    @api.response(304, 'Not modified')
     @api.response(404, 'Review not found')
     def get(self, review_id):
         """Get a review by ID (public endpoint)."""
+        updated_at = facade.get_entity_version('Review', review_id)
+        if updated_at is None:
+            return {'error': 'Review not found'}, 404
+        not_modified = Validators.for_entity('Review', review_id, updated_at).not_modified()
+        if not_modified:
+            return not_modified
+        
         review = facade.get_review(review_id)
         if not review:
             return {'error': 'Review not found'}, 404
-        return review.to_dict(), 200
+        validators = Validators.for_entity('Review', review.id, review.updated_at)
+        return review.to_dict(), 200, validators.headers()
     
     @api.doc('update_review')
     @api.expect(review_update_model)
@@ -111,6 +181,10 @@ class ReviewResource(Resource):
         if review.user_id != current_user_id:
             return {'error': 'Unauthorized action'}, 403
         
+        unknown = sorted(set(review_data) - set(UPDATABLE_REVIEW_FIELDS))
+        if unknown:
+            return {'error': f'Fields cannot be updated: {", ".join(unknown)}'}, 400
+        
         # Validate rating if provided
         if 'rating' in review_data and not (1 <= review_data['rating'] <= 5):
             return {'error': 'Rating must be between 1 and 5'}, 400
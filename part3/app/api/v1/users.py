@@ -4,6 +4,9 @@ User API endpoints.
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services import shared_facade
+from app.utils.passwords import HasherBusyError
+from app.utils.conditional import Validators
+from app.utils.pagination import PAGINATION_PARAMS, get_page_args, page_response
 
 api = Namespace('users', description='User operations')
 
@@ -37,6 +40,7 @@ class UserList(Resource):
     @api.expect(user_model)
     @api.response(201, 'User created')
     @api.response(400, 'Email already exists')
+    @api.response(503, 'Too many concurrent signups')
     def post(self):
         """Create a new user (public registration endpoint)."""
         user_data = api.payload
@@ -46,16 +50,27 @@ class UserList(Resource):
         if existing_user:
             return {'error': 'Email already registered'}, 400
         
-        new_user = facade.create_user(user_data)
+        try:
+            new_user = facade.create_user(user_data)
+        except HasherBusyError:
+            return {'error': 'Server busy, please retry'}, 503, {'Retry-After': '1'}
         return new_user.to_dict(), 201
     
-    @api.doc('list_users')
-    @api.marshal_list_with(user_model)
+    @api.doc('list_users', params=PAGINATION_PARAMS)
+    @api.response(400, 'Invalid pagination parameters')
     @jwt_required()
     def get(self):
-        """Get all users (requires authentication)."""
-        users = facade.get_all_users()
-        return [user.to_dict() for user in users], 200
+        """Get a page of users (requires authentication)."""
+        validators = Validators.for_collection('users', *facade.get_collection_version('User'))
+        not_modified = validators.not_modified()
+        if not_modified:
+            return not_modified
+        try:
+            limit, cursor = get_page_args()
+            users, next_cursor = facade.get_users_page(limit, cursor)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return page_response(users, next_cursor), 200, validators.headers()
 
 
 @api.route('/<user_id>')
@@ -65,13 +80,22 @@ class UserResource(Resource):
     
     @api.doc('get_user')
     @api.response(200, 'Success')
+    @api.response(304, 'Not modified')
     @api.response(404, 'User not found')
     def get(self, user_id):
         """Get a user by ID (public endpoint)."""
+        updated_at = facade.get_entity_version('User', user_id)
+        if updated_at is None:
+            return {'error': 'User not found'}, 404
+        not_modified = Validators.for_entity('User', user_id, updated_at).not_modified()
+        if not_modified:
+            return not_modified
+        
         user = facade.get_user(user_id)
         if not user:
             return {'error': 'User not found'}, 404
-        return user.to_dict(), 200
+        validators = Validators.for_entity('User', user.id, user.updated_at)
+        return user.to_dict(), 200, validators.headers()
     
     @api.doc('update_user')
     @api.expect(user_update_model)
@@ -0,0 +1,184 @@
+"""
+ASGI entry point serving the public read endpoints natively on asyncio.
+"""
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule
+
+from app import create_app
+from app.services.async_facade import AsyncHBnBFacade
+from app.utils.conditional import Validators
+from app.utils.json_output import dumps
+from app.utils.pagination import page_response, parse_page_args
+
+# GET routes answered on the event loop; the static siblings of the
+# <id> routes are listed so they keep going to Flask
+ROUTES = Map([
+    Rule('/api/v1/places/', endpoint='list_places'),
+    Rule('/api/v1/places/<place_id>', endpoint='get_place'),
+    Rule('/api/v1/places/search', endpoint=None),
+    Rule('/api/v1/places/batch', endpoint=None),
+    Rule('/api/v1/reviews/', endpoint='list_reviews'),
+    Rule('/api/v1/reviews/<review_id>', endpoint='get_review'),
+    Rule('/api/v1/reviews/batch', endpoint=None),
+    Rule('/api/v1/amenities/', endpoint='list_amenities')
+], strict_slashes=True)
+
+
+class AsyncRequest:
+    """The parts of an ASGI HTTP request the native handlers read."""
+
+    def __init__(self, scope):
+        """Decode the query string and headers of an ASGI scope."""
+        self.query_string = scope.get('query_string', b'').decode('utf-8', 'replace')
+        self.args = MultiDict([
+            (name, value)
+            for name, values in parse_qs(self.query_string, keep_blank_values=True).items()
+            for value in values
+        ])
+        self.headers = Headers([
+            (name.decode('latin-1'), value.decode('latin-1'))
+            for name, value in scope.get('headers', [])
+        ])
+
+
+class HBnBAsgiApp:
+    """
+    Serve hot public GETs from AsyncHBnBFacade and everything else from Flask.
+
+    Place, review and amenity lists and place and review details run as
+    coroutines on async repositories, so thousands of idle or slow
+    connections cost no threads. Bodies, errors and ETag/Last-Modified
+    validators match the Flask endpoints. Writes, authenticated routes,
+    ?expand= and search go through the Flask app in asgiref's thread pool.
+    The response cache and query metrics only apply on the Flask side.
+    """
+
+    def __init__(self, flask_app, facade):
+        """Initialize with a configured Flask app and an async facade."""
+        self.flask_app = flask_app
+        self.facade = facade
+        self.config = flask_app.config
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    async def __call__(self, scope, receive, send):
+        """ASGI entry point."""
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+        request = AsyncRequest(scope) if scope['type'] == 'http' else None
+        handler, view_args = self._match(scope, request)
+        if handler is None:
+            return await self.wsgi(scope, receive, send)
+        try:
+            status, body, headers = await handler(request, **view_args)
+        except ValueError as e:
+            status, body, headers = 400, {'error': str(e)}, {}
+        await self._respond(scope, send, request, status, body, headers)
+
+    def _match(self, scope, request):
+        """Return (native handler, view args), or (None, None) for Flask."""
+        if request is None or scope['method'] not in ('GET', 'HEAD'):
+            return None, None
+        try:
+            endpoint, view_args = ROUTES.bind('').match(scope['path'], method='GET')
+        except HTTPException:
+            # No native route, or a trailing-slash redirect Flask will send
+            return None, None
+        if endpoint is None or (endpoint == 'get_place' and request.args.get('expand')):
+            return None, None
+        return getattr(self, endpoint), view_args
+
+    async def _lifespan(self, receive, send):
+        """Dispose of the async engines when the server shuts down."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.facade.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _respond(self, scope, send, request, status, body, headers):
+        """Send a JSON response, or an empty one for 304 and HEAD."""
+        raw_headers = [(b'content-type', b'application/json')]
+        content = b''
+        if status != 304:
+            content = dumps(body)
+            raw_headers.append((b'content-length', str(len(content)).encode()))
+            if scope['method'] == 'HEAD':
+                content = b''
+        if 'Origin' in request.headers:
+            # Same answer flask-cors gives with its default settings
+            raw_headers.append((b'access-control-allow-origin', b'*'))
+        raw_headers.extend(
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in headers.items()
+        )
+        await send({'type': 'http.response.start', 'status': status, 'headers': raw_headers})
+        await send({'type': 'http.response.body', 'body': content})
+
+    async def _list(self, request, kind, version, get_page):
+        """Answer a paginated list with collection validators."""
+        validators = Validators.for_collection(kind, *version, request.query_string)
+        if validators.is_fresh(request.headers):
+            return 304, None, validators.headers()
+        items, next_cursor = await get_page()
+        return 200, page_response(items, next_cursor), validators.headers()
+
+    async def _detail(self, request, model_name, obj_id, get, not_found):
+        """Answer a single entity with its validators."""
+        updated_at = await self.facade.get_entity_version(model_name, obj_id)
+        if updated_at is None:
+            return 404, {'error': not_found}, {}
+        validators = Validators.for_entity(model_name, obj_id, updated_at)
+        if validators.is_fresh(request.headers):
+            return 304, None, validators.headers()
+        obj = await get(obj_id)
+        if obj is None:
+            return 404, {'error': not_found}, {}
+        validators = Validators.for_entity(model_name, obj.id, obj.updated_at)
+        return 200, obj.to_dict(), validators.headers()
+
+    async def list_places(self, request):
+        """GET /api/v1/places/ (see PlaceList.get)."""
+        from app.api.v1.places import place_filters
+        limit, cursor = parse_page_args(request.args, self.config)
+        filters = place_filters(request.args)
+        sort = request.args.get('sort', 'created_at')
+        version = await self.facade.get_places_version(filters)
+        return await self._list(request, 'places', version,
+                                lambda: self.facade.get_places_page(limit, cursor, filters, sort))
+
+    async def get_place(self, request, place_id):
+        """GET /api/v1/places/<place_id> without ?expand= (see PlaceResource.get)."""
+        return await self._detail(request, 'Place', place_id,
+                                  self.facade.get_place, 'Place not found')
+
+    async def list_reviews(self, request):
+        """GET /api/v1/reviews/ (see ReviewList.get)."""
+        version = await self.facade.get_collection_version('Review')
+        limit, cursor = parse_page_args(request.args, self.config)
+        return await self._list(request, 'reviews', version,
+                                lambda: self.facade.get_reviews_page(limit, cursor))
+
+    async def get_review(self, request, review_id):
+        """GET /api/v1/reviews/<review_id> (see ReviewResource.get)."""
+        return await self._detail(request, 'Review', review_id,
+                                  self.facade.get_review, 'Review not found')
+
+    async def list_amenities(self, request):
+        """GET /api/v1/amenities/ (see AmenityList.get)."""
+        version = await self.facade.get_collection_version('Amenity')
+        limit, cursor = parse_page_args(request.args, self.config)
+        return await self._list(request, 'amenities', version,
+                                lambda: self.facade.get_amenities_page(limit, cursor))
+
+
+def create_asgi_app(config_name='development'):
+    """Create the Flask app and wrap it with the async read path."""
+    flask_app = create_app(config_name)
+    return HBnBAsgiApp(flask_app, AsyncHBnBFacade.from_app(flask_app))
@@ -0,0 +1,140 @@
+"""
+Flask CLI commands for HBnB maintenance (run as `flask hbnb <command>`).
+"""
+import click
+from flask.cli import AppGroup
+
+hbnb_cli = AppGroup('hbnb', help='HBnB maintenance commands.')
+
+
+@hbnb_cli.command('init-db')
+def init_database():
+    """Create any missing database tables."""
+    from app.services.bootstrap import SchemaUpgradeError, create_schema
+    try:
+        added = create_schema()
+    except SchemaUpgradeError as e:
+        raise click.ClickException(str(e))
+    click.echo('Database tables created')
+    if added:
+        click.echo(f'Added columns: {", ".join(added)}')
+        click.echo('Run `flask hbnb backfill-geohash` and `flask hbnb recompute-ratings` '
+                   'to fill them')
+
+
+@hbnb_cli.command('seed-admin')
+@click.option('--email', default=None, help='Admin email (default ADMIN_EMAIL).')
+@click.option('--password', default=None, help='Admin password (default ADMIN_PASSWORD).')
+def seed_admin_account(email, password):
+    """Create the admin account if it does not exist yet."""
+    from flask import current_app
+    from app.services.bootstrap import seed_admin
+
+    email = email or current_app.config['ADMIN_EMAIL']
+    _, created = seed_admin(email, password or current_app.config['ADMIN_PASSWORD'])
+    click.echo(f'Admin user {"created" if created else "already exists"}: {email}')
+
+
+@hbnb_cli.command('rebuild-search')
+def rebuild_search():
+    """Create the place full-text index if missing and reindex every place."""
+    from app.services import shared_facade
+    count = shared_facade.rebuild_place_search_index()
+    if count is None:
+        click.echo('FTS5 is not available; keyword search uses LIKE matching')
+    else:
+        click.echo(f'Indexed {count} places for full-text search')
+
+
+@hbnb_cli.command('backfill-geohash')
+@click.option('--batch-size', type=int, default=1000, help='Places updated per transaction.')
+def backfill_geohash(batch_size):
+    """Compute the geohash of places stored without one."""
+    from app.services import shared_facade
+    count = shared_facade.backfill_place_geohashes(batch_size)
+    click.echo(f'Backfilled geohash for {count} places')
+
+
+@hbnb_cli.command('vacuum')
+def vacuum_database():
+    """Compact the SQLite database, then rebuild the place full-text index."""
+    from app.models.db import db
+    from app.services import shared_facade
+
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        click.echo('VACUUM is only run on SQLite databases')
+        return
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.exec_driver_sql('VACUUM')
+    # VACUUM may renumber the rowids places_fts is keyed on
+    count = shared_facade.rebuild_place_search_index()
+    click.echo('Database compacted')
+    if count is not None:
+        click.echo(f'Indexed {count} places for full-text search')
+
+
+@hbnb_cli.command('recompute-ratings')
+def recompute_ratings():
+    """Rebuild place rating aggregates from the reviews table."""
+    from app.services import shared_facade
+    count = shared_facade.recompute_place_ratings()
+    click.echo(f'Recomputed rating aggregates for {count} places')
+
+
+@hbnb_cli.command('import')
+@click.argument('entity', type=click.Choice(['users', 'places', 'reviews', 'amenities']))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']),
+              help='File format; defaults to the file extension.')
+@click.option('--chunk-size', type=int, default=None,
+              help='Rows per transaction (default IMPORT_CHUNK_SIZE).')
+@click.option('--prehashed', is_flag=True,
+              help='User passwords are already bcrypt hashes.')
+def import_data(entity, path, fmt, chunk_size, prehashed):
+    """Bulk-load ENTITY rows from a CSV or NDJSON file at PATH."""
+    import time
+    from flask import current_app
+    from app.persistence.bulk_import import BulkImporter, chunked, read_rows
+
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+    chunk_size = chunk_size or current_app.config.get('IMPORT_CHUNK_SIZE', 5000)
+    importer = BulkImporter(entity, prehashed=prehashed)
+
+    started = time.perf_counter()
+    inserted = rejected = 0
+    for chunk in chunked(read_rows(path, fmt), chunk_size):
+        count, errors = importer.import_chunk(chunk)
+        inserted += count
+        rejected += len(errors)
+        for line_no, error in errors:
+            click.echo(f'line {line_no}: {error}', err=True)
+        rate = (inserted + rejected) / max(time.perf_counter() - started, 1e-9)
+        click.echo(f'{inserted:,} imported, {rejected:,} rejected ({rate:,.0f} rows/sec)')
+    importer.finish()
+
+    from app.services import shared_facade
+    tags = {'places': ('places',), 'reviews': ('reviews', 'places'),
+            'amenities': ('amenities',)}.get(entity, ())
+    shared_facade.response_cache.invalidate(*tags)
+
+    elapsed = time.perf_counter() - started
+    click.echo(f'Imported {inserted:,} {entity} in {elapsed:.1f}s, rejected {rejected:,}')
+
+
+@hbnb_cli.command('sync-replicas')
+@click.option('--interval', type=float, default=None,
+              help='Keep syncing every INTERVAL seconds instead of once.')
+def sync_replicas(interval):
+    """Copy the primary SQLite database onto the replica files (local stand-in)."""
+    import time
+    from app.models.db import db
+    from app.persistence.replication import SQLiteReplicaCopier
+
+    copier = SQLiteReplicaCopier.from_db(db)
+    while True:
+        count = copier.sync()
+        click.echo(f'Synced {count} replicas')
+        if interval is None:
+            return
+        time.sleep(interval)
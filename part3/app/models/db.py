@@ -3,9 +3,49 @@ Database configuration and BaseModel.
 """
 import uuid
 from datetime import datetime
+from operator import attrgetter
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import declared_attr
+from app.persistence.routing import RoutingSession
 
-db = SQLAlchemy()
+# Reads go to replicas when SQLALCHEMY_REPLICA_URIS is set
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def build_serializer(model_class):
+    """
+    Compile a to_dict function for a model class.
+    
+    Column names, datetime columns and excluded fields are worked out once
+    here rather than on every call. Like the original to_dict, None values
+    are omitted.
+    """
+    exclude = set(getattr(model_class, '__serialize_exclude__', ()))
+    names = [c.name for c in model_class.__table__.columns if c.name not in exclude]
+    datetime_names = {
+        c.name for c in model_class.__table__.columns
+        if c.name not in exclude and isinstance(c.type, db.DateTime)
+    }
+    # attrgetter with several names returns a tuple in one C-level call
+    getter = attrgetter(*names) if len(names) > 1 else (lambda obj: (getattr(obj, names[0]),))
+    datetime_flags = [name in datetime_names for name in names]
+    fields = list(zip(names, datetime_flags))
+    
+    def serialize(obj):
+        result = {}
+        for (name, is_datetime), value in zip(fields, getter(obj)):
+            if value is not None:
+                result[name] = value.isoformat() if is_datetime else value
+        return result
+    
+    return serialize
+
+
+def compile_serializers():
+    """Build the serializer of every mapped model up front."""
+    for mapper in db.Model.registry.mappers:
+        if issubclass(mapper.class_, BaseModel):
+            mapper.class_._get_serializer()
 
 
 class BaseModel(db.Model):
@@ -13,11 +53,22 @@ class BaseModel(db.Model):
     
     __abstract__ = True
     
+    # Column names never included in to_dict()
+    __serialize_exclude__ = ()
+    
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, 
                           onupdate=datetime.utcnow)
     
+    @declared_attr
+    def __table_args__(cls):
+        """Composite indexes for keyset pagination and incremental export."""
+        return (
+            db.Index(f'ix_{cls.__tablename__}_created_at_id', 'created_at', 'id'),
+            db.Index(f'ix_{cls.__tablename__}_updated_at_id', 'updated_at', 'id'),
+        )
+    
     def save(self):
         """Save instance to database."""
         db.session.add(self)
@@ -38,14 +89,15 @@ class BaseModel(db.Model):
             db.session.rollback()
             raise e
     
+    @classmethod
+    def _get_serializer(cls):
+        """Return the compiled serializer for this class, building it once."""
+        serializer = cls.__dict__.get('_serializer')
+        if serializer is None:
+            serializer = build_serializer(cls)
+            cls._serializer = serializer
+        return serializer
+    
     def to_dict(self):
         """Convert to dictionary."""
-        result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if value is not None:
-                if isinstance(value, datetime):
-                    result[column.name] = value.isoformat()
-                else:
-                    result[column.name] = value
-        return result
+        return self._get_serializer()(self)
@@ -1,7 +1,9 @@
 """
 Place SQLAlchemy model.
 """
+from sqlalchemy import event
 from app.models.db import db, BaseModel
+from app.utils import geohash
 
 # Association table for Place-Amenity many-to-many
 place_amenities = db.Table('place_amenities',
@@ -17,14 +19,20 @@ class Place(BaseModel):
     
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    price = db.Column(db.Float, nullable=False)
+    price = db.Column(db.Float, nullable=False, index=True)
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
-    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    geohash = db.Column(db.String(geohash.MAX_PRECISION), index=True)
+    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    
+    # Rating aggregates, maintained by ReviewRepository on every review write
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    avg_rating = db.Column(db.Float, nullable=False, default=0.0, index=True)
     
     # Relationships
     reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan')
-    amenities = db.relationship('Amenity', secondary=place_amenities, lazy='subquery',
+    amenities = db.relationship('Amenity', secondary=place_amenities, lazy='select',
                                backref=db.backref('places', lazy=True))
     
     def __init__(self, title, description, price, latitude, longitude, owner_id):
@@ -36,3 +44,66 @@ class Place(BaseModel):
         self.latitude = latitude
         self.longitude = longitude
         self.owner_id = owner_id
+
+
+@event.listens_for(Place, 'before_insert')
+@event.listens_for(Place, 'before_update')
+def _sync_geohash(mapper, connection, target):
+    """Keep the indexed geohash in step with latitude/longitude."""
+    if target.latitude is not None and target.longitude is not None:
+        target.geohash = geohash.encode(target.latitude, target.longitude)
+
+
+# Full-text index over title and description. FTS5 is SQLite-only; other
+# databases (or SQLite builds without FTS5) fall back to LIKE search.
+# Triggers keep the index in step with every write, including Core bulk
+# inserts that skip the ORM. The index is keyed on the implicit rowid of
+# places (its primary key is a string), which a plain VACUUM may renumber;
+# compact with `flask hbnb vacuum`, which rebuilds the index afterwards.
+PLACES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5("
+    "title, description, content='places', content_rowid='rowid')",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN "
+    "INSERT INTO places_fts(rowid, title, description) "
+    "VALUES (new.rowid, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN "
+    "INSERT INTO places_fts(places_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF title, description "
+    "ON places BEGIN "
+    "INSERT INTO places_fts(places_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    "INSERT INTO places_fts(rowid, title, description) "
+    "VALUES (new.rowid, new.title, new.description); END"
+)
+
+
+def fts5_available(connection):
+    """Return True if the connection is SQLite with FTS5 compiled in."""
+    if connection.dialect.name != 'sqlite':
+        return False
+    return bool(connection.exec_driver_sql(
+        "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+    ).scalar())
+
+
+def create_search_index(connection):
+    """Create the FTS5 table and triggers if missing; return True if available."""
+    if not fts5_available(connection):
+        return False
+    for statement in PLACES_FTS_DDL:
+        connection.exec_driver_sql(statement)
+    return True
+
+
+@event.listens_for(Place.__table__, 'after_create')
+def _create_search_index(target, connection, **kw):
+    """Set up full-text search whenever create_all creates places."""
+    create_search_index(connection)
+
+
+@event.listens_for(Place.__table__, 'after_drop')
+def _drop_search_index(target, connection, **kw):
+    """Drop the FTS5 table with places (the triggers go with the table)."""
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql('DROP TABLE IF EXISTS places_fts')
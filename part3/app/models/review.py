@@ -21,3 +21,7 @@ class Review(BaseModel):
         self.rating = rating
         self.place_id = place_id
         self.user_id = user_id
+
+
+# One review per user per place; also serves lookups by place_id
+db.Index('uq_reviews_place_id_user_id', Review.place_id, Review.user_id, unique=True)
@@ -1,14 +1,15 @@
 """
 User SQLAlchemy model.
 """
-import bcrypt
 from app.models.db import db, BaseModel
+from app.utils.passwords import hasher
 
 
 class User(BaseModel):
     """User model with SQLAlchemy ORM."""
 
     __tablename__ = 'users'
+    __serialize_exclude__ = ('password',)
 
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
@@ -42,29 +43,13 @@ class User(BaseModel):
 
     @staticmethod
     def hash_password(password):
-        """Hash password using bcrypt."""
-        return bcrypt.hashpw(
-            password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        """Hash password using bcrypt on the hashing pool."""
+        return hasher.hash(password)
 
     def verify_password(self, password):
-        """Verify password."""
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            self.password.encode('utf-8')
-        )
+        """Verify password on the hashing pool."""
+        return hasher.verify(password, self.password)
 
-    def to_dict(self):
-        """Convert to dict (exclude password)."""
-        user_dict = super().to_dict()
-
-        user_dict['first_name'] = self.first_name
-        user_dict['last_name'] = self.last_name
-        user_dict['email'] = self.email
-        user_dict['is_admin'] = self.is_admin
-
-        # Never include password
-        user_dict.pop('password', None)
-
-        return user_dict
+    def password_needs_rehash(self):
+        """Return True if the stored hash uses an outdated bcrypt cost."""
+        return hasher.needs_rehash(self.password)
@@ -0,0 +1,82 @@
+"""
+Read-only repositories on SQLAlchemy's asyncio extension.
+"""
+from sqlalchemy import func, select
+from app.models.place import Place
+from app.persistence.place_repository import PlaceRepository, place_filter_clauses
+from app.persistence.sqlalchemy_repository import keyset_order, keyset_page
+
+
+class AsyncSQLAlchemyRepository:
+    """
+    Async counterpart of the read side of SQLAlchemyRepository.
+
+    Each call runs in its own AsyncSession from session_factory, a
+    callable returning one; objects come back detached with their columns
+    loaded, ready for to_dict(). The entity cache is not consulted.
+    """
+
+    def __init__(self, model_class, session_factory):
+        """Initialize with a model class and an AsyncSession factory."""
+        self.model_class = model_class
+        self.session_factory = session_factory
+
+    async def get(self, obj_id):
+        """Get object by ID."""
+        async with self.session_factory() as session:
+            return await session.get(self.model_class, obj_id)
+
+    async def get_page(self, limit, cursor=None, statement=None, sort_key=None,
+                       descending=False):
+        """
+        Get one page of objects ordered by (sort_key, id).
+
+        Same contract as SQLAlchemyRepository.get_page, with statement a
+        pre-filtered select() instead of a query.
+        """
+        model = self.model_class
+        if statement is None:
+            statement = select(model)
+        if sort_key is None:
+            sort_key = model.created_at
+        statement, sort_name = keyset_order(statement, model, sort_key, cursor, descending)
+        async with self.session_factory() as session:
+            items = list(await session.scalars(statement.limit(limit + 1)))
+        return keyset_page(items, limit, sort_name, sort_key)
+
+    async def get_version(self, obj_id):
+        """Return an object's updated_at with a primary-key lookup, or None."""
+        model = self.model_class
+        async with self.session_factory() as session:
+            return await session.scalar(
+                select(model.updated_at).where(model.id == obj_id)
+            )
+
+    async def get_collection_version(self, *clauses):
+        """Return (row count, newest updated_at) of the rows matching clauses."""
+        model = self.model_class
+        statement = select(func.count(model.id), func.max(model.updated_at)).where(*clauses)
+        async with self.session_factory() as session:
+            return tuple((await session.execute(statement)).one())
+
+
+class AsyncPlaceRepository(AsyncSQLAlchemyRepository):
+    """Async repository for Place reads."""
+
+    def __init__(self, session_factory):
+        """Initialize AsyncPlaceRepository."""
+        super().__init__(Place, session_factory)
+
+    async def get_filtered_page(self, filters, sort='created_at', limit=50, cursor=None):
+        """Get one page of filtered places in the requested sort order."""
+        sort_key, descending = PlaceRepository.resolve_sort(sort)
+        return await self.get_page(
+            limit, cursor,
+            statement=select(Place).where(*place_filter_clauses(filters)),
+            sort_key=sort_key,
+            descending=descending
+        )
+
+    async def get_filtered_version(self, filters):
+        """Return (row count, newest updated_at) of the filtered places."""
+        return await self.get_collection_version(*place_filter_clauses(filters))
@@ -0,0 +1,307 @@
+"""
+Bulk import of CSV/NDJSON datasets with Core executemany inserts.
+"""
+import csv
+import json
+from itertools import islice
+
+from sqlalchemy import insert, select, tuple_
+from app.models.db import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.utils import geohash
+from app.utils.batch import missing_fields
+from app.utils.passwords import hasher
+
+
+class InvalidRow(ValueError):
+    """A line that could not be read as a row; reported, not imported."""
+
+
+def read_rows(path, fmt):
+    """
+    Yield (line number, row dict) pairs from a CSV or NDJSON file.
+
+    A line that is not valid JSON, or not a JSON object, is yielded with
+    an InvalidRow in place of the row so the import reports it and goes on.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Empty CSV cells mean "not given"
+                yield reader.line_num, {k: v for k, v in row.items() if v != ''}
+        else:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    row = InvalidRow(f'Invalid JSON: {e}')
+                if not isinstance(row, (dict, InvalidRow)):
+                    row = InvalidRow('Row must be a JSON object')
+                yield line_no, row
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _number(row, name, kind=float):
+    """Coerce a numeric field that may arrive as a CSV string."""
+    value = row[name]
+    if isinstance(value, bool):
+        raise ValueError(f'{name} must be a number')
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a number')
+
+
+def _text(row, name):
+    """Return a string field, or None if absent; NDJSON may carry any type."""
+    value = row.get(name)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f'{name} must be a string')
+    return value
+
+
+def _flag(value):
+    """Coerce a boolean field that may arrive as a CSV string."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+
+def _lookup(column, key_column, values):
+    """Map key_column values to column values with one IN query."""
+    if not values:
+        return {}
+    rows = db.session.execute(
+        select(key_column, column).where(key_column.in_(values))
+    )
+    return dict(rows.all())
+
+
+class BulkImporter:
+    """
+    Validate rows in chunks and insert each chunk with one executemany.
+
+    ORM objects, mapper events and per-row commits are skipped: foreign
+    keys and uniqueness are checked with one query per chunk, and each
+    valid chunk is committed on its own. Rejected rows are reported as
+    (line number, error) pairs and do not stop the import.
+    """
+
+    ENTITIES = {
+        'users': User,
+        'places': Place,
+        'reviews': Review,
+        'amenities': Amenity
+    }
+
+    def __init__(self, entity, prehashed=False):
+        """Initialize for one entity; prehashed skips bcrypt for users."""
+        if entity not in self.ENTITIES:
+            raise ValueError(f'Unknown entity: {entity}')
+        self.entity = entity
+        self.model_class = self.ENTITIES[entity]
+        self.prehashed = prehashed
+        # Natural keys seen earlier in the file, to reject in-file duplicates
+        self._seen = set()
+        # Duplicate and foreign-key checks must not read a lagging replica
+        db.session().use_primary()
+
+    def import_chunk(self, chunk):
+        """
+        Validate and insert one chunk of (line number, row) pairs.
+
+        Returns (inserted count, [(line number, error), ...]).
+        """
+        prepare = getattr(self, f'_prepare_{self.entity}')
+        unreadable = [(line_no, str(row)) for line_no, row in chunk
+                      if isinstance(row, InvalidRow)]
+        rows, errors = prepare([(line_no, row) for line_no, row in chunk
+                                if not isinstance(row, InvalidRow)])
+        errors = sorted(unreadable + errors, key=lambda error: error[0])
+        if rows:
+            try:
+                db.session.execute(insert(self.model_class.__table__), rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        return len(rows), errors
+
+    def finish(self):
+        """Run set-based follow-up work once every chunk is in."""
+        if self.entity == 'reviews':
+            from app.persistence.repository_factory import RepositoryFactory
+            RepositoryFactory.get_repository('Place').recompute_rating_aggregates()
+
+    def _validate(self, chunk, required, convert):
+        """Apply convert to every row with its required fields present."""
+        valid, errors = [], []
+        for line_no, row in chunk:
+            error = missing_fields(row, required)
+            if not error:
+                try:
+                    valid.append((line_no, convert(row)))
+                    continue
+                except ValueError as e:
+                    error = str(e)
+            errors.append((line_no, error))
+        return valid, errors
+
+    def _keep_new(self, valid, errors, key, existing, message):
+        """Drop rows whose key is already stored or earlier in the file."""
+        kept = []
+        for line_no, row in valid:
+            row_key = key(row)
+            if row_key in existing or row_key in self._seen:
+                errors.append((line_no, message))
+            else:
+                self._seen.add(row_key)
+                kept.append(row)
+        return kept
+
+    def _prepare_users(self, chunk):
+        """Validate users, reject taken emails and hash passwords."""
+        def convert(row):
+            password = _text(row, 'password')
+            if self.prehashed and not password.startswith('$2'):
+                raise ValueError('password is not a bcrypt hash')
+            return {
+                'first_name': _text(row, 'first_name'),
+                'last_name': _text(row, 'last_name'),
+                'email': _text(row, 'email').strip().lower(),
+                'password': password,
+                'is_admin': _flag(row.get('is_admin', False))
+            }
+
+        valid, errors = self._validate(
+            chunk, ('first_name', 'last_name', 'email', 'password'), convert
+        )
+        existing = _lookup(User.id, User.email, [row['email'] for _, row in valid])
+        rows = self._keep_new(valid, errors, lambda row: row['email'], existing,
+                              'Email already registered')
+        if rows and not self.prehashed:
+            hashes = hasher.hash_many([row['password'] for row in rows])
+            for row, hashed in zip(rows, hashes):
+                row['password'] = hashed
+        return rows, errors
+
+    def _prepare_places(self, chunk):
+        """Validate places and resolve owners by id or email."""
+        def convert(row):
+            if row.get('owner_id') is None and row.get('owner_email') is None:
+                raise ValueError('Missing fields: owner_id or owner_email')
+            place = {
+                'title': _text(row, 'title'),
+                'description': _text(row, 'description'),
+                'price': _number(row, 'price'),
+                'latitude': _number(row, 'latitude'),
+                'longitude': _number(row, 'longitude'),
+                'owner_id': _text(row, 'owner_id'),
+                'owner_email': _text(row, 'owner_email')
+            }
+            if place['price'] <= 0:
+                raise ValueError('Price must be positive')
+            if not (-90 <= place['latitude'] <= 90):
+                raise ValueError('Invalid latitude')
+            if not (-180 <= place['longitude'] <= 180):
+                raise ValueError('Invalid longitude')
+            # Mapper events do not run for Core inserts
+            place['geohash'] = geohash.encode(place['latitude'], place['longitude'])
+            return place
+
+        valid, errors = self._validate(
+            chunk, ('title', 'description', 'price', 'latitude', 'longitude'), convert
+        )
+        owner_ids = _lookup(User.id, User.id,
+                            [row['owner_id'] for _, row in valid if row['owner_id']])
+        owners_by_email = _lookup(User.id, User.email, [
+            row['owner_email'].lower() for _, row in valid if row['owner_email']
+        ])
+        rows = []
+        for line_no, row in valid:
+            email = row.pop('owner_email')
+            owner_id = owner_ids.get(row['owner_id']) if row['owner_id'] \
+                else owners_by_email.get(email.lower())
+            if owner_id is None:
+                errors.append((line_no, 'Owner not found'))
+            else:
+                row['owner_id'] = owner_id
+                rows.append(row)
+        return rows, errors
+
+    def _prepare_reviews(self, chunk):
+        """Validate reviews and resolve places and authors in batches."""
+        def convert(row):
+            if row.get('user_id') is None and row.get('user_email') is None:
+                raise ValueError('Missing fields: user_id or user_email')
+            review = {
+                'text': _text(row, 'text'),
+                'rating': _number(row, 'rating', int),
+                'place_id': _text(row, 'place_id'),
+                'user_id': _text(row, 'user_id'),
+                'user_email': _text(row, 'user_email')
+            }
+            if not (1 <= review['rating'] <= 5):
+                raise ValueError('Rating must be between 1 and 5')
+            return review
+
+        valid, errors = self._validate(chunk, ('text', 'rating', 'place_id'), convert)
+        place_owners = _lookup(Place.owner_id, Place.id,
+                               [row['place_id'] for _, row in valid])
+        user_ids = _lookup(User.id, User.id,
+                           [row['user_id'] for _, row in valid if row['user_id']])
+        users_by_email = _lookup(User.id, User.email, [
+            row['user_email'].lower() for _, row in valid if row['user_email']
+        ])
+
+        resolved = []
+        for line_no, row in valid:
+            email = row.pop('user_email')
+            user_id = user_ids.get(row['user_id']) if row['user_id'] \
+                else users_by_email.get(email.lower())
+            if row['place_id'] not in place_owners:
+                errors.append((line_no, 'Place not found'))
+            elif user_id is None:
+                errors.append((line_no, 'User not found'))
+            elif place_owners[row['place_id']] == user_id:
+                errors.append((line_no, 'You cannot review your own place'))
+            else:
+                row['user_id'] = user_id
+                resolved.append((line_no, row))
+
+        pairs = [(row['place_id'], row['user_id']) for _, row in resolved]
+        existing = set()
+        if pairs:
+            existing = set(db.session.execute(
+                select(Review.place_id, Review.user_id)
+                .where(tuple_(Review.place_id, Review.user_id).in_(pairs))
+            ).all())
+        rows = self._keep_new(
+            resolved, errors, lambda row: (row['place_id'], row['user_id']),
+            existing, 'You have already reviewed this place'
+        )
+        return rows, errors
+
+    def _prepare_amenities(self, chunk):
+        """Validate amenities and reject names already taken."""
+        valid, errors = self._validate(chunk, ('name',),
+                                       lambda row: {'name': _text(row, 'name')})
+        existing = _lookup(Amenity.id, Amenity.name, [row['name'] for _, row in valid])
+        rows = self._keep_new(valid, errors, lambda row: row['name'], existing,
+                              'Amenity already exists')
+        return rows, errors
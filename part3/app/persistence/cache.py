@@ -0,0 +1,290 @@
+"""
+Read-through entity cache used by the repositories.
+"""
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.db import db
+from app.utils.json_output import dumps, loads
+
+
+class LRUCache:
+    """In-process LRU cache whose entries expire after ttl seconds."""
+
+    name = 'memory'
+
+    def __init__(self, max_size=10000, ttl=60):
+        """Initialize with a size bound and entry lifetime."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a live value or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove every value."""
+        with self._lock:
+            self._data.clear()
+
+
+class LocalSharedStore:
+    """
+    In-process stand-in for a shared cache server such as Redis.
+
+    Implements the subset of the redis-py client API the shared backend
+    uses, storing bytes just as a network cache would. Other processes
+    never see its contents.
+    """
+
+    cross_process = False
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return stored bytes or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, ex=None, nx=False):
+        """
+        Store bytes, expiring after ex seconds if given.
+
+        With nx, only store if the key is absent; returns None if it was not.
+        """
+        now = time.monotonic()
+        expires_at = now + ex if ex else None
+        with self._lock:
+            if nx:
+                entry = self._data.get(key)
+                if entry is not None and (entry[1] is None or entry[1] >= now):
+                    return None
+            self._data[key] = (value, expires_at)
+        return True
+
+    def delete(self, *keys):
+        """Delete keys and return how many existed."""
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match='*'):
+        """Iterate over keys matching a glob pattern."""
+        with self._lock:
+            keys = list(self._data)
+        return iter([key for key in keys if fnmatch.fnmatchcase(key, match)])
+
+
+class SharedCacheBackend:
+    """
+    Cache backend on a shared, Redis-compatible client.
+
+    Values are stored as JSON, never pickled: another process able to
+    write to the store must not be able to run code in this one.
+    """
+
+    name = 'shared'
+
+    def __init__(self, client, ttl=60, prefix='hbnb:entity:'):
+        """Initialize with a client exposing get/set/delete/scan_iter."""
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        """Return a cached value or None."""
+        raw = self.client.get(self.prefix + key)
+        return loads(raw) if raw is not None else None
+
+    def set(self, key, value):
+        """Store a value with the backend TTL."""
+        self.client.set(self.prefix + key, dumps(value), ex=self.ttl)
+
+    def delete(self, key):
+        """Remove a value if present."""
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        """Remove every value under this backend's prefix."""
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+class EntityCache:
+    """
+    Cache the column values of entities by model and primary key.
+
+    Values rather than ORM instances are cached, so any backend can hold
+    them; a hit is rebuilt and merged into the current session without
+    emitting SQL. Repositories invalidate entries on every write.
+
+    Entries are the entity's to_dict() output, so fields in
+    __serialize_exclude__ (password hashes) never reach the backend;
+    on a hit they stay unloaded and are read from the database if used.
+    """
+
+    def __init__(self, backend=None):
+        """Initialize with a backend, or None to disable caching."""
+        self.configure(backend)
+
+    def configure(self, backend):
+        """Swap the backend and reset the counters."""
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(model_class, obj_id):
+        """Build the cache key for an entity."""
+        return f'{model_class.__name__}:{obj_id}'
+
+    def _count(self, hit):
+        """Update the hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, model_class, obj_id):
+        """Return a session-bound instance from the cache, or None."""
+        if self.backend is None:
+            return None
+        values = self.backend.get(self._key(model_class, obj_id))
+        self._count(values is not None)
+        if values is None:
+            return None
+
+        obj = sa_inspect(model_class).class_manager.new_instance()
+        for key, is_datetime in self._columns(model_class):
+            value = values.get(key)
+            if is_datetime and value is not None:
+                value = datetime.fromisoformat(value)
+            set_committed_value(obj, key, value)
+        make_transient_to_detached(obj)
+        return db.session.merge(obj, load=False)
+
+    @staticmethod
+    def _columns(model_class):
+        """Return (key, is_datetime) for the cached columns of a model."""
+        columns = model_class.__dict__.get('_cache_columns')
+        if columns is None:
+            exclude = set(model_class.__serialize_exclude__)
+            columns = [
+                (attr.key, isinstance(attr.columns[0].type, db.DateTime))
+                for attr in sa_inspect(model_class).column_attrs
+                if attr.key not in exclude
+            ]
+            model_class._cache_columns = columns
+        return columns
+
+    def set(self, obj):
+        """Store the serialized column values of obj."""
+        if self.backend is None:
+            return
+        values = obj.to_dict()
+        self.backend.set(self._key(type(obj), values['id']), values)
+
+    def invalidate(self, model_class, obj_id):
+        """Drop one entity from the cache."""
+        if self.backend is not None:
+            self.backend.delete(self._key(model_class, obj_id))
+
+    def clear(self):
+        """Drop every cached entity."""
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self):
+        """Return hit/miss counters."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'backend': self.backend.name if self.backend else None,
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else 0.0
+        }
+
+
+def create_backend(name, ttl=60, max_size=10000, client=None, prefix='hbnb:entity:'):
+    """Build the cache backend named in the configuration."""
+    if not name:
+        return None
+    if name == 'memory':
+        return LRUCache(max_size=max_size, ttl=ttl)
+    if name == 'shared':
+        return SharedCacheBackend(client or LocalSharedStore(), ttl=ttl, prefix=prefix)
+    raise ValueError(f'Unknown cache backend: {name}')
+
+
+entity_cache = EntityCache()
+
+# Rows deleted by an ORM cascade (a user's places and reviews, a place's
+# reviews) never pass through their own repository, so the session
+# collects every deleted entity and evicts them once the delete commits.
+_DELETED_KEY = 'hbnb_cache_deleted'
+
+
+@event.listens_for(Session, 'persistent_to_deleted')
+def _collect_deleted(session, obj):
+    """Remember an entity deleted in this session's transaction."""
+    session.info.setdefault(_DELETED_KEY, []).append(
+        (type(obj), sa_inspect(obj).identity[0])
+    )
+
+
+@event.listens_for(Session, 'after_commit')
+def _evict_deleted(session):
+    """Evict the entities deleted by the committed transaction."""
+    for model_class, obj_id in session.info.pop(_DELETED_KEY, ()):
+        entity_cache.invalidate(model_class, obj_id)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _forget_deleted(session, previous_transaction):
+    """Rolled-back deletes leave the cache as it was."""
+    session.info.pop(_DELETED_KEY, None)
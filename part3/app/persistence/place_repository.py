@@ -0,0 +1,306 @@
+"""
+Place-specific repository.
+"""
+import math
+import re
+from sqlalchemy import and_, case, column, func, literal_column, or_, select, table, update
+from app.models.db import db
+from app.models.amenity import Amenity
+from app.models.place import Place, create_search_index, fts5_available
+from app.models.review import Review
+from app.persistence.cache import entity_cache
+from app.persistence.sqlalchemy_repository import (
+    SQLAlchemyRepository, decode_cursor, encode_cursor
+)
+from app.utils import geohash
+
+# Full-text search: FTS5 table, title weighted above description in bm25
+_places_fts = table('places_fts', column('rowid'))
+_fts = literal_column('places_fts')
+_fts_rank = func.bm25(_fts, 10.0, 1.0)
+SNIPPET_MARK = '**'
+SNIPPET_WORDS = 12
+
+
+def search_terms(text):
+    """Split a search string into lowercase word terms."""
+    terms = re.findall(r'\w+', (text or '').lower())
+    if not terms:
+        raise ValueError('q must contain at least one word')
+    return terms
+
+
+def _like_snippet(place, terms):
+    """Excerpt around the first matching term, marked like FTS5 snippets."""
+    for text in (place.description or '', place.title or ''):
+        lowered = text.lower()
+        for term in terms:
+            index = lowered.find(term)
+            if index >= 0:
+                start = max(0, index - 40)
+                end = min(len(text), index + len(term) + 40)
+                return (('…' if start else '') + text[start:index]
+                        + SNIPPET_MARK + text[index:index + len(term)] + SNIPPET_MARK
+                        + text[index + len(term):end] + ('…' if end < len(text) else ''))
+    return ''
+
+
+def place_filter_clauses(filters):
+    """
+    Compile a filter dict into WHERE clauses on Place.
+    
+    Supported keys: min_price, max_price, owner_id, min_rating and
+    amenity_ids (places must have every listed amenity).
+    """
+    clauses = []
+    if filters.get('min_price') is not None:
+        clauses.append(Place.price >= filters['min_price'])
+    if filters.get('max_price') is not None:
+        clauses.append(Place.price <= filters['max_price'])
+    if filters.get('owner_id'):
+        clauses.append(Place.owner_id == filters['owner_id'])
+    if filters.get('min_rating') is not None:
+        clauses.append(Place.avg_rating >= filters['min_rating'])
+    for amenity_id in filters.get('amenity_ids') or []:
+        clauses.append(Place.amenities.any(Amenity.id == amenity_id))
+    return clauses
+
+
+class PlaceRepository(SQLAlchemyRepository):
+    """Repository for Place operations."""
+    
+    # Sort names accepted by get_filtered_page ('-' prefix for descending)
+    SORT_KEYS = {
+        'created_at': Place.created_at,
+        'price': Place.price,
+        'rating': Place.avg_rating
+    }
+    
+    def __init__(self):
+        """Initialize PlaceRepository."""
+        super().__init__(Place, cache=entity_cache)
+        # Engines known to have the FTS5 index (only positives are cached)
+        self._fts_engines = set()
+    
+    @classmethod
+    def resolve_sort(cls, sort):
+        """Map a sort name such as '-price' to (sort key, descending)."""
+        sort_name = sort.lstrip('-')
+        if sort_name not in cls.SORT_KEYS:
+            raise ValueError(f'Unknown sort: {sort_name}')
+        return cls.SORT_KEYS[sort_name], sort.startswith('-')
+    
+    def build_filtered_query(self, filters):
+        """Compile a filter dict (see place_filter_clauses) into a single query."""
+        return Place.query.filter(*place_filter_clauses(filters))
+    
+    def get_filtered_page(self, filters, sort='created_at', limit=50, cursor=None):
+        """Get one page of filtered places in the requested sort order."""
+        sort_key, descending = self.resolve_sort(sort)
+        return self.get_page(
+            limit, cursor,
+            query=self.build_filtered_query(filters),
+            sort_key=sort_key,
+            descending=descending
+        )
+    
+    def _bbox_query(self, min_lat, min_lng, max_lat, max_lng):
+        """
+        Query places inside a bounding box.
+        
+        The geohash index narrows the scan to the cells covering the box;
+        the exact latitude/longitude test then drops rows at the edges. A
+        box with min_lng > max_lng crosses the antimeridian.
+        """
+        boxes = []
+        for box in geohash.split_bbox(min_lat, min_lng, max_lat, max_lng):
+            # Prefix match written as a range so the index is used
+            cells = [
+                and_(Place.geohash >= prefix, Place.geohash < prefix + '~')
+                for prefix in geohash.covering_prefixes(*box)
+            ]
+            boxes.append(and_(
+                or_(*cells),
+                Place.latitude.between(box[0], box[2]),
+                Place.longitude.between(box[1], box[3])
+            ))
+        return Place.query.filter(or_(*boxes))
+    
+    def get_in_bbox(self, min_lat, min_lng, max_lat, max_lng, limit=None):
+        """Get places inside a bounding box."""
+        query = self._bbox_query(min_lat, min_lng, max_lat, max_lng)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+    
+    # Candidates fetched per result wanted, absorbing the difference
+    # between the flat-earth ordering in SQL and great-circle distance
+    RADIUS_OVERFETCH = 2
+    
+    def get_within_radius(self, latitude, longitude, radius_km, limit=None):
+        """
+        Get (place, distance_km) pairs within radius_km, nearest first.
+        
+        SQL orders the places in the bounding box by squared degree
+        distance, longitude scaled by cos(latitude), and returns a bounded
+        set of candidates; great-circle distance then filters and orders
+        them in Python.
+        """
+        bbox = geohash.radius_bbox(latitude, longitude, radius_km)
+        query = self._bbox_query(*bbox)
+        if limit is not None:
+            dlat = Place.latitude - latitude
+            raw_dlng = Place.longitude - longitude
+            # Measure longitude the short way round the antimeridian
+            dlng = case(
+                (raw_dlng > 180, raw_dlng - 360),
+                (raw_dlng < -180, raw_dlng + 360),
+                else_=raw_dlng
+            ) * math.cos(math.radians(latitude))
+            query = query.order_by(dlat * dlat + dlng * dlng).limit(
+                limit * self.RADIUS_OVERFETCH
+            )
+        results = []
+        for place in query.all():
+            distance = geohash.haversine_km(
+                latitude, longitude, place.latitude, place.longitude
+            )
+            if distance <= radius_km:
+                results.append((place, distance))
+        results.sort(key=lambda pair: pair[1])
+        return results[:limit] if limit is not None else results
+    
+    def _has_search_index(self):
+        """Return True if the session's database has the FTS5 index."""
+        connection = db.session.connection()
+        if connection.engine in self._fts_engines:
+            return True
+        available = fts5_available(connection) and connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = 'places_fts'"
+        ).scalar() is not None
+        if available:
+            self._fts_engines.add(connection.engine)
+        return available
+    
+    def search_text(self, text, limit, cursor=None):
+        """
+        Full-text search over title and description.
+        
+        Returns ([(place, rank, snippet), ...], next_cursor), best match
+        first. Uses the FTS5 index with bm25 ranking, with the last term
+        matched as a prefix; without FTS5 it falls back to LIKE filters in
+        creation order, with rank None.
+        """
+        terms = search_terms(text)
+        if not self._has_search_index():
+            return self._search_like(terms, limit, cursor)
+        
+        match = ' '.join(f'"{term}"' for term in terms) + '*'
+        snippet = func.snippet(_fts, -1, SNIPPET_MARK, SNIPPET_MARK, '…', SNIPPET_WORDS)
+        statement = (
+            select(Place, _fts_rank.label('rank'), snippet.label('snippet'))
+            .join(_places_fts, _places_fts.c.rowid == literal_column('places.rowid'))
+            .where(_fts.op('MATCH')(match))
+        )
+        if cursor:
+            value, obj_id = decode_cursor(cursor, 'rank')
+            statement = statement.where(or_(
+                _fts_rank > value,
+                and_(_fts_rank == value, Place.id > obj_id)
+            ))
+        rows = db.session.execute(
+            statement.order_by(_fts_rank, Place.id).limit(limit + 1)
+        ).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor('rank', last.rank, last.Place.id)
+        return [(row.Place, row.rank, row.snippet) for row in rows], next_cursor
+    
+    def _search_like(self, terms, limit, cursor):
+        """LIKE-based search for databases without FTS5."""
+        query = Place.query
+        for term in terms:
+            # Terms are word characters, so only _ needs escaping
+            pattern = '%' + term.replace('_', '\\_') + '%'
+            query = query.filter(or_(
+                Place.title.ilike(pattern, escape='\\'),
+                Place.description.ilike(pattern, escape='\\')
+            ))
+        places, next_cursor = self.get_page(limit, cursor, query=query)
+        return [(place, None, _like_snippet(place, terms)) for place in places], next_cursor
+    
+    def rebuild_search_index(self):
+        """
+        Create the FTS5 index if missing and rebuild it from places.
+        
+        Returns the number of places indexed, or None without FTS5.
+        """
+        session = db.session()
+        session.use_primary()
+        connection = session.connection()
+        if not create_search_index(connection):
+            return None
+        connection.exec_driver_sql("INSERT INTO places_fts(places_fts) VALUES ('rebuild')")
+        session.commit()
+        return self.count()
+    
+    def backfill_geohashes(self, batch_size=1000):
+        """
+        Compute the geohash of places stored without one.
+        
+        Places created before the geohash column existed are invisible to
+        bbox and radius search until this runs. Works in batches of
+        batch_size, one transaction each; returns the number of places
+        updated.
+        """
+        session = db.session()
+        session.use_primary()
+        statement = (
+            select(Place.id, Place.latitude, Place.longitude)
+            .where(Place.geohash.is_(None))
+            .limit(batch_size)
+        )
+        count = 0
+        while True:
+            rows = session.execute(statement).all()
+            if not rows:
+                break
+            session.execute(update(Place), [
+                {'id': row.id, 'geohash': geohash.encode(row.latitude, row.longitude)}
+                for row in rows
+            ])
+            session.commit()
+            count += len(rows)
+        if count and self.cache is not None:
+            self.cache.clear()
+        return count
+    
+    def recompute_rating_aggregates(self):
+        """
+        Rebuild review_count, rating_sum and avg_rating for every place.
+        
+        Runs as one set-based UPDATE; returns the number of places touched.
+        """
+        def for_place(expr):
+            return (
+                select(expr)
+                .where(Review.place_id == Place.id)
+                .scalar_subquery()
+            )
+        
+        result = db.session.execute(
+            update(Place)
+            .values(
+                review_count=for_place(func.count(Review.id)),
+                rating_sum=for_place(func.coalesce(func.sum(Review.rating), 0)),
+                avg_rating=for_place(func.coalesce(func.avg(Review.rating), 0.0))
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        if self.cache is not None:
+            self.cache.clear()
+        return result.rowcount
@@ -0,0 +1,46 @@
+"""
+Stand-in replication for local testing with SQLite replicas.
+"""
+import sqlite3
+
+from app.persistence.routing import replica_engines
+
+
+class SQLiteReplicaCopier:
+    """
+    Copy the primary SQLite database onto each replica file.
+    
+    Uses SQLite's online backup API, so the primary can keep serving
+    while a consistent snapshot is taken. Replicas lag by however long
+    it has been since the last sync, much as a real asynchronous replica
+    would.
+    """
+    
+    def __init__(self, primary_path, replica_paths):
+        """Initialize with the primary file and the replica files."""
+        self.primary_path = primary_path
+        self.replica_paths = list(replica_paths)
+    
+    @classmethod
+    def from_db(cls, db):
+        """Build a copier from the current app's primary and replica engines."""
+        def path(engine):
+            if engine.dialect.name != 'sqlite' or not engine.url.database:
+                raise ValueError(f'Not a SQLite file database: {engine.url}')
+            return engine.url.database
+        
+        return cls(path(db.engine), [path(e) for e in replica_engines(db)])
+    
+    def sync(self):
+        """Copy the primary onto every replica; return the replica count."""
+        source = sqlite3.connect(self.primary_path)
+        try:
+            for replica_path in self.replica_paths:
+                target = sqlite3.connect(replica_path)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+        finally:
+            source.close()
+        return len(self.replica_paths)
@@ -1,7 +1,10 @@
 """
 Repository factory.
 """
+from app.persistence.cache import entity_cache
 from app.persistence.sqlalchemy_repository import SQLAlchemyRepository
+from app.persistence.place_repository import PlaceRepository
+from app.persistence.review_repository import ReviewRepository
 from app.models.user import User
 from app.models.place import Place
 from app.models.review import Review
@@ -13,13 +16,28 @@ class RepositoryFactory:
     
     _repositories = {}
     
+    # Models with a specialised repository
+    _repository_classes = {
+        'Place': PlaceRepository,
+        'Review': ReviewRepository
+    }
+    
+    # Generic repositories that read through the entity cache
+    _cached_models = {'Amenity'}
+    
     @classmethod
     def get_repository(cls, model_name: str):
         """Get repository for model."""
         if model_name not in cls._repositories:
-            model_class = cls._get_model_class(model_name)
-            if model_class:
-                cls._repositories[model_name] = SQLAlchemyRepository(model_class)
+            if model_name in cls._repository_classes:
+                cls._repositories[model_name] = cls._repository_classes[model_name]()
+            else:
+                model_class = cls._get_model_class(model_name)
+                if model_class:
+                    cache = entity_cache if model_name in cls._cached_models else None
+                    cls._repositories[model_name] = SQLAlchemyRepository(
+                        model_class, cache=cache
+                    )
         return cls._repositories.get(model_name)
     
     @staticmethod
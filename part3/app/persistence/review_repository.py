@@ -0,0 +1,154 @@
+"""
+Review-specific repository.
+"""
+from sqlalchemy import Float, case, cast, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from app.models.db import db
+from app.models.place import Place
+from app.models.review import Review
+from app.persistence.cache import entity_cache
+from app.persistence.sqlalchemy_repository import SQLAlchemyRepository
+
+
+class DuplicateReviewError(ValueError):
+    """Raised when a user reviews the same place twice."""
+
+
+def apply_rating_delta(place_id, count_delta, sum_delta):
+    """Shift a place's rating aggregates without loading it."""
+    new_count = Place.review_count + count_delta
+    new_sum = Place.rating_sum + sum_delta
+    db.session.execute(
+        update(Place)
+        .where(Place.id == place_id)
+        .values(
+            review_count=new_count,
+            rating_sum=new_sum,
+            avg_rating=case(
+                (new_count > 0, cast(new_sum, Float) / new_count),
+                else_=0.0
+            )
+        )
+    )
+
+
+def remove_user_ratings(user_id):
+    """
+    Take a user's reviews out of the aggregates of the places they rated.
+    
+    Run before deleting the user: the ORM cascade removes the reviews
+    without going through ReviewRepository. Returns the place ids changed.
+    """
+    rows = db.session.execute(
+        select(Review.place_id, func.count(Review.id), func.sum(Review.rating))
+        .where(Review.user_id == user_id)
+        .group_by(Review.place_id)
+    ).all()
+    for place_id, count, total in rows:
+        apply_rating_delta(place_id, -count, -total)
+    return [row[0] for row in rows]
+
+
+class ReviewRepository(SQLAlchemyRepository):
+    """
+    Repository for Review operations.
+    
+    Every write also adjusts the review_count, rating_sum and avg_rating
+    columns of the reviewed place inside the same transaction, then drops
+    that place from the entity cache.
+    """
+    
+    def __init__(self):
+        """Initialize ReviewRepository."""
+        super().__init__(Review)
+    
+    def _apply_rating_delta(self, place_id, count_delta, sum_delta):
+        """Shift a place's rating aggregates without loading it."""
+        apply_rating_delta(place_id, count_delta, sum_delta)
+    
+    def _commit(self):
+        """Commit the current transaction, rolling back on failure."""
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    
+    def exists_for(self, place_id, user_id):
+        """Return True if user_id has reviewed place_id (one index probe)."""
+        return db.session.query(
+            exists().where(Review.place_id == place_id, Review.user_id == user_id)
+        ).scalar()
+    
+    def add(self, review):
+        """
+        Add a review and count it towards its place's rating.
+        
+        A concurrent duplicate trips the (place_id, user_id) unique index;
+        it is rolled back and reported as DuplicateReviewError.
+        """
+        place_id, user_id = review.place_id, review.user_id
+        db.session.add(review)
+        try:
+            self._apply_rating_delta(place_id, 1, review.rating)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            if self.exists_for(place_id, user_id):
+                raise DuplicateReviewError('You have already reviewed this place')
+            raise
+        except Exception:
+            db.session.rollback()
+            raise
+        entity_cache.invalidate(Place, place_id)
+        return review
+    
+    def _before_commit_many(self, reviews):
+        """Apply one aggregate UPDATE per reviewed place."""
+        deltas = {}
+        for review in reviews:
+            count, total = deltas.get(review.place_id, (0, 0))
+            deltas[review.place_id] = (count + 1, total + review.rating)
+        for place_id, (count, total) in deltas.items():
+            self._apply_rating_delta(place_id, count, total)
+    
+    def add_many(self, reviews, chunk_size=500):
+        """Add many reviews in one transaction, keeping place ratings in step."""
+        place_ids = {review.place_id for review in reviews}
+        super().add_many(reviews, chunk_size)
+        for place_id in place_ids:
+            entity_cache.invalidate(Place, place_id)
+        return reviews
+    
+    # Moving a review would need both places' aggregates adjusted
+    UPDATABLE_FIELDS = ('text', 'rating')
+    
+    def update(self, review_id, data):
+        """Update a review's text or rating, adjusting the place rating."""
+        review = self.get(review_id)
+        if review:
+            old_rating = review.rating
+            for key, value in data.items():
+                if key in self.UPDATABLE_FIELDS:
+                    setattr(review, key, value)
+            rating_changed = review.rating != old_rating
+            if rating_changed:
+                self._apply_rating_delta(
+                    review.place_id, 0, review.rating - old_rating
+                )
+            self._commit()
+            if rating_changed:
+                entity_cache.invalidate(Place, review.place_id)
+        return review
+    
+    def delete(self, review_id):
+        """Delete a review and remove it from its place's rating."""
+        review = self.get(review_id)
+        if review:
+            place_id = review.place_id
+            self._apply_rating_delta(place_id, -1, -review.rating)
+            db.session.delete(review)
+            self._commit()
+            entity_cache.invalidate(Place, place_id)
+            return True
+        return False
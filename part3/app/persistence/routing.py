@@ -0,0 +1,80 @@
+"""
+Session that routes reads to replica engines and writes to the primary.
+"""
+import random
+
+import sqlalchemy as sa
+from flask_sqlalchemy.session import Session
+
+# Replica engines are registered as SQLALCHEMY_BINDS under these keys
+REPLICA_BIND_PREFIX = 'replica_'
+
+
+def init_db(app, db):
+    """
+    Initialize db for the app with SQLALCHEMY_REPLICA_URIS as replica binds.
+    
+    Flask-SQLAlchemy creates an empty MetaData for every bind; replicas
+    hold copies of the primary's tables, so theirs are dropped to keep
+    create_all()/drop_all() on the primary.
+    """
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    for index, uri in enumerate(app.config.get('SQLALCHEMY_REPLICA_URIS') or ()):
+        binds[f'{REPLICA_BIND_PREFIX}{index}'] = uri
+    app.config['SQLALCHEMY_BINDS'] = binds
+    db.init_app(app)
+    for key in list(db.metadatas):
+        if key is not None and key.startswith(REPLICA_BIND_PREFIX):
+            del db.metadatas[key]
+
+
+def replica_engines(db):
+    """Return the replica engines of the current app."""
+    return [
+        engine for key, engine in db.engines.items()
+        if key is not None and key.startswith(REPLICA_BIND_PREFIX)
+    ]
+
+
+class RoutingSession(Session):
+    """
+    Send plain SELECTs to a read replica and everything else to the primary.
+    
+    Flushes, INSERT/UPDATE/DELETE statements and SELECT ... FOR UPDATE go
+    to the primary. Once a session has written, it stays on the primary, so
+    a request always reads its own writes. db.session is scoped to the app
+    context, which makes this stickiness last for one request. Each session
+    picks a single replica, so one request never mixes replicas that lag by
+    different amounts. With no replicas configured, every statement goes to
+    the primary, as before.
+    """
+    
+    def __init__(self, db, **kwargs):
+        """Initialize with no replica chosen and no writes seen."""
+        super().__init__(db, **kwargs)
+        self._replica = None
+        self._sticky_primary = False
+    
+    def _is_write(self, clause):
+        """Return True if the statement must run on the primary."""
+        if self._flushing or isinstance(clause, sa.UpdateBase):
+            return True
+        return getattr(clause, '_for_update_arg', None) is not None
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """Pick the primary or this session's replica for a statement."""
+        if bind is not None:
+            return bind
+        if self._is_write(clause):
+            self._sticky_primary = True
+        if not self._sticky_primary:
+            if self._replica is None:
+                replicas = replica_engines(self._db)
+                self._replica = random.choice(replicas) if replicas else False
+            if self._replica:
+                return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+    
+    def use_primary(self):
+        """Send every later statement of this session to the primary."""
+        self._sticky_primary = True
@@ -0,0 +1,147 @@
+"""
+Clients for the store shared by every worker process.
+
+The 'shared' backends (entity and response caches, login throttle, token
+revocations) talk to a client exposing the redis-py subset get, set (with
+ex/nx), delete and scan_iter. SHARED_STORE_URL picks the client.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from app.persistence.cache import LocalSharedStore
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+
+class SQLiteSharedStore:
+    """
+    Key-value store in one SQLite file, shared by the processes of a host.
+
+    Every process and thread opens its own connection; WAL and a busy
+    timeout let them read alongside one writer. Expiry uses wall-clock
+    time, which all processes agree on, and expired rows are purged every
+    PURGE_EVERY writes.
+    """
+
+    cross_process = True
+
+    # Expired rows are deleted after this many writes
+    PURGE_EVERY = 1000
+
+    def __init__(self, path, busy_timeout=5.0):
+        """Initialize on the database file at path, creating it if needed."""
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS kv ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+            )
+
+    def _connect(self):
+        """Return this thread's connection, reopening it after a fork."""
+        pid = os.getpid()
+        if getattr(self._local, 'pid', None) != pid:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                         isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = pid
+        return self._local.connection
+
+    def get(self, key):
+        """Return stored bytes or None."""
+        row = self._connect().execute(
+            'SELECT value FROM kv WHERE key = ? AND (expires_at IS NULL OR expires_at >= ?)',
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value, ex=None, nx=False):
+        """
+        Store bytes, expiring after ex seconds if given.
+
+        With nx, only store if the key is absent or expired; returns None
+        if it was not stored. The check and write are one statement, so
+        concurrent callers in different processes cannot both succeed.
+        """
+        now = time.time()
+        expires_at = now + ex if ex else None
+        connection = self._connect()
+        if nx:
+            cursor = connection.execute(
+                'INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET value = excluded.value, '
+                'expires_at = excluded.expires_at '
+                'WHERE kv.expires_at IS NOT NULL AND kv.expires_at < ?',
+                (key, value, expires_at, now)
+            )
+            stored = cursor.rowcount > 0
+        else:
+            connection.execute(
+                'INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, value, expires_at)
+            )
+            stored = True
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            connection.execute('DELETE FROM kv WHERE expires_at < ?', (now,))
+        return True if stored else None
+
+    def delete(self, *keys):
+        """Delete keys and return how many existed."""
+        if not keys:
+            return 0
+        placeholders = ', '.join('?' * len(keys))
+        return self._connect().execute(
+            f'DELETE FROM kv WHERE key IN ({placeholders})', keys
+        ).rowcount
+
+    def scan_iter(self, match='*'):
+        """Iterate over keys matching a glob pattern."""
+        rows = self._connect().execute(
+            'SELECT key FROM kv WHERE key GLOB ?', (match,)
+        ).fetchall()
+        return iter([row[0] for row in rows])
+
+
+def create_shared_client(url, base_dir=None):
+    """
+    Build the client named by SHARED_STORE_URL, or None if it is unset.
+
+    redis:// and rediss:// need the redis package. sqlite:///path opens a
+    file every worker on the host shares; relative paths are resolved
+    against base_dir. memory:// is private to the process.
+    """
+    if not url:
+        return None
+    scheme = url.split('://', 1)[0]
+    if scheme in ('redis', 'rediss', 'unix'):
+        if redis is None:
+            raise RuntimeError(f'SHARED_STORE_URL {url} needs the redis package')
+        return redis.Redis.from_url(url)
+    if scheme == 'sqlite':
+        path = url[len('sqlite:///'):]
+        if not path:
+            raise ValueError('sqlite SHARED_STORE_URL needs a file path')
+        if base_dir and not os.path.isabs(path):
+            os.makedirs(base_dir, exist_ok=True)
+            path = os.path.join(base_dir, path)
+        return SQLiteSharedStore(path)
+    if scheme == 'memory':
+        return LocalSharedStore()
+    raise ValueError(f'Unsupported SHARED_STORE_URL: {url}')
+
+
+def is_cross_process(store):
+    """Return True if store keeps its state where every worker sees it."""
+    client = getattr(store, 'client', None)
+    return client is not None and getattr(client, 'cross_process', True)
@@ -1,15 +1,88 @@
 """
 SQLAlchemy Repository implementation.
 """
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, func, or_
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from app.models.db import db
 
 
+def encode_cursor(sort_name, value, obj_id):
+    """Encode a (sort value, id) position as an opaque cursor."""
+    payload = {'s': sort_name, 'id': obj_id, 'v': value}
+    if isinstance(value, datetime):
+        payload['v'] = value.isoformat()
+        payload['dt'] = True
+    raw = json.dumps(payload)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, sort_name):
+    """Decode a cursor into a (sort value, id) tuple."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii'))
+        payload = json.loads(raw)
+        value = payload['v']
+        if payload.get('dt'):
+            value = datetime.fromisoformat(value)
+        obj_id = str(payload['id'])
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError('Invalid cursor')
+    if payload.get('s') != sort_name:
+        raise ValueError('Cursor does not match the requested sort')
+    return value, obj_id
+
+
+def keyset_order(statement, model, sort_key, cursor=None, descending=False):
+    """
+    Filter a Query or Select past a cursor and order it by (sort_key, id).
+    
+    Returns (statement, sort_name); sort_name tags the cursors of the page.
+    """
+    sort_name = ('-' if descending else '') + sort_key.key
+    if cursor:
+        value, obj_id = decode_cursor(cursor, sort_name)
+        if descending:
+            statement = statement.filter(or_(
+                sort_key < value,
+                and_(sort_key == value, model.id < obj_id)
+            ))
+        else:
+            statement = statement.filter(or_(
+                sort_key > value,
+                and_(sort_key == value, model.id > obj_id)
+            ))
+    if descending:
+        statement = statement.order_by(sort_key.desc(), model.id.desc())
+    else:
+        statement = statement.order_by(sort_key, model.id)
+    return statement, sort_name
+
+
+def keyset_page(items, limit, sort_name, sort_key):
+    """
+    Trim limit + 1 fetched items to a page.
+    
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(sort_name, getattr(last, sort_key.key), last.id)
+    return items, next_cursor
+
+
 class SQLAlchemyRepository:
     """Repository using SQLAlchemy for database operations."""
     
-    def __init__(self, model_class):
-        """Initialize with model class."""
+    def __init__(self, model_class, cache=None):
+        """Initialize with model class and an optional EntityCache."""
         self.model_class = model_class
+        self.cache = cache
     
     def add(self, obj):
         """Add an object to database."""
@@ -17,14 +90,152 @@ class SQLAlchemyRepository:
         db.session.commit()
         return obj
     
+    def add_many(self, objs, chunk_size=500):
+        """
+        Add many objects in one transaction.
+        
+        Objects are flushed chunk by chunk so the INSERTs are batched into
+        executemany calls, then committed once; any failure rolls back the
+        whole batch. The committed rows are reloaded with one SELECT per
+        chunk instead of one refresh per object.
+        """
+        try:
+            for start in range(0, len(objs), chunk_size):
+                db.session.add_all(objs[start:start + chunk_size])
+                db.session.flush()
+            self._before_commit_many(objs)
+            ids = [obj.id for obj in objs]
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        model = self.model_class
+        for start in range(0, len(ids), chunk_size):
+            model.query.filter(model.id.in_(ids[start:start + chunk_size])).all()
+        return objs
+    
+    def _before_commit_many(self, objs):
+        """Hook for work that must share the add_many transaction."""
+    
     def get(self, obj_id):
-        """Get object by ID."""
-        return self.model_class.query.get(obj_id)
+        """Get object by ID, reading through the entity cache if enabled."""
+        if self.cache is not None:
+            obj = self.cache.get(self.model_class, obj_id)
+            if obj is not None:
+                return obj
+        obj = self.model_class.query.get(obj_id)
+        if obj is not None and self.cache is not None:
+            self.cache.set(obj)
+        return obj
+    
+    def _load_option(self, path):
+        """
+        Build the eager-load option for a dotted relationship path.
+        
+        Collections use selectinload (one extra IN query per level);
+        many-to-one relationships use joinedload.
+        """
+        model = self.model_class
+        option = None
+        for name in path.split('.'):
+            relationship = sa_inspect(model).relationships.get(name)
+            if relationship is None:
+                raise ValueError(f'Cannot expand: {path}')
+            attr = getattr(model, name)
+            if relationship.uselist:
+                option = selectinload(attr) if option is None else option.selectinload(attr)
+            else:
+                option = joinedload(attr) if option is None else option.joinedload(attr)
+            model = relationship.mapper.class_
+        return option
+    
+    def get_expanded(self, obj_id, expand):
+        """
+        Get object by ID with the relationships in expand loaded eagerly.
+        
+        Every other relationship is set to raise, so serializing the result
+        can never fall back to per-row lazy loads.
+        """
+        model = self.model_class
+        options = [self._load_option(path) for path in expand]
+        return model.query.options(*options, raiseload('*')).filter(
+            model.id == obj_id
+        ).first()
+    
+    def invalidate(self, obj_id):
+        """Drop an object from the entity cache after a write."""
+        if self.cache is not None:
+            self.cache.invalidate(self.model_class, obj_id)
     
     def get_all(self):
         """Get all objects."""
         return self.model_class.query.all()
     
+    def get_page(self, limit, cursor=None, query=None, sort_key=None,
+                 descending=False):
+        """
+        Get one page of objects ordered by (sort_key, id).
+        
+        sort_key is a mapped attribute and defaults to created_at; query
+        lets callers page over a pre-filtered query. Returns a tuple
+        (items, next_cursor); next_cursor is None on the last page.
+        """
+        model = self.model_class
+        if query is None:
+            query = model.query
+        if sort_key is None:
+            sort_key = model.created_at
+        query, sort_name = keyset_order(query, model, sort_key, cursor, descending)
+        
+        # Fetch one extra row to know whether another page follows
+        items = query.limit(limit + 1).all()
+        return keyset_page(items, limit, sort_name, sort_key)
+    
+    def stream(self, updated_since=None, batch_size=1000):
+        """
+        Yield every object ordered by (updated_at, id) without loading them all.
+        
+        yield_per fetches rows in batches from a server-side cursor, so memory
+        stays flat whatever the table size. updated_since keeps only rows
+        changed at or after that time, for incremental pulls.
+        """
+        model = self.model_class
+        statement = db.select(model)
+        if updated_since is not None:
+            statement = statement.where(model.updated_at >= updated_since)
+        statement = statement.order_by(model.updated_at, model.id).execution_options(
+            yield_per=batch_size
+        )
+        yield from db.session.scalars(statement)
+    
+    def get_version(self, obj_id):
+        """Return an object's updated_at with a primary-key lookup, or None."""
+        model = self.model_class
+        return db.session.query(model.updated_at).filter(model.id == obj_id).scalar()
+    
+    def get_collection_version(self, query=None):
+        """
+        Return (row count, newest updated_at) for a query, by default all rows.
+        
+        Both change on any insert, update or delete, so together they version
+        a list response; max(updated_at) is served by its index.
+        """
+        model = self.model_class
+        if query is None:
+            query = model.query
+        return tuple(query.with_entities(
+            func.count(model.id), func.max(model.updated_at)
+        ).order_by(None).one())
+    
+    def count(self, **filters):
+        """Count objects with a COUNT(*) query, optionally filtered by equality."""
+        model = self.model_class
+        query = db.session.query(func.count(model.id))
+        for attr_name, attr_value in filters.items():
+            query = query.filter(getattr(model, attr_name) == attr_value)
+        return query.scalar()
+    
     def update(self, obj_id, data):
         """Update object."""
         obj = self.get(obj_id)
@@ -33,6 +244,7 @@ class SQLAlchemyRepository:
                 if hasattr(obj, key):
                     setattr(obj, key, value)
             db.session.commit()
+            self.invalidate(obj_id)
         return obj
     
     def delete(self, obj_id):
@@ -41,6 +253,7 @@ class SQLAlchemyRepository:
         if obj:
             db.session.delete(obj)
             db.session.commit()
+            self.invalidate(obj_id)
             return True
         return False
     
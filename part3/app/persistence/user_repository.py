@@ -2,15 +2,20 @@
 User-specific repository.
 """
 from typing import Optional
+from app.models.place import Place
 from app.models.user import User
 from app.models.db import db
+from app.persistence.cache import entity_cache
+from app.persistence.review_repository import remove_user_ratings
+from app.persistence.sqlalchemy_repository import SQLAlchemyRepository
 
 
-class UserRepository:
+class UserRepository(SQLAlchemyRepository):
     """Repository for User operations."""
     
     def __init__(self):
         """Initialize UserRepository."""
+        super().__init__(User, cache=entity_cache)
         self.model = User
     
     def create(self, user_data: dict) -> User:
@@ -20,10 +25,6 @@ class UserRepository:
         db.session.commit()
         return user
     
-    def get(self, user_id: int) -> Optional[User]:
-        """Get user by ID."""
-        return self.model.query.get(user_id)
-    
     def get_all(self):
         """Get all users."""
         return self.model.query.all()
@@ -42,14 +43,19 @@ class UserRepository:
                 setattr(user, key, value)
         
         db.session.commit()
+        self.invalidate(user_id)
         return user
     
     def delete(self, user_id: int) -> bool:
-        """Delete user."""
+        """Delete user, with their places and reviews."""
         user = self.get(user_id)
         if user:
+            rated_place_ids = remove_user_ratings(user.id)
             db.session.delete(user)
             db.session.commit()
+            self.invalidate(user_id)
+            for place_id in rated_place_ids:
+                entity_cache.invalidate(Place, place_id)
             return True
         return False
     
@@ -0,0 +1,129 @@
+"""
+Production server: pre-forked gunicorn workers around a preloaded app.
+
+Run with `python -m app.serve`; settings come from ProductionConfig.
+"""
+import multiprocessing
+
+from gunicorn.app.base import BaseApplication
+
+from app import create_app
+from app.models.db import db
+from app.persistence.shared_store import is_cross_process
+
+
+def worker_count(configured=0):
+    """Return the configured worker count, or 2 x cores + 1 when 0."""
+    return configured or multiprocessing.cpu_count() * 2 + 1
+
+
+def process_local_state():
+    """
+    Name the settings whose state stays inside one process.
+
+    Each worker would keep its own copy: a refresh token spent or a
+    session revoked in one worker would still be accepted by the others,
+    every worker would allow the full login attempt budget, and cache
+    entries invalidated by a write in one worker would still be served
+    by the others. Role changes share the revocation store, so they are
+    covered with it. Disabled caches and throttling keep no state.
+    """
+    from app.persistence.cache import entity_cache
+    from app.services import shared_facade
+    from app.services.login_throttle import login_throttle
+    from app.services.token_store import token_revocations
+    stores = {
+        'TOKEN_REVOCATION_BACKEND': token_revocations.store,
+        'LOGIN_THROTTLE_BACKEND': login_throttle.store,
+        'ENTITY_CACHE_BACKEND': entity_cache.backend,
+        'RESPONSE_CACHE_BACKEND': shared_facade.response_cache.backend
+    }
+    return [name for name, store in stores.items()
+            if store is not None and not is_cross_process(store)]
+
+
+def check_workers(workers):
+    """Refuse several workers while security state is kept per process."""
+    local = process_local_state()
+    if workers > 1 and local:
+        raise RuntimeError(
+            f'{workers} workers cannot share the state of {", ".join(local)}; '
+            'use the shared backend with a cross-process SHARED_STORE_URL '
+            '(redis:// or sqlite:///) or set HBNB_WORKERS=1'
+        )
+
+
+def dispose_engines(app, close=True):
+    """
+    Drop every pooled database connection of the app.
+
+    close=False discards the pool without closing its connections, for a
+    forked child whose inherited connections still belong to the parent.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=close)
+
+
+def post_fork(server, worker):
+    """Give a new worker its own connections and background threads."""
+    app = worker.app.wsgi()
+    dispose_engines(app, close=False)
+    if app.config['ADMIN_STATS_BACKGROUND_REFRESH']:
+        from app.services import shared_facade
+        shared_facade.stats.start_background_refresh(app)
+
+
+def worker_exit(server, worker):
+    """Close a worker's connections once its last request has finished."""
+    dispose_engines(worker.app.wsgi())
+
+
+def server_options(config):
+    """Build gunicorn settings from the app's SERVER_* configuration."""
+    return {
+        'bind': config['SERVER_BIND'],
+        'workers': worker_count(config['SERVER_WORKERS']),
+        # Import the app once in the master; workers share it copy-on-write
+        'preload_app': True,
+        'max_requests': config['SERVER_MAX_REQUESTS'],
+        'max_requests_jitter': config['SERVER_MAX_REQUESTS_JITTER'],
+        'timeout': config['SERVER_TIMEOUT'],
+        'graceful_timeout': config['SERVER_GRACEFUL_TIMEOUT'],
+        'keepalive': config['SERVER_KEEPALIVE'],
+        'post_fork': post_fork,
+        'worker_exit': worker_exit
+    }
+
+
+class HBnBServer(BaseApplication):
+    """Gunicorn application serving an already-created Flask app."""
+
+    def __init__(self, app, options):
+        """Initialize with the Flask app and gunicorn settings."""
+        self.application = app
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        """Apply the settings passed to the constructor."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        """Return the preloaded WSGI app."""
+        return self.application
+
+
+def serve(config_name='production'):
+    """Create the app in the master process and run the worker pool."""
+    app = create_app(config_name)
+    options = server_options(app.config)
+    check_workers(options['workers'])
+    # Connections opened while booting must not be shared with the workers
+    dispose_engines(app)
+    HBnBServer(app, options).run()
+
+
+if __name__ == '__main__':
+    serve()
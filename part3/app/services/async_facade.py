@@ -0,0 +1,109 @@
+"""
+Async facade over the read-only async repositories.
+"""
+import random
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.models.amenity import Amenity
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.async_repository import AsyncPlaceRepository, AsyncSQLAlchemyRepository
+from app.utils.sqlite_tuning import attach_pragmas
+
+# asyncio driver used for each database backend
+ASYNC_DRIVERS = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+    'mysql': 'aiomysql'
+}
+
+
+def to_async_url(url):
+    """Rewrite a database URL to use the backend's asyncio driver."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f'No asyncio driver known for {backend}')
+    return url.set(drivername=f'{backend}+{ASYNC_DRIVERS[backend]}')
+
+
+class AsyncHBnBFacade:
+    """
+    Read side of HBnBFacade for the ASGI entry point.
+
+    Reads go to a random replica engine when replicas are configured,
+    otherwise to the primary; SQLite engines get the app's pragma profile.
+    Writes stay on the synchronous facade.
+    """
+
+    def __init__(self, url, replica_urls=(), pragmas=None):
+        """Create async engines for the primary and replica URLs."""
+        self.engines = [create_async_engine(to_async_url(u)) for u in (url, *replica_urls)]
+        for engine in self.engines:
+            if engine.dialect.name == 'sqlite' and pragmas:
+                attach_pragmas(engine.sync_engine, pragmas)
+        self._sessionmakers = [
+            async_sessionmaker(engine, expire_on_commit=False)
+            for engine in self.engines[1:] or self.engines
+        ]
+        self.user_repo = AsyncSQLAlchemyRepository(User, self._session)
+        self.place_repo = AsyncPlaceRepository(self._session)
+        self.review_repo = AsyncSQLAlchemyRepository(Review, self._session)
+        self.amenity_repo = AsyncSQLAlchemyRepository(Amenity, self._session)
+
+    @classmethod
+    def from_app(cls, app):
+        """Build a facade on the databases of a configured Flask app."""
+        from app.models.db import db
+        from app.persistence.routing import replica_engines
+        with app.app_context():
+            url = db.engine.url
+            replica_urls = [engine.url for engine in replica_engines(db)]
+        return cls(url, replica_urls, app.config.get('SQLITE_PRAGMAS'))
+
+    def _session(self):
+        """Open an AsyncSession on one of the read engines."""
+        return random.choice(self._sessionmakers)()
+
+    def _repo_for(self, model_name: str):
+        """Get the async repository of a model."""
+        return {
+            'User': self.user_repo,
+            'Place': self.place_repo,
+            'Review': self.review_repo,
+            'Amenity': self.amenity_repo
+        }[model_name]
+
+    async def dispose(self):
+        """Close every pooled connection."""
+        for engine in self.engines:
+            await engine.dispose()
+
+    # PLACE METHODS
+    async def get_place(self, place_id):
+        return await self.place_repo.get(place_id)
+
+    async def get_places_page(self, limit, cursor=None, filters=None, sort='created_at'):
+        return await self.place_repo.get_filtered_page(filters or {}, sort, limit, cursor)
+
+    # REVIEW METHODS
+    async def get_review(self, review_id):
+        return await self.review_repo.get(review_id)
+
+    async def get_reviews_page(self, limit, cursor=None):
+        return await self.review_repo.get_page(limit, cursor)
+
+    # AMENITY METHODS
+    async def get_amenities_page(self, limit, cursor=None):
+        return await self.amenity_repo.get_page(limit, cursor)
+
+    # VERSION METHODS (ETag / Last-Modified)
+    async def get_entity_version(self, model_name: str, obj_id):
+        return await self._repo_for(model_name).get_version(obj_id)
+
+    async def get_collection_version(self, model_name: str):
+        return await self._repo_for(model_name).get_collection_version()
+
+    async def get_places_version(self, filters=None):
+        return await self.place_repo.get_filtered_version(filters or {})
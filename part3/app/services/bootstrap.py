@@ -0,0 +1,96 @@
+"""
+One-off database setup run from the CLI rather than on every app start.
+"""
+from sqlalchemy import func, inspect, select
+from sqlalchemy.exc import IntegrityError
+from app.models.db import db
+from app.models.user import User
+
+
+class SchemaUpgradeError(Exception):
+    """Raised when existing rows prevent a schema upgrade."""
+
+
+def create_schema():
+    """Create any missing tables and columns on the primary database."""
+    db.create_all()
+    return upgrade_schema()
+
+
+def upgrade_schema():
+    """
+    Add columns that models gained after their table was created.
+    
+    create_all() never alters an existing table, so databases from before
+    geohash search or rating aggregates lack those columns and the
+    indexes added since. New columns are nullable or have a scalar
+    default, so ADD COLUMN fills existing rows. A unique index is only
+    created once no existing rows collide on it; otherwise the whole
+    upgrade is rolled back with a SchemaUpgradeError naming them. Returns
+    the added columns as 'table.column'.
+    """
+    engine = db.engine
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col['name'] for col in inspector.get_columns(table.name)}
+            indexed = {index['name'] for index in inspector.get_indexes(table.name)}
+            new_columns = [col for col in table.columns if col.name not in existing]
+            for column in new_columns:
+                ddl = f'{column.name} {column.type.compile(engine.dialect)}'
+                if column.default is not None and column.default.is_scalar:
+                    ddl += f' DEFAULT {column.default.arg!r}'
+                    if not column.nullable:
+                        ddl += ' NOT NULL'
+                connection.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {ddl}')
+                added.append(f'{table.name}.{column.name}')
+            for index in table.indexes:
+                if index.unique and index.name not in indexed:
+                    _check_unique(connection, index)
+                index.create(connection, checkfirst=True)
+    return added
+
+
+def _check_unique(connection, index):
+    """Raise SchemaUpgradeError if existing rows repeat the index's values."""
+    columns = list(index.columns)
+    duplicates = connection.execute(
+        select(*columns).group_by(*columns).having(func.count() > 1)
+    ).all()
+    if duplicates:
+        names = ', '.join(column.name for column in columns)
+        examples = '; '.join(', '.join(map(str, row)) for row in duplicates[:5])
+        raise SchemaUpgradeError(
+            f'Cannot create unique index {index.name}: {len(duplicates)} '
+            f'({names}) values appear more than once (e.g. {examples}). '
+            f'Remove the duplicate rows and run init-db again.'
+        )
+
+
+def seed_admin(email, password, first_name='Admin', last_name='User'):
+    """
+    Create the admin account unless one with this email exists.
+    
+    Safe to run from several processes at once: the unique email index
+    decides the race and the losers return the winner's row. Returns
+    (user, created).
+    """
+    session = db.session()
+    session.use_primary()
+    email = email.lower()
+    admin = User.query.filter_by(email=email).first()
+    if admin:
+        return admin, False
+    
+    admin = User(first_name=first_name, last_name=last_name, email=email,
+                 password=password, is_admin=True)
+    session.add(admin)
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        return User.query.filter_by(email=email).first(), False
+    return admin, True
@@ -2,10 +2,14 @@
 Facade with SQLAlchemy repositories.
 """
 from app.persistence.user_repository import UserRepository
+from app.persistence.cache import entity_cache
 from app.persistence.repository_factory import RepositoryFactory
 from app.models.place import Place
 from app.models.review import Review
 from app.models.amenity import Amenity
+from app.services.response_cache import ResponseCache
+from app.services.role_cache import REVOKED, RoleChangeCache
+from app.services.stats import StatsService
 
 
 class HBnBFacade:
@@ -15,11 +19,19 @@ class HBnBFacade:
         """Initialize facade."""
         self.user_repo = UserRepository()
         self.repo_factory = RepositoryFactory
+        self.stats = StatsService(self)
+        self.role_changes = RoleChangeCache()
+        # Public list responses; writes below invalidate them by tag
+        self.response_cache = ResponseCache()
     
     def _get_repo(self, model_name: str):
         """Get repository."""
         return self.repo_factory.get_repository(model_name)
     
+    def _repo_for(self, model_name: str):
+        """Get repository, including the dedicated user repository."""
+        return self.user_repo if model_name == 'User' else self._get_repo(model_name)
+    
     # USER METHODS
     def create_user(self, user_data: dict):
         return self.user_repo.create(user_data)
@@ -33,36 +45,106 @@ class HBnBFacade:
     def get_all_users(self):
         return self.user_repo.get_all()
     
+    def count_users(self, **filters):
+        return self.user_repo.count(**filters)
+    
+    def get_users_page(self, limit, cursor=None):
+        return self.user_repo.get_page(limit, cursor)
+    
     def update_user(self, user_id, data: dict):
-        return self.user_repo.update(user_id, data)
+        user = self.user_repo.update(user_id, data)
+        if user and 'is_admin' in data:
+            self.role_changes.record(user_id, bool(user.is_admin))
+        return user
     
     def delete_user(self, user_id):
-        return self.user_repo.delete(user_id)
+        deleted = self.user_repo.delete(user_id)
+        if deleted:
+            self.role_changes.record(user_id, REVOKED)
+            # The user's places and reviews were deleted with them
+            self.response_cache.invalidate('places', 'reviews')
+        return deleted
+    
+    def is_token_stale(self, user_id, claimed_is_admin):
+        return self.role_changes.is_stale(user_id, claimed_is_admin)
     
     def authenticate_user(self, email: str, password: str):
         return self.user_repo.authenticate(email, password)
     
     # PLACE METHODS
     def create_place(self, place_data: dict):
-        place = Place(**place_data)
-        return self._get_repo('Place').add(place)
+        place = self._get_repo('Place').add(Place(**place_data))
+        self.response_cache.invalidate('places')
+        return place
+    
+    def create_places(self, places_data: list):
+        places = [Place(**data) for data in places_data]
+        places = self._get_repo('Place').add_many(places)
+        self.response_cache.invalidate('places')
+        return places
     
     def get_place(self, place_id):
         return self._get_repo('Place').get(place_id)
     
+    def get_place_expanded(self, place_id, expand):
+        return self._get_repo('Place').get_expanded(place_id, expand)
+    
     def get_all_places(self):
         return self._get_repo('Place').get_all()
     
+    def count_places(self, **filters):
+        return self._get_repo('Place').count(**filters)
+    
+    def get_places_page(self, limit, cursor=None, filters=None, sort='created_at'):
+        return self._get_repo('Place').get_filtered_page(
+            filters or {}, sort, limit, cursor
+        )
+    
+    def search_places_in_bbox(self, min_lat, min_lng, max_lat, max_lng, limit=None):
+        return self._get_repo('Place').get_in_bbox(
+            min_lat, min_lng, max_lat, max_lng, limit
+        )
+    
+    def search_places_near(self, latitude, longitude, radius_km, limit=None):
+        return self._get_repo('Place').get_within_radius(
+            latitude, longitude, radius_km, limit
+        )
+    
+    def search_places_text(self, text, limit, cursor=None):
+        return self._get_repo('Place').search_text(text, limit, cursor)
+    
+    def rebuild_place_search_index(self):
+        return self._get_repo('Place').rebuild_search_index()
+    
+    def backfill_place_geohashes(self, batch_size=1000):
+        return self._get_repo('Place').backfill_geohashes(batch_size)
+    
+    def recompute_place_ratings(self):
+        count = self._get_repo('Place').recompute_rating_aggregates()
+        self.response_cache.invalidate('places')
+        return count
+    
     def update_place(self, place_id, data: dict):
-        return self._get_repo('Place').update(place_id, data)
+        place = self._get_repo('Place').update(place_id, data)
+        self.response_cache.invalidate('places')
+        return place
     
     def delete_place(self, place_id):
-        return self._get_repo('Place').delete(place_id)
+        deleted = self._get_repo('Place').delete(place_id)
+        self.response_cache.invalidate('places', 'reviews')
+        return deleted
     
-    # REVIEW METHODS
+    # REVIEW METHODS (reviews also change place rating aggregates)
     def create_review(self, review_data: dict):
-        review = Review(**review_data)
-        return self._get_repo('Review').add(review)
+        review = self._get_repo('Review').add(Review(**review_data))
+        self.response_cache.invalidate('reviews', 'places')
+        return review
+    
+    def create_reviews(self, reviews_data: list):
+        reviews = [Review(**data) for data in reviews_data]
+        reviews = self._get_repo('Review').add_many(reviews)
+        self.response_cache.invalidate('reviews', 'places')
+        return reviews
     
     def get_review(self, review_id):
         return self._get_repo('Review').get(review_id)
@@ -70,25 +152,81 @@ class HBnBFacade:
     def get_all_reviews(self):
         return self._get_repo('Review').get_all()
     
+    def count_reviews(self, **filters):
+        return self._get_repo('Review').count(**filters)
+    
+    def get_reviews_page(self, limit, cursor=None):
+        return self._get_repo('Review').get_page(limit, cursor)
+    
     def update_review(self, review_id, data: dict):
-        return self._get_repo('Review').update(review_id, data)
+        review = self._get_repo('Review').update(review_id, data)
+        self.response_cache.invalidate('reviews', 'places')
+        return review
     
     def delete_review(self, review_id):
-        return self._get_repo('Review').delete(review_id)
+        deleted = self._get_repo('Review').delete(review_id)
+        self.response_cache.invalidate('reviews', 'places')
+        return deleted
     
     def get_reviews_by_place(self, place_id):
-        return self._get_repo('Review').get_by_attribute('place_id', place_id)
+        return self._get_repo('Review').get_all_by_attribute('place_id', place_id)
+    
+    def has_reviewed(self, place_id, user_id):
+        return self._get_repo('Review').exists_for(place_id, user_id)
     
     # AMENITY METHODS
     def create_amenity(self, amenity_data: dict):
-        amenity = Amenity(**amenity_data)
-        return self._get_repo('Amenity').add(amenity)
+        amenity = self._get_repo('Amenity').add(Amenity(**amenity_data))
+        self.response_cache.invalidate('amenities')
+        return amenity
+    
+    def create_amenities(self, amenities_data: list):
+        amenities = [Amenity(**data) for data in amenities_data]
+        amenities = self._get_repo('Amenity').add_many(amenities)
+        self.response_cache.invalidate('amenities')
+        return amenities
     
     def get_amenity(self, amenity_id):
         return self._get_repo('Amenity').get(amenity_id)
     
+    def get_amenity_by_name(self, name: str):
+        return self._get_repo('Amenity').get_by_attribute('name', name)
+    
     def get_all_amenities(self):
         return self._get_repo('Amenity').get_all()
     
+    def count_amenities(self, **filters):
+        return self._get_repo('Amenity').count(**filters)
+    
+    def get_amenities_page(self, limit, cursor=None):
+        return self._get_repo('Amenity').get_page(limit, cursor)
+    
     def update_amenity(self, amenity_id, data: dict):
-        return self._get_repo('Amenity').update(amenity_id, data)
+        amenity = self._get_repo('Amenity').update(amenity_id, data)
+        self.response_cache.invalidate('amenities')
+        return amenity
+    
+    # EXPORT METHODS
+    def stream_entities(self, model_name: str, updated_since=None, batch_size=1000):
+        return self._repo_for(model_name).stream(updated_since, batch_size)
+    
+    # VERSION METHODS (ETag / Last-Modified)
+    def get_entity_version(self, model_name: str, obj_id):
+        return self._repo_for(model_name).get_version(obj_id)
+    
+    def get_collection_version(self, model_name: str):
+        return self._repo_for(model_name).get_collection_version()
+    
+    def get_places_version(self, filters=None):
+        repo = self._get_repo('Place')
+        return repo.get_collection_version(repo.build_filtered_query(filters or {}))
+    
+    # STATS METHODS
+    def get_stats(self):
+        return self.stats.get_stats()
+    
+    def get_cache_stats(self):
+        return entity_cache.stats()
+    
+    def get_response_cache_stats(self):
+        return self.response_cache.stats()
@@ -0,0 +1,161 @@
+"""
+Token-bucket throttling of login attempts per client IP and per email.
+"""
+import json
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from app.persistence.cache import LocalSharedStore
+
+
+def _refill(tokens, updated_at, now, capacity, rate):
+    """Tokens in a bucket after refilling at rate per second since updated_at."""
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+
+def _take(state, now, capacity, rate):
+    """
+    Take one token from a bucket state (tokens, updated_at) or None.
+
+    Returns (new state, seconds to wait); the wait is 0 when a token was
+    taken, otherwise the time until the next token and the state is kept.
+    """
+    tokens = capacity if state is None else _refill(*state, now, capacity, rate)
+    if tokens >= 1:
+        return (tokens - 1, now), 0.0
+    return (tokens, now), (1 - tokens) / rate
+
+
+class MemoryBucketStore:
+    """
+    In-process buckets split across shards, each with its own lock.
+
+    Concurrent logins for different keys rarely contend on one lock. Each
+    shard keeps its most recently used keys, so a flood of distinct IPs or
+    emails cannot grow memory without bound.
+    """
+
+    name = 'memory'
+
+    def __init__(self, shards=16, max_keys=100000):
+        """Initialize empty shards."""
+        self._shards = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._max_per_shard = max(1, max_keys // shards)
+
+    def take(self, key, capacity, rate, now):
+        """Take a token from key's bucket; return the seconds to wait, 0 if allowed."""
+        index = zlib.crc32(key.encode('utf-8')) % len(self._shards)
+        shard = self._shards[index]
+        with self._locks[index]:
+            state, wait = _take(shard.get(key), now, capacity, rate)
+            shard[key] = state
+            shard.move_to_end(key)
+            if len(shard) > self._max_per_shard:
+                shard.popitem(last=False)
+        return wait
+
+    def clear(self):
+        """Reset every bucket."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+
+class SharedBucketStore:
+    """
+    Buckets kept on a shared, Redis-compatible client for all workers.
+
+    The read-modify-write is not atomic across processes, so attempts
+    racing in different workers may spend the same token.
+    """
+
+    name = 'shared'
+
+    def __init__(self, client, prefix='hbnb:throttle:'):
+        """Initialize with a client exposing get/set/delete/scan_iter."""
+        self.client = client
+        self.prefix = prefix
+
+    def take(self, key, capacity, rate, now):
+        """Take a token from key's bucket; return the seconds to wait, 0 if allowed."""
+        raw = self.client.get(self.prefix + key)
+        state, wait = _take(json.loads(raw) if raw is not None else None,
+                            now, capacity, rate)
+        # A bucket left alone until full is the same as no bucket
+        self.client.set(self.prefix + key, json.dumps(state).encode('utf-8'),
+                        ex=math.ceil(capacity / rate))
+        return wait
+
+    def clear(self):
+        """Reset every bucket under this store's prefix."""
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_bucket_store(name, client=None):
+    """
+    Build the bucket store named in the configuration.
+
+    'shared' without a client keeps its buckets in this process only.
+    """
+    if not name:
+        return None
+    if name == 'memory':
+        return MemoryBucketStore()
+    if name == 'shared':
+        return SharedBucketStore(client or LocalSharedStore())
+    raise ValueError(f'Unknown throttle backend: {name}')
+
+
+class LoginThrottle:
+    """
+    Limit login attempts per client IP and per email with token buckets.
+
+    Each limit is (burst, attempts per minute): a key may make burst
+    attempts at once, then earns attempts back at the per-minute rate.
+    check() runs before any database lookup or bcrypt work, so rejected
+    attempts cost almost nothing.
+    """
+
+    def __init__(self, store=None, ip_limit=(20, 10), email_limit=(5, 2)):
+        """Initialize with a bucket store, or None to disable throttling."""
+        self.configure(store, ip_limit, email_limit)
+
+    def configure(self, store, ip_limit, email_limit):
+        """Swap the store and limits."""
+        self.store = store
+        self.limits = {'ip': ip_limit, 'email': email_limit}
+
+    def _take(self, kind, value, now):
+        """Take a token from one bucket; return the seconds to wait."""
+        burst, per_minute = self.limits[kind]
+        return self.store.take(f'{kind}:{value}', burst, per_minute / 60.0, now)
+
+    def check(self, ip, email):
+        """
+        Count one login attempt.
+
+        Returns 0 if it may proceed, otherwise the whole number of seconds
+        to send in Retry-After. The email bucket is only charged once the
+        IP bucket has let the attempt through.
+        """
+        if self.store is None:
+            return 0
+        now = time.time()
+        wait = self._take('ip', ip or 'unknown', now)
+        if not wait and email:
+            wait = self._take('email', str(email).strip().lower(), now)
+        return max(1, math.ceil(wait)) if wait else 0
+
+    def clear(self):
+        """Reset every bucket."""
+        if self.store is not None:
+            self.store.clear()
+
+
+login_throttle = LoginThrottle()
@@ -0,0 +1,171 @@
+"""
+Response cache for public GET endpoints with tag-based invalidation.
+"""
+import threading
+import time
+import uuid
+
+
+class CachedResponse:
+    """An encoded response body with its status, headers and tags."""
+
+    def __init__(self, body, status, headers, tag_tokens, stored_at):
+        """Initialize from an already-encoded response."""
+        self.body = body
+        self.status = status
+        self.headers = headers
+        self.tag_tokens = tag_tokens
+        self.stored_at = stored_at
+
+    def to_dict(self):
+        """Return the entry as JSON-serializable values."""
+        return {
+            'body': self.body.decode('utf-8'),
+            'status': self.status,
+            'headers': self.headers,
+            'tag_tokens': self.tag_tokens,
+            'stored_at': self.stored_at
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        """Rebuild an entry stored by to_dict()."""
+        return cls(values['body'].encode('utf-8'), values['status'],
+                   values['headers'], values['tag_tokens'], values['stored_at'])
+
+
+class ResponseCache:
+    """
+    Cache encoded responses by key, invalidated by tags.
+
+    Every tag has a random token in the backend; an entry remembers the
+    tokens of its tags when it was computed, and invalidate(tag) replaces
+    the token, so every entry carrying that tag misses from then on. With
+    a shared backend this reaches every worker process.
+
+    Entries younger than ttl are fresh. Until stale_ttl they may still be
+    served while one background refresh recomputes them
+    (stale-while-revalidate). Invalidated entries are never served.
+    """
+
+    def __init__(self, backend=None, ttl=10, stale_ttl=60):
+        """Initialize with a backend, or None to disable caching."""
+        self.configure(backend, ttl, stale_ttl)
+
+    def configure(self, backend, ttl, stale_ttl):
+        """Swap the backend and lifetimes, and reset the counters."""
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        # Runs a refresh job; a daemon thread unless replaced (tests run inline)
+        self.run_refresh = self._run_in_thread
+
+    @property
+    def enabled(self):
+        """Return True if a backend is configured."""
+        return self.backend is not None
+
+    def _count(self, counter):
+        """Increment one of the counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _tag_token(self, tag):
+        """Return the current token of a tag, creating one if needed."""
+        key = f'tag:{tag}'
+        token = self.backend.get(key)
+        if token is None:
+            token = uuid.uuid4().hex
+            self.backend.set(key, token)
+        return token
+
+    def record_bypass(self):
+        """Count a request that skipped the cache."""
+        self._count('bypasses')
+
+    def tag_tokens(self, tags):
+        """Snapshot the tokens of tags; take it before computing a response."""
+        return {tag: self._tag_token(tag) for tag in tags}
+
+    def lookup(self, key):
+        """
+        Return (entry, state) for a key.
+
+        state is 'fresh', 'stale' or 'miss'; entry is None on a miss.
+        """
+        values = self.backend.get(f'response:{key}')
+        entry = CachedResponse.from_dict(values) if values is not None else None
+        if entry is None or self.tag_tokens(entry.tag_tokens) != entry.tag_tokens:
+            self._count('misses')
+            return None, 'miss'
+        if time.time() - entry.stored_at < self.ttl:
+            self._count('hits')
+            return entry, 'fresh'
+        if time.time() - entry.stored_at < self.stale_ttl:
+            self._count('stale_hits')
+            return entry, 'stale'
+        self._count('misses')
+        return None, 'miss'
+
+    def store(self, key, body, status, headers, tag_tokens):
+        """Store an encoded response computed under tag_tokens."""
+        entry = CachedResponse(body, status, headers, tag_tokens, time.time())
+        self.backend.set(f'response:{key}', entry.to_dict())
+
+    def invalidate(self, *tags):
+        """Make every entry carrying any of the tags miss."""
+        if not self.enabled:
+            return
+        for tag in tags:
+            self.backend.set(f'tag:{tag}', uuid.uuid4().hex)
+            self._count('invalidations')
+
+    def clear(self):
+        """Drop every entry."""
+        if self.enabled:
+            self.backend.clear()
+
+    def revalidate(self, key, refresh):
+        """Run refresh() for a stale key unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def job():
+            try:
+                refresh()
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self.run_refresh(job)
+
+    @staticmethod
+    def _run_in_thread(job):
+        """Run a refresh job in a daemon thread."""
+        threading.Thread(target=job, name='hbnb-response-refresh', daemon=True).start()
+
+    def stats(self):
+        """Return hit/miss counters and the hit ratio."""
+        with self._lock:
+            hits, stale_hits = self.hits, self.stale_hits
+            misses, bypasses = self.misses, self.bypasses
+            invalidations = self.invalidations
+        lookups = hits + stale_hits + misses
+        return {
+            'backend': self.backend.name if self.backend else None,
+            'hits': hits,
+            'stale_hits': stale_hits,
+            'misses': misses,
+            'bypasses': bypasses,
+            'invalidations': invalidations,
+            'hit_ratio': round((hits + stale_hits) / lookups, 4) if lookups else 0.0
+        }
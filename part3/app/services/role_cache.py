@@ -0,0 +1,70 @@
+"""
+Record of role changes used to reject stale JWT claims.
+"""
+import math
+import threading
+import time
+
+# Role recorded for deleted users; it never matches a token's claim
+REVOKED = object()
+
+# How roles are written to a shared client
+_ENCODED_ROLES = {True: b'admin', False: b'user', REVOKED: b'revoked'}
+_DECODED_ROLES = {value: role for role, value in _ENCODED_ROLES.items()}
+
+
+class RoleChangeCache:
+    """
+    Remember the current role of users whose role recently changed.
+    
+    A token whose is_admin claim disagrees with the recorded role was
+    issued before the change and must be refused. Entries older than the
+    token lifetime can no longer match a live token, so they are pruned.
+    
+    Roles are kept in this process unless a shared, Redis-compatible
+    client is configured; with several workers, a change made in one must
+    be seen by all of them.
+    """
+    
+    def __init__(self, max_age=3600, client=None, prefix='hbnb:role:'):
+        """Initialize with the access-token lifetime in seconds."""
+        self.prefix = prefix
+        self.configure(client, max_age)
+    
+    def configure(self, client, max_age):
+        """Swap the client (None for in-process) and the entry lifetime."""
+        self.client = client
+        self.max_age = max_age
+        self._roles = {}
+        self._lock = threading.Lock()
+    
+    def record(self, user_id, is_admin):
+        """Record user_id's new role (or REVOKED once the user is deleted)."""
+        if self.client is not None:
+            self.client.set(self.prefix + str(user_id), _ENCODED_ROLES[is_admin],
+                            ex=max(1, math.ceil(self.max_age)))
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._roles[str(user_id)] = (is_admin, now)
+            self._prune(now)
+    
+    def _role(self, user_id):
+        """Return the recorded role of user_id, or None if unchanged."""
+        if self.client is not None:
+            raw = self.client.get(self.prefix + str(user_id))
+            return None if raw is None else _DECODED_ROLES.get(raw)
+        with self._lock:
+            entry = self._roles.get(str(user_id))
+        return None if entry is None else entry[0]
+    
+    def is_stale(self, user_id, claimed_is_admin):
+        """Return True if a token's is_admin claim is out of date."""
+        role = self._role(user_id)
+        return role is not None and role is not bool(claimed_is_admin)
+    
+    def _prune(self, now):
+        """Drop entries older than any live token."""
+        cutoff = now - self.max_age
+        for user_id in [u for u, (_, t) in self._roles.items() if t < cutoff]:
+            del self._roles[user_id]
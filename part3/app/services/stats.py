@@ -0,0 +1,76 @@
+"""
+Cached statistics for the admin dashboard.
+"""
+import threading
+import time
+from datetime import datetime
+
+
+class StatsService:
+    """
+    Serve entity counts from a short-lived snapshot.
+    
+    Counts come from COUNT(*) queries through the repositories. A snapshot
+    is reused until it is older than the TTL; an optional background thread
+    keeps it warm so dashboard polls never wait on the database.
+    """
+    
+    def __init__(self, facade, ttl=30):
+        """Initialize with the facade used to reach the repositories."""
+        self.facade = facade
+        self.ttl = ttl
+        self._snapshot = None
+        self._taken_at = 0.0
+        self._lock = threading.Lock()
+        self._refresher = None
+    
+    def _collect(self):
+        """Run the aggregate count queries."""
+        return {
+            'total_users': self.facade.count_users(),
+            'total_places': self.facade.count_places(),
+            'total_reviews': self.facade.count_reviews(),
+            'total_amenities': self.facade.count_amenities(),
+            'admin_users': self.facade.count_users(is_admin=True),
+            'generated_at': datetime.utcnow().isoformat()
+        }
+    
+    def refresh(self):
+        """Take a new snapshot and return it."""
+        snapshot = self._collect()
+        with self._lock:
+            self._snapshot = snapshot
+            self._taken_at = time.monotonic()
+        return snapshot
+    
+    def get_stats(self):
+        """Return the cached snapshot, refreshing it once it has expired."""
+        with self._lock:
+            if self._snapshot and time.monotonic() - self._taken_at < self.ttl:
+                return self._snapshot
+        return self.refresh()
+    
+    def start_background_refresh(self, app, interval=None):
+        """
+        Refresh the snapshot every interval seconds in a daemon thread.
+        
+        Threads do not survive fork(), so a forked worker may call this
+        again to start its own.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        interval = interval or self.ttl
+        
+        def run():
+            while True:
+                with app.app_context():
+                    try:
+                        self.refresh()
+                    except Exception as e:
+                        app.logger.warning('Stats refresh failed: %s', e)
+                time.sleep(interval)
+        
+        self._refresher = threading.Thread(
+            target=run, name='hbnb-stats-refresh', daemon=True
+        )
+        self._refresher.start()
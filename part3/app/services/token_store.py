@@ -0,0 +1,200 @@
+"""
+Rotating refresh tokens and the revocation store behind them.
+"""
+import json
+import math
+import threading
+import time
+import uuid
+
+from flask_jwt_extended import create_access_token, create_refresh_token
+
+from app.persistence.cache import LocalSharedStore
+
+
+class MemoryRevocationStore:
+    """In-process set of revoked keys, each kept until its expiry."""
+
+    name = 'memory'
+
+    # Expired keys are swept after this many additions
+    PRUNE_EVERY = 1000
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._adds = 0
+
+    def add(self, key, ttl, value=b'1'):
+        """Record key with value for ttl seconds; return False if already recorded."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return False
+            self._entries[key] = (value, now + ttl)
+            self._adds += 1
+            if self._adds % self.PRUNE_EVERY == 0:
+                for stale in [k for k, (_, t) in self._entries.items() if t <= now]:
+                    del self._entries[stale]
+        return True
+
+    def get(self, key):
+        """Return the value recorded with key, or None once it expired."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None and entry[1] > time.time() else None
+
+    def contains(self, key):
+        """Return True if key is recorded and not yet expired."""
+        return self.get(key) is not None
+
+    def discard(self, key):
+        """Forget one key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Forget every key."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedRevocationStore:
+    """Revoked keys on a shared, Redis-compatible client, seen by every worker."""
+
+    name = 'shared'
+
+    def __init__(self, client, prefix='hbnb:revoked:'):
+        """Initialize with a client exposing get/set/delete/scan_iter."""
+        self.client = client
+        self.prefix = prefix
+
+    def add(self, key, ttl, value=b'1'):
+        """Record key with value for ttl seconds; return False if already recorded."""
+        return bool(self.client.set(self.prefix + key, value,
+                                    ex=max(1, math.ceil(ttl)), nx=True))
+
+    def get(self, key):
+        """Return the value recorded with key, or None."""
+        return self.client.get(self.prefix + key)
+
+    def contains(self, key):
+        """Return True if key is recorded."""
+        return self.get(key) is not None
+
+    def discard(self, key):
+        """Forget one key."""
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        """Forget every key under this store's prefix."""
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_revocation_store(name, client=None):
+    """
+    Build the revocation store named in the configuration.
+
+    'shared' without a client keeps its keys in this process only.
+    """
+    if name == 'memory':
+        return MemoryRevocationStore()
+    if name == 'shared':
+        return SharedRevocationStore(client or LocalSharedStore())
+    raise ValueError(f'Unknown revocation backend: {name}')
+
+
+class TokenRevocations:
+    """
+    Track spent refresh tokens and revoked sessions.
+
+    Every token of a login session carries the same family id ('fam').
+    A refresh token may be used once; presenting it again means it was
+    copied, so the whole family is revoked, access tokens included. Each
+    check is one or two key lookups, with no database access.
+
+    Browser tabs sharing one session may refresh at the same moment. For
+    reuse_grace seconds after a rotation, presenting the spent token again
+    returns the pair it was already exchanged for instead of revoking.
+    """
+
+    def __init__(self, store=None, family_ttl=30 * 24 * 3600, reuse_grace=0):
+        """Initialize with a store and the refresh-token lifetime in seconds."""
+        self.configure(store or MemoryRevocationStore(), family_ttl, reuse_grace)
+
+    def configure(self, store, family_ttl, reuse_grace=0):
+        """Swap the store, the refresh-token lifetime and the reuse grace."""
+        self.store = store
+        self.family_ttl = family_ttl
+        self.reuse_grace = reuse_grace
+
+    def spend(self, claims, tokens=None):
+        """
+        Mark a refresh token used; return False if it already was.
+
+        With a reuse grace, tokens (the pair issued in exchange) is first
+        claimed under a key that expires with the grace. Of two concurrent
+        refreshes only one claims it; the other finds the winner's pair.
+        The long-lived spent mark is written second, so a duplicate never
+        sees the mark without the pair during the grace.
+        """
+        jti = claims['jti']
+        rotated_key = f'rotated:{jti}'
+        if self.reuse_grace and tokens is not None:
+            value = json.dumps(tokens).encode('utf-8')
+            if not self.store.add(rotated_key, self.reuse_grace, value):
+                return False
+        if self.store.add(f'jti:{jti}', max(1, claims['exp'] - time.time())):
+            return True
+        # Spent before the grace began: a replay, not a concurrent refresh
+        self.store.discard(rotated_key)
+        return False
+
+    def reissued(self, claims):
+        """Return the pair a refresh token was just exchanged for, or None."""
+        if not self.reuse_grace:
+            return None
+        raw = self.store.get(f"rotated:{claims['jti']}")
+        return json.loads(raw) if raw is not None else None
+
+    def revoke_family(self, claims):
+        """Revoke every token of the session claims belong to."""
+        if claims.get('fam'):
+            # Outlive the newest refresh token the family may have issued
+            self.store.add(f"family:{claims['fam']}", self.family_ttl)
+
+    def is_revoked(self, jwt_header, claims):
+        """flask-jwt-extended blocklist callback."""
+        if claims.get('fam') and self.store.contains(f"family:{claims['fam']}"):
+            return True
+        if claims.get('type') == 'refresh' and self.store.contains(f"jti:{claims['jti']}"):
+            if self.reissued(claims) is not None:
+                return False
+            self.revoke_family(claims)
+            return True
+        return False
+
+
+def issue_tokens(user, family=None):
+    """
+    Create an access/refresh token pair for user.
+
+    family continues an existing session when rotating; a login starts a
+    new one. The access token carries the is_admin claim.
+    """
+    family = family or uuid.uuid4().hex
+    return {
+        'access_token': create_access_token(
+            identity=str(user.id),
+            additional_claims={'is_admin': user.is_admin, 'fam': family}
+        ),
+        'refresh_token': create_refresh_token(
+            identity=str(user.id), additional_claims={'fam': family}
+        )
+    }
+
+
+token_revocations = TokenRevocations()
@@ -0,0 +1,68 @@
+"""
+Helpers for batch create endpoints.
+"""
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+
+
+def batch_create(payload, validate, create_many):
+    """
+    Validate a list of items and create the valid ones in one transaction.
+    
+    validate(item) returns an error message or None; create_many(items)
+    inserts the valid items and returns the created objects in order.
+    Returns a (body, status) pair with one result per input item: 201 when
+    every item was created, 207 when some were rejected. A constraint
+    violation or invalid value at insert time rejects the whole batch with
+    a generic 400; the details only go to the log. Any other error
+    propagates as a 500.
+    """
+    max_items = current_app.config.get('BATCH_MAX_ITEMS', 1000)
+    if not isinstance(payload, list) or not payload:
+        return {'error': 'Expected a non-empty JSON list'}, 400
+    if len(payload) > max_items:
+        return {'error': f'At most {max_items} items per batch'}, 400
+    
+    results = [None] * len(payload)
+    valid_items = []
+    valid_indexes = []
+    for index, item in enumerate(payload):
+        error = validate(item) if isinstance(item, dict) else 'Item must be an object'
+        if error:
+            results[index] = {'index': index, 'status': 400, 'error': error}
+        else:
+            valid_items.append(item)
+            valid_indexes.append(index)
+    
+    if valid_items:
+        try:
+            created = create_many(valid_items)
+        except (IntegrityError, ValueError) as e:
+            current_app.logger.warning('Batch create rejected: %s', e)
+            return {'error': 'Batch rejected, nothing was created: '
+                             'an item conflicts with existing data or is invalid'}, 400
+        except Exception:
+            current_app.logger.exception('Batch create failed')
+            raise
+        for index, obj in zip(valid_indexes, created):
+            results[index] = {'index': index, 'status': 201, 'item': obj.to_dict()}
+    
+    failed = len(payload) - len(valid_items)
+    body = {'created': len(valid_items), 'failed': failed, 'results': results}
+    return body, 207 if failed else 201
+
+
+def unknown_fields(item, allowed):
+    """Return an error message if item has fields outside allowed."""
+    extra = sorted(set(item) - set(allowed))
+    if extra:
+        return f'Unknown fields: {", ".join(extra)}'
+    return None
+
+
+def missing_fields(item, required):
+    """Return an error message if any required field is absent."""
+    missing = [name for name in required if item.get(name) is None]
+    if missing:
+        return f'Missing fields: {", ".join(missing)}'
+    return None
@@ -0,0 +1,86 @@
+"""
+ETag / Last-Modified validators and 304 handling for GET endpoints.
+"""
+import hashlib
+from datetime import timezone
+
+from flask import Response, request
+from werkzeug.http import parse_date, parse_etags
+
+# Clients must revalidate every time; a 304 costs one indexed query
+CACHE_CONTROL = 'no-cache'
+
+
+def _etag(*parts):
+    """Build a strong, quoted ETag from the parts."""
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return '"' + hashlib.sha1(raw.encode('utf-8')).hexdigest() + '"'
+
+
+class Validators:
+    """An ETag and Last-Modified pair for one response."""
+    
+    def __init__(self, etag, last_modified=None):
+        """Initialize with a quoted ETag and an optional naive UTC datetime."""
+        self.etag = etag
+        self.last_modified = last_modified
+    
+    @classmethod
+    def for_entity(cls, kind, obj_id, updated_at):
+        """Validators for one row, from its id and updated_at."""
+        return cls(_etag(kind, obj_id, updated_at and updated_at.isoformat()),
+                   updated_at)
+    
+    @classmethod
+    def for_collection(cls, kind, count, max_updated_at, query_string=None):
+        """
+        Validators for a list response.
+        
+        Any insert, update or delete changes the row count or the newest
+        updated_at; the query string (by default the current request's) is
+        included so every page, filter and sort gets its own tag.
+        """
+        if query_string is None:
+            query_string = request.query_string.decode('utf-8')
+        return cls(
+            _etag(kind, query_string, count,
+                  max_updated_at and max_updated_at.isoformat()),
+            max_updated_at
+        )
+    
+    @classmethod
+    def for_body(cls, data):
+        """Validators hashed from an already-serialized body."""
+        from app.utils.json_output import dumps
+        return cls('"' + hashlib.sha1(dumps(data)).hexdigest() + '"')
+    
+    def is_fresh(self, headers=None):
+        """
+        Return True if the client's cached copy is still current.
+        
+        headers are the request headers, by default the current request's.
+        """
+        headers = request.headers if headers is None else headers
+        if_none_match = parse_etags(headers.get('If-None-Match'))
+        if if_none_match:
+            return if_none_match.contains(self.etag.strip('"'))
+        since = parse_date(headers.get('If-Modified-Since'))
+        if since is not None and self.last_modified is not None:
+            # HTTP dates have whole-second precision
+            modified = self.last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+            return modified <= since
+        return False
+    
+    def headers(self):
+        """Response headers carrying these validators."""
+        headers = {'ETag': self.etag, 'Cache-Control': CACHE_CONTROL}
+        if self.last_modified is not None:
+            modified = self.last_modified.replace(tzinfo=timezone.utc)
+            headers['Last-Modified'] = modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
+        return headers
+    
+    def not_modified(self):
+        """Return a 304 response if the client is fresh, else None."""
+        if self.is_fresh():
+            return Response(status=304, headers=self.headers())
+        return None
@@ -2,29 +2,108 @@
 Custom decorators for authorization.
 """
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from urllib.parse import urlencode
+from flask import Response, current_app, request
+from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
+from flask_restx.utils import unpack
 from app.services import shared_facade
+from app.utils.json_output import output_json
+
+# WSGI environ flag marking the internal stale-while-revalidate request;
+# unlike a header, clients cannot set it
+REVALIDATE_ENVIRON = 'hbnb.response_cache.revalidate'
 
 
 def admin_required():
-    """Require admin privileges."""
+    """
+    Require admin privileges.
+    
+    The decision comes from the signed is_admin claim, so no user lookup
+    is needed. Tokens whose claim predates a role change are refused and
+    must be renewed by logging in again.
+    """
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
             try:
                 verify_jwt_in_request()
+                claims = get_jwt()
                 user_id = get_jwt_identity()
-                user = shared_facade.get_user(user_id)
-                
-                if not user:
-                    return jsonify({'error': 'User not found'}), 404
-                
-                if not user.is_admin:
-                    return jsonify({'error': 'Admin privileges required'}), 403
-                
+            except Exception:
+                return {'error': 'Authorization failed'}, 401
+            
+            if shared_facade.is_token_stale(user_id, claims.get('is_admin')):
+                return {'error': 'Token is outdated, please log in again'}, 401
+            
+            if not claims.get('is_admin'):
+                return {'error': 'Admin privileges required'}, 403
+            
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
+
+
+def _response_cache_key():
+    """Key a request by path and its query parameters in sorted order."""
+    params = sorted(request.args.items(multi=True))
+    return f'{request.path}?{urlencode(params)}'
+
+
+def _replay(entry, state):
+    """Rebuild a response from a cache entry, honouring If-None-Match."""
+    headers = dict(entry.headers)
+    etag = headers.get('ETag')
+    if etag and request.if_none_match.contains(etag.strip('"')):
+        response = Response(status=304, headers=headers)
+    else:
+        response = Response(entry.body, status=entry.status, headers=headers)
+    response.headers['X-Cache'] = 'HIT' if state == 'fresh' else 'STALE'
+    return response
+
+
+def _revalidate_request(app, full_path):
+    """Recompute a cached response by dispatching the request internally."""
+    with app.test_request_context(full_path, environ_base={REVALIDATE_ENVIRON: True}):
+        app.full_dispatch_request()
+
+
+def public_cache(*tags):
+    """
+    Serve anonymous GET responses from the shared response cache.
+    
+    Requests carrying an Authorization header bypass the cache. Only 200
+    responses are stored, keyed by path and normalized query string and
+    tagged so facade writes can invalidate them. A stale entry is served
+    while one internal request refreshes it in the background.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            cache = shared_facade.response_cache
+            if not cache.enabled:
+                return fn(*args, **kwargs)
+            if request.headers.get('Authorization'):
+                cache.record_bypass()
                 return fn(*args, **kwargs)
-            except Exception as e:
-                return jsonify({'error': 'Authorization failed'}), 401
+            
+            key = _response_cache_key()
+            if not request.environ.get(REVALIDATE_ENVIRON):
+                entry, state = cache.lookup(key)
+                if state == 'stale':
+                    cache.revalidate(key, lambda app=current_app._get_current_object(),
+                                     path=request.full_path: _revalidate_request(app, path))
+                if entry is not None:
+                    return _replay(entry, state)
+            
+            # Tokens are read first, so a write during the query still wins
+            tokens = cache.tag_tokens(tags)
+            result = fn(*args, **kwargs)
+            response = result if isinstance(result, Response) else output_json(*unpack(result))
+            if response.status_code == 200:
+                headers = [(k, v) for k, v in response.headers.items()
+                           if k != 'Content-Length']
+                cache.store(key, response.get_data(), 200, headers, tokens)
+            response.headers['X-Cache'] = 'MISS'
+            return response
         return decorator
     return wrapper
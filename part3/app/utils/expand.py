@@ -0,0 +1,41 @@
+"""
+Helpers for the ?expand= query parameter.
+"""
+
+
+def parse_expand(value, allowed):
+    """
+    Parse a comma-separated expand value into a list of dotted paths.
+    
+    Raises ValueError for paths outside allowed. Parents of nested paths
+    are implied, so 'reviews.author' also expands 'reviews'.
+    """
+    paths = [path.strip() for path in (value or '').split(',') if path.strip()]
+    unknown = [path for path in paths if path not in allowed]
+    if unknown:
+        raise ValueError(f'Cannot expand: {", ".join(unknown)}')
+    return paths
+
+
+def expansion_tree(paths):
+    """Turn dotted paths into a nested dict, e.g. {'reviews': {'author': {}}}."""
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def expanded_dict(obj, tree):
+    """Serialize obj with the relationships named in tree nested inline."""
+    result = obj.to_dict()
+    for name, subtree in tree.items():
+        value = getattr(obj, name)
+        if value is None:
+            result[name] = None
+        elif isinstance(value, list):
+            result[name] = [expanded_dict(item, subtree) for item in value]
+        else:
+            result[name] = expanded_dict(value, subtree)
+    return result
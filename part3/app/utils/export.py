@@ -0,0 +1,51 @@
+"""
+Row encoders for the streaming admin export.
+"""
+import csv
+import io
+
+from app.utils.json_output import dumps
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+def export_columns(model_class):
+    """Return the exported column names of a model, in table order."""
+    exclude = set(model_class.__serialize_exclude__)
+    return [c.name for c in model_class.__table__.columns if c.name not in exclude]
+
+
+def ndjson_lines(objects):
+    """Yield one JSON document per object, newline terminated."""
+    for obj in objects:
+        yield dumps(obj.to_dict()) + b'\n'
+
+
+def csv_lines(model_class, objects):
+    """Yield a CSV header line, then one line per object."""
+    columns = export_columns(model_class)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+    
+    writer.writerow(columns)
+    yield flush()
+    for obj in objects:
+        row = obj.to_dict()
+        writer.writerow([row.get(name, '') for name in columns])
+        yield flush()
+
+
+def encode_rows(fmt, model_class, objects):
+    """Encode objects in the requested export format."""
+    if fmt == 'csv':
+        return csv_lines(model_class, objects)
+    return ndjson_lines(objects)
@@ -0,0 +1,127 @@
+"""
+Geohash encoding and bounding-box helpers for place search.
+"""
+import math
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+MAX_PRECISION = 12
+
+
+def encode(latitude, longitude, precision=MAX_PRECISION):
+    """Encode a coordinate as a geohash string."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        rng, coord = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[value])
+            bit = 0
+            value = 0
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """Return the (lat, lng) size in degrees of a cell at the given precision."""
+    bits = 5 * precision
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _frange(start, stop, step):
+    """Yield start, start + step, ... and always stop itself."""
+    value = start
+    while value < stop:
+        yield value
+        value += step
+    yield stop
+
+
+def covering_prefixes(min_lat, min_lng, max_lat, max_lng, max_cells=32):
+    """
+    Return geohash prefixes whose cells together cover the bounding box.
+
+    Picks the finest precision that needs at most max_cells cells.
+    """
+    for precision in range(MAX_PRECISION, 0, -1):
+        lat_step, lng_step = cell_size(precision)
+        lat_cells = (max_lat - min_lat) / lat_step + 2
+        lng_cells = (max_lng - min_lng) / lng_step + 2
+        if lat_cells * lng_cells > max_cells * 4:
+            continue
+        prefixes = {
+            encode(lat, lng, precision)
+            for lat in _frange(min_lat, max_lat, lat_step)
+            for lng in _frange(min_lng, max_lng, lng_step)
+        }
+        if len(prefixes) <= max_cells:
+            return sorted(prefixes)
+    # Whole-world boxes fall back to every top-level cell
+    return list(_BASE32)
+
+
+def _wrap_longitude(longitude):
+    """Bring a longitude into [-180, 180)."""
+    return (longitude + 180.0) % 360.0 - 180.0
+
+
+def radius_bbox(latitude, longitude, radius_km):
+    """
+    Return the (min_lat, min_lng, max_lat, max_lng) box around a circle.
+
+    Longitudes wrap at the antimeridian, so a circle crossing it gives
+    min_lng > max_lng; split_bbox turns that into two boxes.
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat = max(latitude - dlat, -90.0)
+    max_lat = min(latitude + dlat, 90.0)
+    cos_lat = math.cos(math.radians(latitude))
+    if min_lat == -90.0 or max_lat == 90.0 or cos_lat < 1e-6:
+        # The circle covers a pole, and with it every longitude
+        return min_lat, -180.0, max_lat, 180.0
+    dlng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if dlng >= 180.0:
+        return min_lat, -180.0, max_lat, 180.0
+    return (
+        min_lat,
+        _wrap_longitude(longitude - dlng),
+        max_lat,
+        _wrap_longitude(longitude + dlng)
+    )
+
+
+def split_bbox(min_lat, min_lng, max_lat, max_lng):
+    """
+    Return the boxes, each with min_lng <= max_lng, covering a bounding box.
+
+    A box with min_lng > max_lng crosses the antimeridian and becomes one
+    box on each side of it.
+    """
+    if min_lng <= max_lng:
+        return [(min_lat, min_lng, max_lat, max_lng)]
+    return [(min_lat, min_lng, max_lat, 180.0), (min_lat, -180.0, max_lat, max_lng)]
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two coordinates in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = (math.sin(dphi / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
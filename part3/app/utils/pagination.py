@@ -0,0 +1,35 @@
+"""
+Keyset pagination helpers for list endpoints.
+"""
+from flask import current_app, request
+
+PAGINATION_PARAMS = {
+    'limit': 'Maximum number of items to return',
+    'cursor': 'Opaque cursor taken from the previous page\'s next_cursor'
+}
+
+
+def parse_page_args(args, config):
+    """Validate the limit/cursor parameters in args against config's page sizes."""
+    default_limit = config.get('PAGE_SIZE_DEFAULT', 50)
+    max_limit = config.get('PAGE_SIZE_MAX', 200)
+    try:
+        limit = int(args.get('limit', default_limit))
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, max_limit), args.get('cursor') or None
+
+
+def get_page_args():
+    """Read and validate the limit/cursor query parameters."""
+    return parse_page_args(request.args, current_app.config)
+
+
+def page_response(items, next_cursor):
+    """Build the paginated response body."""
+    return {
+        'items': [item.to_dict() for item in items],
+        'next_cursor': next_cursor
+    }
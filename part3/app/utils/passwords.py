@@ -0,0 +1,107 @@
+"""
+Password hashing on a bounded pool of worker processes.
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+
+class HasherBusyError(RuntimeError):
+    """Raised when too many hashing jobs are already queued."""
+
+
+def _hash(password, rounds):
+    """Hash a password with bcrypt (runs in a worker process)."""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds)
+    ).decode('utf-8')
+
+
+def _verify(password, hashed):
+    """Check a password against a bcrypt hash (runs in a worker process)."""
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+class PasswordHasher:
+    """
+    Run bcrypt off the request threads.
+    
+    Jobs go to a process pool so hashing uses every core instead of
+    contending for the GIL. At most queue_limit jobs may be pending; beyond
+    that HasherBusyError is raised so callers can shed load. With
+    workers=0 hashing runs inline, which suits tests and scripts.
+    """
+    
+    def __init__(self, rounds=12, workers=0, queue_limit=64):
+        """Initialize the hasher; the pool is created on first use."""
+        self.configure(rounds, workers, queue_limit)
+    
+    def configure(self, rounds, workers, queue_limit):
+        """Apply settings, discarding any running pool."""
+        executor = getattr(self, '_executor', None)
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False)
+        self.rounds = rounds
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._slots = threading.BoundedSemaphore(queue_limit)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+    
+    def _get_executor(self):
+        """Return the pool, recreating it in forked children."""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+            return self._executor
+    
+    def _run(self, fn, *args):
+        """Run fn in the pool, or inline when no workers are configured."""
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusyError('Password hashing queue is full')
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+    
+    def hash(self, password):
+        """Hash a password with the configured cost."""
+        return self._run(_hash, password, self.rounds)
+    
+    def hash_many(self, passwords):
+        """
+        Hash a batch of passwords across every worker.
+        
+        Meant for bulk jobs such as imports: the batch bypasses the request
+        queue limit and is spread over the pool in one map call.
+        """
+        if not self.workers:
+            return [_hash(password, self.rounds) for password in passwords]
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(self._get_executor().map(
+            _hash, passwords, [self.rounds] * len(passwords), chunksize=chunksize
+        ))
+    
+    def verify(self, password, hashed):
+        """Check a password against a stored hash."""
+        return self._run(_verify, password, hashed)
+    
+    def needs_rehash(self, hashed):
+        """Return True if a stored hash uses a different cost than configured."""
+        try:
+            return int(hashed.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+
+hasher = PasswordHasher()
@@ -0,0 +1,106 @@
+"""
+Per-request SQL query timing exposed via Server-Timing and a metrics endpoint.
+"""
+import threading
+import time
+from collections import deque
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+
+class QueryMetrics:
+    """Aggregate query counts and DB time per endpoint since startup."""
+
+    def __init__(self, slow_query_log_size=50):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._slow_queries = deque(maxlen=slow_query_log_size)
+
+    def record_request(self, endpoint, query_count, db_ms):
+        """Add one finished request to its endpoint's totals."""
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                'requests': 0, 'queries': 0, 'db_ms': 0.0, 'max_queries': 0
+            })
+            stats['requests'] += 1
+            stats['queries'] += query_count
+            stats['db_ms'] += db_ms
+            stats['max_queries'] = max(stats['max_queries'], query_count)
+
+    def record_slow_query(self, endpoint, statement, duration_ms):
+        """Remember a query slower than the threshold."""
+        with self._lock:
+            self._slow_queries.append({
+                'endpoint': endpoint,
+                'statement': statement,
+                'duration_ms': round(duration_ms, 3)
+            })
+
+    def snapshot(self):
+        """Return per-endpoint averages and the recent slow queries."""
+        with self._lock:
+            endpoints = {
+                name: {
+                    'requests': s['requests'],
+                    'avg_queries': round(s['queries'] / s['requests'], 2),
+                    'max_queries': s['max_queries'],
+                    'avg_db_ms': round(s['db_ms'] / s['requests'], 3)
+                }
+                for name, s in self._endpoints.items()
+            }
+            slow_queries = list(self._slow_queries)
+        return {'endpoints': endpoints, 'slow_queries': slow_queries}
+
+
+def _endpoint_name():
+    """Name the current request by its URL rule."""
+    rule = request.url_rule
+    return f'{request.method} {rule.rule if rule else request.path}'
+
+
+def init_query_timing(app, db):
+    """Hook query timing into the app's engine and request cycle."""
+    metrics = QueryMetrics()
+    app.extensions['query_metrics'] = metrics
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        context._hbnb_query_start = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context,
+                             executemany):
+        duration_ms = (time.perf_counter() - context._hbnb_query_start) * 1000
+        if not has_request_context() or 'query_count' not in g:
+            return
+        g.query_count += 1
+        g.query_ms += duration_ms
+        if duration_ms >= current_app.config.get('SLOW_QUERY_THRESHOLD_MS', 100):
+            endpoint = _endpoint_name()
+            metrics.record_slow_query(endpoint, statement, duration_ms)
+            current_app.logger.warning(
+                'Slow query (%.1f ms) in %s: %s', duration_ms, endpoint, statement
+            )
+
+    # Time the primary and every replica engine
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+    @app.before_request
+    def start_query_timing():
+        g.query_count = 0
+        g.query_ms = 0.0
+
+    @app.after_request
+    def add_server_timing(response):
+        if 'query_count' in g:
+            metrics.record_request(_endpoint_name(), g.query_count, g.query_ms)
+            response.headers.add(
+                'Server-Timing',
+                f'db;dur={g.query_ms:.2f};desc="{g.query_count} queries"'
+            )
+        return response
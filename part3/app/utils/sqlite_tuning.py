@@ -0,0 +1,87 @@
+"""
+SQLite pragma profile applied to every pooled connection.
+"""
+from sqlalchemy import event
+
+# Pragmas that take a keyword rather than a number
+_KEYWORD_PRAGMAS = {'journal_mode', 'synchronous', 'temp_store'}
+
+
+def _pragma_statements(pragmas):
+    """Build PRAGMA statements, rejecting anything but plain names and values."""
+    statements = []
+    for name, value in pragmas.items():
+        if not name.isidentifier():
+            raise ValueError(f'Invalid SQLite pragma: {name}')
+        if name in _KEYWORD_PRAGMAS:
+            if not str(value).isalpha():
+                raise ValueError(f'Invalid value for {name}: {value}')
+        else:
+            value = int(value)
+        statements.append(f'PRAGMA {name}={value}')
+    return statements
+
+
+def read_pragmas(dbapi_connection, names):
+    """Return the current value of each named pragma on a connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        values = {}
+        for name in names:
+            # Some pragmas (mmap_size on :memory:) return no row
+            row = cursor.execute(f'PRAGMA {name}').fetchone()
+            values[name] = row[0] if row else None
+        return values
+    finally:
+        cursor.close()
+
+
+def attach_pragmas(engine, pragmas):
+    """
+    Run the pragmas on every new connection of a (sync) engine.
+
+    busy_timeout is set first so the journal_mode switch itself waits for
+    other processes instead of failing with "database is locked".
+    """
+    pragmas = dict(pragmas)
+    if 'busy_timeout' in pragmas:
+        pragmas = {'busy_timeout': pragmas.pop('busy_timeout'), **pragmas}
+    statements = _pragma_statements(pragmas)
+
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    event.listen(engine, 'connect', apply_pragmas)
+
+
+def init_sqlite_pragmas(app, db):
+    """
+    Apply app.config['SQLITE_PRAGMAS'] on every new SQLite connection.
+
+    The values read back from a primary connection are logged and kept in
+    app.extensions['sqlite_pragmas']. Other databases are left untouched.
+    """
+    pragmas = dict(app.config.get('SQLITE_PRAGMAS') or {})
+    with app.app_context():
+        engine = db.engine
+        engines = [e for e in db.engines.values() if e.dialect.name == 'sqlite']
+    if not engines or not pragmas:
+        return
+
+    # Replicas get the same profile as the primary
+    for sqlite_engine in engines:
+        attach_pragmas(sqlite_engine, pragmas)
+    if engine.dialect.name != 'sqlite':
+        return
+
+    with engine.connect() as connection:
+        applied = read_pragmas(connection.connection.dbapi_connection, pragmas)
+    app.extensions['sqlite_pragmas'] = applied
+    app.logger.info('SQLite pragmas: %s', ', '.join(
+        f'{name}={value}' for name, value in applied.items()
+    ))
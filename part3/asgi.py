@@ -0,0 +1,10 @@
+"""
+ASGI entry point for the HBnB application.
+
+Run with an ASGI server, e.g. `uvicorn asgi:application`.
+"""
+import os
+
+from app.asgi import create_asgi_app
+
+application = create_asgi_app(os.environ.get('HBNB_CONFIG', 'production'))
@@ -0,0 +1,71 @@
+"""
+Benchmark cold start: package import plus create_app(), each run in a
+fresh interpreter the way a newly forked or autoscaled worker starts.
+
+Also times the one-off init-db + seed-admin work that create_app() used
+to repeat on every boot, for comparison.
+
+Run from part3/:  python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PART3 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Executed in a child interpreter; prints timings in milliseconds as JSON
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app('production')
+built = time.perf_counter()
+timings = {'import': imported - start, 'factory': built - imported}
+if sys.argv[1] == 'setup':
+    from app.services.bootstrap import create_schema, seed_admin
+    with app.app_context():
+        create_schema()
+        seed_admin('bench@hbnb.com', 'secret123')
+    timings['init-db + seed-admin'] = time.perf_counter() - built
+print(json.dumps({k: v * 1000 for k, v in timings.items()}))
+'''
+
+
+def run_once(mode, database_url):
+    env = dict(os.environ, DATABASE_URL=database_url, PASSWORD_HASH_WORKERS='0')
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, mode], cwd=PART3, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def report(label, samples):
+    print(label)
+    for phase in samples[0]:
+        values = [sample[phase] for sample in samples]
+        print(f'  {phase:<22} median {statistics.median(values):8.1f} ms'
+              f'   min {min(values):8.1f} ms')
+    totals = [sum(sample.values()) for sample in samples]
+    print(f'  {"total":<22} median {statistics.median(totals):8.1f} ms')
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f'sqlite:///{os.path.join(tmp, "bench.db")}'
+        report('worker boot (import + create_app):',
+               [run_once('boot', database_url) for _ in range(runs)])
+        # A fresh database each run so seeding really hashes a password
+        report('first boot with one-off setup:', [
+            run_once('setup', f'sqlite:///{os.path.join(tmp, f"setup{i}.db")}')
+            for i in range(runs)
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -12,13 +12,101 @@ class Config:
     # SQLAlchemy configuration
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///hbnb.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ECHO = True
+    SQLALCHEMY_ECHO = False
+    
+    # Read replicas; SELECTs are routed to them, writes to the primary
+    SQLALCHEMY_REPLICA_URIS = [
+        uri for uri in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if uri
+    ]
+    
+    # Applied to every SQLite connection (ignored for other databases).
+    # WAL lets readers run alongside a writer; busy_timeout (ms) makes
+    # writers from other processes wait instead of failing as locked.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'mmap_size': 268435456,
+        'cache_size': -65536,
+        'temp_store': 'MEMORY'
+    }
+    
+    # Query instrumentation: queries slower than this are logged and reported
+    SLOW_QUERY_THRESHOLD_MS = 100
     
     # JWT configuration
     JWT_TOKEN_LOCATION = ['headers']
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
     JWT_ACCESS_TOKEN_EXPIRES = 3600
+    JWT_REFRESH_TOKEN_EXPIRES = 30 * 24 * 3600
+    # Seconds during which a just-spent refresh token returns the pair it
+    # was exchanged for, so tabs refreshing together keep their session
+    JWT_REFRESH_REUSE_GRACE = 10
+    # Let flask-jwt-extended answer token errors (401) through flask-restx
+    PROPAGATE_EXCEPTIONS = True
+    
+    # Store behind every 'shared' backend below: redis://host:6379/0 (needs
+    # the redis package), sqlite:///file.db (one file shared by the workers
+    # of a host; relative paths live in the instance folder) or memory://
+    # (this process only, the fallback when unset)
+    SHARED_STORE_URL = os.environ.get('SHARED_STORE_URL')
+    
+    # Spent refresh tokens and revoked sessions: 'memory' (per process) or
+    # 'shared' (seen by every worker; required with several workers)
+    TOKEN_REVOCATION_BACKEND = os.environ.get('TOKEN_REVOCATION_BACKEND', 'memory')
+    
+    # Login throttling: token buckets per client IP and per email, as
+    # (burst, attempts per minute). Backend 'memory', 'shared' or None
+    LOGIN_THROTTLE_BACKEND = os.environ.get('LOGIN_THROTTLE_BACKEND', 'memory')
+    LOGIN_THROTTLE_PER_IP = (20, 10)
+    LOGIN_THROTTLE_PER_EMAIL = (5, 2)
+    
+    # Reverse proxies in front of the app that append to X-Forwarded-For.
+    # The client IP used for throttling is taken that many hops back;
+    # 0 trusts no header and uses the socket's peer address
+    TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', 0))
+    
+    # Account created by `flask hbnb seed-admin`
+    ADMIN_EMAIL = os.environ.get('ADMIN_EMAIL', 'admin@hbnb.com')
+    ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'secret123')
+    
+    # Password hashing: bcrypt cost, worker processes and max queued jobs
+    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+    PASSWORD_HASH_QUEUE_LIMIT = 64
+    
+    # Keyset pagination for list endpoints
+    PAGE_SIZE_DEFAULT = 50
+    PAGE_SIZE_MAX = 200
+    
+    # Largest radius accepted by radius search, in kilometres
+    SEARCH_RADIUS_MAX_KM = 500
+    
+    # Batch create endpoints
+    BATCH_MAX_ITEMS = 1000
+    
+    # Rows fetched per round trip by the streaming admin export
+    EXPORT_BATCH_SIZE = 1000
+    
+    # Rows validated and inserted per transaction by `flask hbnb import`
+    IMPORT_CHUNK_SIZE = 5000
+    
+    # Admin stats snapshot lifetime (seconds) and optional background refresh
+    ADMIN_STATS_TTL = 30
+    ADMIN_STATS_BACKGROUND_REFRESH = False
+    
+    # Entity cache for get_user/get_place/get_amenity: 'memory', 'shared' or None
+    ENTITY_CACHE_BACKEND = os.environ.get('ENTITY_CACHE_BACKEND', 'memory')
+    ENTITY_CACHE_TTL = 60
+    ENTITY_CACHE_SIZE = 10000
+    
+    # Anonymous list responses: fresh for TTL seconds, then served stale
+    # while refreshing until STALE_TTL. Backend 'memory', 'shared' or None
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')
+    RESPONSE_CACHE_TTL = 10
+    RESPONSE_CACHE_STALE_TTL = 60
+    RESPONSE_CACHE_SIZE = 1000
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -29,10 +117,44 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///hbnb_prod.db'
-    SQLALCHEMY_ECHO = False
+    
+    # Pre-fork server (`python -m app.serve`); 0 workers sizes to the cores.
+    # Workers are recycled after MAX_REQUESTS (+ random jitter) requests and
+    # get GRACEFUL_TIMEOUT seconds to finish in-flight requests on shutdown.
+    SERVER_BIND = os.environ.get('HBNB_BIND', '0.0.0.0:5003')
+    SERVER_WORKERS = int(os.environ.get('HBNB_WORKERS', 0))
+    SERVER_MAX_REQUESTS = int(os.environ.get('HBNB_MAX_REQUESTS', 1000))
+    SERVER_MAX_REQUESTS_JITTER = 100
+    SERVER_TIMEOUT = 30
+    SERVER_GRACEFUL_TIMEOUT = 30
+    SERVER_KEEPALIVE = 5
+    
+    # Each pre-forked worker is a process of its own and the worker count
+    # already follows the cores, so workers hash passwords inline. A bcrypt
+    # pool per worker would start workers x pool size processes in total
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0))
+    
+    # Workers must agree on revoked tokens, login attempts and cached
+    # entities and responses (a write in one worker invalidates them for
+    # all); app.serve refuses to start several workers while any of this
+    # state is kept per process
+    SHARED_STORE_URL = os.environ.get('SHARED_STORE_URL', 'sqlite:///hbnb_shared.db')
+    TOKEN_REVOCATION_BACKEND = os.environ.get('TOKEN_REVOCATION_BACKEND', 'shared')
+    LOGIN_THROTTLE_BACKEND = os.environ.get('LOGIN_THROTTLE_BACKEND', 'shared')
+    ENTITY_CACHE_BACKEND = os.environ.get('ENTITY_CACHE_BACKEND', 'shared')
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'shared')
+
+class TestingConfig(Config):
+    """Testing configuration."""
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    ADMIN_STATS_TTL = 0
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_HASH_WORKERS = 0
 
 config = {
     'development': DevelopmentConfig,
+    'testing': TestingConfig,
     'production': ProductionConfig,
     'default': DevelopmentConfig
 }
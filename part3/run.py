@@ -6,4 +6,15 @@ from app import create_app
 app = create_app()
 
 if __name__ == '__main__':
+    # Development server only; deploy with `python -m app.serve`.
+    # The dev server sets up its own database; deployed workers expect
+    # `flask hbnb init-db` and `flask hbnb seed-admin` to have run
+    from app.services import shared_facade
+    from app.services.bootstrap import create_schema, seed_admin
+    with app.app_context():
+        if create_schema():
+            # An older database gained columns; fill them in
+            shared_facade.backfill_place_geohashes()
+            shared_facade.recompute_place_ratings()
+        seed_admin(app.config['ADMIN_EMAIL'], app.config['ADMIN_PASSWORD'])
     app.run(debug=True, host='0.0.0.0', port=5003)  # Changed to port 5003
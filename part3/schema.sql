@@ -24,11 +24,16 @@ CREATE TABLE places (
     price DECIMAL(10, 2) NOT NULL CHECK (price > 0),
     latitude FLOAT NOT NULL CHECK (latitude BETWEEN -90 AND 90),
     longitude FLOAT NOT NULL CHECK (longitude BETWEEN -180 AND 180),
+    geohash VARCHAR(12),
     owner_id VARCHAR(36) NOT NULL,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    avg_rating FLOAT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE,
-    INDEX idx_owner (owner_id)
+    INDEX idx_owner (owner_id),
+    INDEX idx_geohash (geohash)
 );
 
 CREATE TABLE amenities (
@@ -48,7 +53,7 @@ CREATE TABLE reviews (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-    INDEX idx_place (place_id),
+    UNIQUE INDEX uq_reviews_place_id_user_id (place_id, user_id),
     INDEX idx_user (user_id)
 );
 
@@ -62,6 +67,11 @@ CREATE TABLE place_amenity (
 );
 
 CREATE INDEX idx_places_price ON places(price);
+CREATE INDEX idx_places_avg_rating ON places(avg_rating);
 CREATE INDEX idx_reviews_rating ON reviews(rating);
 CREATE INDEX idx_amenities_name ON amenities(name);
+CREATE INDEX idx_users_updated_at ON users(updated_at, id);
+CREATE INDEX idx_places_updated_at ON places(updated_at, id);
+CREATE INDEX idx_reviews_updated_at ON reviews(updated_at, id);
+CREATE INDEX idx_amenities_updated_at ON amenities(updated_at, id);
 EOF
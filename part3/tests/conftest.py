@@ -0,0 +1,21 @@
+"""Shared fixtures for HBnB tests."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import create_app
+from app.models.db import db
+from app.services.bootstrap import create_schema, seed_admin
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        create_schema()
+        seed_admin(app.config['ADMIN_EMAIL'], app.config['ADMIN_PASSWORD'])
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,45 @@
+"""Tests for claim-based admin authorization."""
+from app.persistence.shared_store import SQLiteSharedStore
+from app.services import shared_facade as facade
+from app.services.role_cache import REVOKED, RoleChangeCache
+
+
+def _login(client, email, password):
+    token = client.post('/api/v1/auth/login', json={
+        'email': email, 'password': password
+    }).get_json()['access_token']
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_role_change_invalidates_old_claims(app):
+    user = facade.create_user({'first_name': 'Eve', 'last_name': 'Ops',
+                               'email': 'eve@example.com', 'password': 'pw'})
+    client = app.test_client()
+    admin = _login(client, 'admin@hbnb.com', 'secret123')
+    eve_before = _login(client, 'eve@example.com', 'pw')
+    assert client.get('/api/v1/admin/stats', headers=eve_before).status_code == 403
+
+    response = client.put(f'/api/v1/admin/users/{user.id}/toggle-admin', headers=admin)
+    assert response.status_code == 200
+
+    # The non-admin token is now outdated; a fresh login carries the new role
+    assert client.get('/api/v1/admin/stats', headers=eve_before).status_code == 401
+    eve_after = _login(client, 'eve@example.com', 'pw')
+    assert client.get('/api/v1/admin/stats', headers=eve_after).status_code == 200
+
+    facade.update_user(user.id, {'is_admin': False})
+    assert client.get('/api/v1/admin/stats', headers=eve_after).status_code == 401
+
+
+def test_role_changes_reach_other_workers(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    worker_a = RoleChangeCache(client=SQLiteSharedStore(path))
+    worker_b = RoleChangeCache(client=SQLiteSharedStore(path))
+
+    worker_a.record('u1', True)
+    worker_a.record('u2', REVOKED)
+
+    assert worker_b.is_stale('u1', False)
+    assert not worker_b.is_stale('u1', True)
+    assert worker_b.is_stale('u2', True) and worker_b.is_stale('u2', False)
+    assert not worker_b.is_stale('u3', False)
@@ -0,0 +1,65 @@
+"""Tests for the streaming admin export."""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _headers(client):
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'secret123'
+    }).get_json()['access_token']
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _create_amenities(names):
+    return facade.create_amenities([{'name': name} for name in names])
+
+
+def test_ndjson_export_streams_every_row(app):
+    _create_amenities(['Wifi', 'Pool', 'Gym'])
+    client = app.test_client()
+
+    response = client.get('/api/v1/admin/export/amenities', headers=_headers(client))
+
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.get_data().splitlines()]
+    assert sorted(row['name'] for row in rows) == ['Gym', 'Pool', 'Wifi']
+
+
+def test_csv_export_has_header_and_hides_passwords(app):
+    client = app.test_client()
+
+    response = client.get('/api/v1/admin/export/users?format=csv',
+                          headers=_headers(client))
+
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert 'password' not in rows[0]
+    assert rows[1][rows[0].index('email')] == 'admin@hbnb.com'
+
+
+def test_updated_since_filters_rows(app):
+    old, new = _create_amenities(['Old', 'New'])
+    old.updated_at = datetime.utcnow() - timedelta(days=2)
+    db.session.commit()
+    since = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    client = app.test_client()
+
+    response = client.get(f'/api/v1/admin/export/amenities?updated_since={since}',
+                          headers=_headers(client))
+
+    names = [json.loads(line)['name'] for line in response.get_data().splitlines()]
+    assert names == ['New']
+
+
+def test_export_rejects_unknown_entity_and_format(app):
+    client = app.test_client()
+    headers = _headers(client)
+
+    assert client.get('/api/v1/admin/export/secrets', headers=headers).status_code == 404
+    assert client.get('/api/v1/admin/export/users?format=xml',
+                      headers=headers).status_code == 400
@@ -0,0 +1,34 @@
+"""Tests for the cached admin statistics endpoint."""
+from app.services import shared_facade as facade
+
+
+def _admin_headers(client):
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'secret123'
+    }).get_json()['access_token']
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_stats_counts_entities(app):
+    facade.create_user({'first_name': 'A', 'last_name': 'B',
+                        'email': 'a@example.com', 'password': 'pw'})
+    facade.create_amenity({'name': 'Wifi'})
+    client = app.test_client()
+
+    stats = client.get('/api/v1/admin/stats', headers=_admin_headers(client)).get_json()
+
+    assert stats['total_users'] == 2
+    assert stats['admin_users'] == 1
+    assert stats['total_amenities'] == 1
+    assert stats['total_places'] == 0
+
+
+def test_stats_snapshot_is_reused_within_ttl(app):
+    facade.stats.ttl = 60
+    try:
+        first = facade.stats.refresh()
+        facade.create_amenity({'name': 'Pool'})
+        assert facade.get_stats() is first
+        assert facade.stats.refresh()['total_amenities'] == 1
+    finally:
+        facade.stats.ttl = 0
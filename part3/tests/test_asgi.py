@@ -0,0 +1,112 @@
+"""Tests for the ASGI entry point and the async read path."""
+import asyncio
+import json
+
+import pytest
+
+from app.asgi import create_asgi_app
+from app.models.db import db
+from app.services.bootstrap import create_schema, seed_admin
+from app.services import shared_facade as facade
+from config import TestingConfig
+
+
+@pytest.fixture
+def asgi_app(tmp_path, monkeypatch):
+    # aiosqlite opens its own connections, so the database must be a file
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI',
+                        f'sqlite:///{tmp_path / "asgi.db"}')
+    application = create_asgi_app('testing')
+    flask_app = application.flask_app
+    with flask_app.app_context():
+        create_schema()
+        seed_admin(flask_app.config['ADMIN_EMAIL'], flask_app.config['ADMIN_PASSWORD'])
+        owner = facade.get_user_by_email('admin@hbnb.com')
+        facade.create_place({'title': 'Loft', 'description': 'd', 'price': 50.0,
+                             'latitude': 1.0, 'longitude': 2.0, 'owner_id': owner.id})
+        facade.create_place({'title': 'Barn', 'description': 'd', 'price': 80.0,
+                             'latitude': 1.0, 'longitude': 2.0, 'owner_id': owner.id})
+    yield application
+    asyncio.run(application.facade.dispose())
+    with flask_app.app_context():
+        db.engine.dispose()
+
+
+def request(application, path, query=b'', headers=(), method='GET'):
+    """Run one request through the ASGI app; return (status, headers, body)."""
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'raw_path': path.encode(),
+        'query_string': query, 'root_path': '', 'scheme': 'http', 'http_version': '1.1',
+        'headers': [(k.lower().encode(), v.encode()) for k, v in headers],
+        'server': ('testserver', 80), 'client': ('127.0.0.1', 1234)
+    }
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application(scope, receive, send))
+    start = sent[0]
+    response_headers = {k.decode().lower(): v.decode() for k, v in start['headers']}
+    body = b''.join(m.get('body', b'') for m in sent[1:])
+    return start['status'], response_headers, body
+
+
+def test_native_list_matches_flask(asgi_app):
+    status, headers, body = request(asgi_app, '/api/v1/places/', b'sort=-price&limit=1')
+    expected = asgi_app.flask_app.test_client().get('/api/v1/places/?sort=-price&limit=1')
+
+    assert status == 200
+    assert json.loads(body) == expected.get_json()
+    assert json.loads(body)['items'][0]['title'] == 'Barn'
+    assert headers['etag'] == expected.headers['ETag']
+    assert 'server-timing' not in headers  # not routed through Flask
+
+
+def test_native_detail_revalidates(asgi_app):
+    _, _, body = request(asgi_app, '/api/v1/places/')
+    place_id = json.loads(body)['items'][0]['id']
+
+    status, headers, body = request(asgi_app, f'/api/v1/places/{place_id}')
+    assert status == 200
+    assert json.loads(body)['id'] == place_id
+
+    status, _, body = request(asgi_app, f'/api/v1/places/{place_id}',
+                              headers=[('If-None-Match', headers['etag'])])
+    assert (status, body) == (304, b'')
+
+    status, _, body = request(asgi_app, '/api/v1/places/missing')
+    assert (status, json.loads(body)) == (404, {'error': 'Place not found'})
+
+
+def test_invalid_parameters_are_400(asgi_app):
+    status, _, body = request(asgi_app, '/api/v1/places/', b'sort=size')
+    assert (status, json.loads(body)) == (400, {'error': 'Unknown sort: size'})
+
+
+def test_other_routes_fall_back_to_flask(asgi_app):
+    # Search, expansions and writes are served by the Flask app
+    status, headers, body = request(asgi_app, '/api/v1/places/search', b'q=loft')
+    assert status == 200
+    assert 'server-timing' in headers
+    assert json.loads(body)['items'][0]['title'] == 'Loft'
+
+    status, _, _ = request(asgi_app, '/api/v1/places/', method='POST')
+    assert status == 401
+
+
+def test_lifespan_disposes_engines(asgi_app):
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    asyncio.run(asgi_app({'type': 'lifespan'}, receive, send))
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
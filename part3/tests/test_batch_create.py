@@ -0,0 +1,82 @@
+"""Tests for batch create endpoints."""
+from sqlalchemy.exc import IntegrityError
+
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _headers(client, email, password):
+    token = client.post('/api/v1/auth/login', json={
+        'email': email, 'password': password
+    }).get_json()['access_token']
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _place(title, price=50.0):
+    return {'title': title, 'description': 'Nice', 'price': price,
+            'latitude': 1.0, 'longitude': 2.0}
+
+
+def test_place_batch_reports_per_item_results(app):
+    client = app.test_client()
+    headers = _headers(client, 'admin@hbnb.com', 'secret123')
+
+    response = client.post('/api/v1/places/batch', headers=headers, json=[
+        _place('A'), _place('Bad', price=-1), _place('B'), {'title': 'C'}
+    ])
+
+    body = response.get_json()
+    assert response.status_code == 207
+    assert (body['created'], body['failed']) == (2, 2)
+    assert [r['status'] for r in body['results']] == [201, 400, 201, 400]
+    assert body['results'][2]['item']['geohash']
+    assert facade.count_places() == 2
+
+
+def test_review_batch_updates_ratings_once_per_place(app):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    places = facade.create_places([
+        dict(_place(t), owner_id=owner.id) for t in ('X', 'Y')
+    ])
+    place_ids = [p.id for p in places]
+    facade.create_user({'first_name': 'G', 'last_name': 'U',
+                        'email': 'g@example.com', 'password': 'pw'})
+    client = app.test_client()
+    headers = _headers(client, 'g@example.com', 'pw')
+
+    response = client.post('/api/v1/reviews/batch', headers=headers, json=[
+        {'text': 'ok', 'rating': 4, 'place_id': place_ids[0]},
+        {'text': 'again', 'rating': 1, 'place_id': place_ids[0]},
+        {'text': 'good', 'rating': 5, 'place_id': place_ids[1]},
+    ])
+
+    assert response.status_code == 207
+    assert [r['status'] for r in response.get_json()['results']] == [201, 400, 201]
+    db.session.expunge_all()
+    assert facade.get_place(place_ids[0]).avg_rating == 4.0
+    assert facade.get_place(place_ids[1]).review_count == 1
+
+
+def test_amenity_batch_rejects_non_list(app):
+    client = app.test_client()
+    headers = _headers(client, 'admin@hbnb.com', 'secret123')
+    assert client.post('/api/v1/amenities/batch', headers=headers,
+                       json={'name': 'Wifi'}).status_code == 400
+    response = client.post('/api/v1/amenities/batch', headers=headers,
+                           json=[{'name': 'Wifi'}, {'name': 'Pool'}])
+    assert response.status_code == 201
+
+
+def test_batch_constraint_failure_hides_database_error(app, monkeypatch):
+    def create_amenities(items):
+        raise IntegrityError('INSERT INTO amenities', {}, Exception('UNIQUE constraint failed'))
+
+    monkeypatch.setattr(facade, 'create_amenities', create_amenities)
+    client = app.test_client()
+    headers = _headers(client, 'admin@hbnb.com', 'secret123')
+
+    response = client.post('/api/v1/amenities/batch', headers=headers,
+                           json=[{'name': 'Sauna'}])
+
+    assert response.status_code == 400
+    assert 'UNIQUE' not in response.get_json()['error']
@@ -0,0 +1,90 @@
+"""Tests for lean app startup and the init-db/seed-admin commands."""
+from sqlalchemy import inspect
+
+from app import create_app
+from app.cli import hbnb_cli
+from app.models.db import db
+from app.models.user import User
+
+
+def test_create_app_touches_no_tables():
+    app = create_app('testing')
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+
+
+def test_init_db_and_seed_admin_are_idempotent():
+    app = create_app('testing')
+    runner = app.test_cli_runner()
+    with app.app_context():
+        assert runner.invoke(hbnb_cli, ['init-db']).exit_code == 0
+        first = runner.invoke(hbnb_cli, ['seed-admin', '--password', 'pw'])
+        second = runner.invoke(hbnb_cli, ['seed-admin'])
+
+        assert 'Admin user created: admin@hbnb.com' in first.output
+        assert 'already exists' in second.output
+        admins = User.query.filter_by(is_admin=True).all()
+        assert len(admins) == 1 and admins[0].verify_password('pw')
+        db.drop_all()
+
+
+def test_init_db_upgrades_old_places_table_and_backfills_geohash():
+    app = create_app('testing')
+    runner = app.test_cli_runner()
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('DROP TABLE places')
+            connection.exec_driver_sql(
+                'CREATE TABLE places (id VARCHAR(36) PRIMARY KEY, title VARCHAR(100) NOT NULL, '
+                'description TEXT NOT NULL, price FLOAT NOT NULL, latitude FLOAT NOT NULL, '
+                'longitude FLOAT NOT NULL, owner_id VARCHAR(36) NOT NULL, '
+                'created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)'
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO places VALUES ('p1', 'Old', 'Kept', 10.0, -33.8688, 151.2093, "
+                "'u1', '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+            )
+
+        upgraded = runner.invoke(hbnb_cli, ['init-db'])
+        backfilled = runner.invoke(hbnb_cli, ['backfill-geohash'])
+
+        assert 'places.geohash' in upgraded.output
+        assert 'Backfilled geohash for 1 places' in backfilled.output
+        columns = {col['name'] for col in inspect(db.engine).get_columns('places')}
+        assert {'geohash', 'review_count', 'avg_rating'} <= columns
+        client = app.test_client()
+        body = client.get(
+            '/api/v1/places/search/bbox?min_lat=-34&min_lng=151&max_lat=-33&max_lng=152'
+        ).get_json()
+        assert [p['title'] for p in body['items']] == ['Old']
+        db.session.remove()
+        db.drop_all()
+
+
+def test_init_db_refuses_unique_index_over_duplicate_reviews():
+    app = create_app('testing')
+    runner = app.test_cli_runner()
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('DROP INDEX uq_reviews_place_id_user_id')
+            for review_id in ('r1', 'r2'):
+                connection.exec_driver_sql(
+                    "INSERT INTO reviews (id, text, rating, place_id, user_id, created_at, "
+                    f"updated_at) VALUES ('{review_id}', 'Twice', 4, 'p1', 'u1', "
+                    "'2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+                )
+
+        refused = runner.invoke(hbnb_cli, ['init-db'])
+        assert refused.exit_code == 1
+        assert 'uq_reviews_place_id_user_id' in refused.stderr
+        assert 'p1, u1' in refused.stderr
+
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM reviews WHERE id = 'r2'")
+        assert runner.invoke(hbnb_cli, ['init-db']).exit_code == 0
+        indexes = {index['name'] for index in inspect(db.engine).get_indexes('reviews')}
+        assert 'uq_reviews_place_id_user_id' in indexes
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,94 @@
+"""Tests for the `flask hbnb import` bulk loader."""
+import json
+
+from app.cli import hbnb_cli
+from app.services import shared_facade as facade
+
+
+def _run(app, *args):
+    return app.test_cli_runner().invoke(hbnb_cli, ['import', *args])
+
+
+def test_import_users_from_csv_rejects_duplicates(app, tmp_path):
+    path = tmp_path / 'users.csv'
+    path.write_text(
+        'first_name,last_name,email,password\n'
+        'Ann,Lee,ann@example.com,pw1\n'
+        'Bob,Ray,BOB@example.com,pw2\n'
+        'Dup,Ann,ann@example.com,pw3\n'
+        'Old,Admin,admin@hbnb.com,pw4\n'
+        'No,Email,,pw5\n'
+    )
+
+    result = _run(app, 'users', str(path))
+
+    assert result.exit_code == 0, result.output
+    assert 'Imported 2 users' in result.stdout
+    assert 'line 4: Email already registered' in result.stderr
+    assert 'line 6: Missing fields: email' in result.stderr
+    bob = facade.get_user_by_email('bob@example.com')
+    assert bob.verify_password('pw2')
+
+
+def test_import_places_and_reviews_resolves_keys(app, tmp_path):
+    facade.create_user({'first_name': 'G', 'last_name': 'U',
+                        'email': 'guest@example.com', 'password': 'pw'})
+    places = tmp_path / 'places.ndjson'
+    places.write_text('\n'.join(json.dumps(row) for row in [
+        {'title': 'Loft', 'description': 'd', 'price': '80', 'latitude': 1.5,
+         'longitude': 2.5, 'owner_email': 'admin@hbnb.com'},
+        {'title': 'Ghost', 'description': 'd', 'price': 10, 'latitude': 0,
+         'longitude': 0, 'owner_email': 'nobody@example.com'}
+    ]))
+
+    result = _run(app, 'places', str(places), '--chunk-size', '1')
+
+    assert 'Imported 1 places' in result.stdout
+    assert 'line 2: Owner not found' in result.stderr
+    place = facade.get_all_places()[0]
+    assert place.geohash.startswith('s0')
+
+    reviews = tmp_path / 'reviews.csv'
+    reviews.write_text(
+        'text,rating,place_id,user_email\n'
+        f'Great,4,{place.id},guest@example.com\n'
+        f'Again,5,{place.id},guest@example.com\n'
+        f'Mine,5,{place.id},admin@hbnb.com\n'
+    )
+
+    result = _run(app, 'reviews', str(reviews))
+
+    assert 'Imported 1 reviews' in result.stdout
+    assert 'line 3: You have already reviewed this place' in result.stderr
+    assert 'line 4: You cannot review your own place' in result.stderr
+    place = facade.get_place(place.id)
+    assert (place.review_count, place.avg_rating) == (1, 4.0)
+
+
+def test_import_reports_unreadable_lines_and_continues(app, tmp_path):
+    amenities = tmp_path / 'amenities.ndjson'
+    amenities.write_text('{"name": "Sauna"}\n{"name": \n[1, 2]\n{"name": "Pool"}\n')
+
+    result = _run(app, 'amenities', str(amenities))
+
+    assert 'Imported 2 amenities' in result.stdout
+    assert 'line 2: Invalid JSON' in result.stderr
+    assert 'line 3: Row must be a JSON object' in result.stderr
+
+
+def test_import_rejects_wrong_typed_fields_per_row(app, tmp_path):
+    users = tmp_path / 'users.ndjson'
+    users.write_text('\n'.join(json.dumps(row) for row in [
+        {'first_name': 'A', 'last_name': 'B', 'email': 5, 'password': 'pw'},
+        {'first_name': 'C', 'last_name': 'D', 'email': 'cd@example.com', 'password': 'pw'},
+    ]))
+    amenities = tmp_path / 'amenities.ndjson'
+    amenities.write_text('{"name": ["x"]}\n{"name": "Pool"}\n')
+
+    result = _run(app, 'users', str(users))
+    assert 'Imported 1 users' in result.stdout
+    assert 'line 1: email must be a string' in result.stderr
+
+    result = _run(app, 'amenities', str(amenities))
+    assert 'Imported 1 amenities' in result.stdout
+    assert 'line 1: name must be a string' in result.stderr
@@ -0,0 +1,83 @@
+"""Tests for ETag / Last-Modified conditional GETs."""
+from app.services import shared_facade as facade
+
+
+def _place(owner_id, title='Loft'):
+    return facade.create_place({'title': title, 'description': 'd', 'price': 50.0,
+                                'latitude': 1.0, 'longitude': 2.0,
+                                'owner_id': owner_id})
+
+
+def test_place_detail_revalidates_with_etag(app):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place = _place(owner.id)
+    client = app.test_client()
+    url = f'/api/v1/places/{place.id}'
+
+    first = client.get(url)
+    etag = first.headers['ETag']
+    assert first.headers['Last-Modified']
+    assert first.headers['Cache-Control'] == 'no-cache'
+
+    second = client.get(url, headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.get_data() == b''
+
+    facade.update_place(place.id, {'price': 60.0})
+    third = client.get(url, headers={'If-None-Match': etag})
+    assert third.status_code == 200
+    assert third.headers['ETag'] != etag
+
+
+def test_if_modified_since_on_detail(app):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    client = app.test_client()
+    url = f'/api/v1/users/{owner.id}'
+
+    last_modified = client.get(url).headers['Last-Modified']
+
+    assert client.get(url, headers={'If-Modified-Since': last_modified}).status_code == 304
+
+
+def test_collection_etag_changes_on_insert_and_per_query(app):
+    facade.create_amenity({'name': 'Wifi'})
+    client = app.test_client()
+
+    etag = client.get('/api/v1/amenities/').headers['ETag']
+    assert client.get('/api/v1/amenities/',
+                      headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/v1/amenities/?limit=1',
+                      headers={'If-None-Match': etag}).status_code == 200
+
+    facade.create_amenity({'name': 'Pool'})
+    assert client.get('/api/v1/amenities/',
+                      headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_expanded_place_uses_body_etag(app):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place = _place(owner.id)
+    client = app.test_client()
+    url = f'/api/v1/places/{place.id}?expand=owner'
+
+    etag = client.get(url).headers['ETag']
+
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_missing_entity_is_404(app):
+    assert app.test_client().get('/api/v1/reviews/nope').status_code == 404
+
+
+def test_amenity_detail_revalidates_with_etag(app):
+    amenity = facade.create_amenity({'name': 'Sauna'})
+    client = app.test_client()
+    url = f'/api/v1/amenities/{amenity.id}'
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.get_json()['name'] == 'Sauna'
+    etag = first.headers['ETag']
+
+    second = client.get(url, headers={'If-None-Match': etag})
+    assert second.status_code == 304
@@ -0,0 +1,41 @@
+"""Tests for the one-review-per-place rule."""
+import pytest
+
+from app.persistence.review_repository import DuplicateReviewError
+from app.services import shared_facade as facade
+
+
+def _setup():
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place = facade.create_place({
+        'title': 'Flat', 'description': 'Nice', 'price': 60.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+    })
+    guest = facade.create_user({'first_name': 'G', 'last_name': 'U',
+                                'email': 'g@example.com', 'password': 'pw'})
+    return place.id, guest.id
+
+
+def test_second_review_by_same_user_is_rejected(app):
+    place_id, _ = _setup()
+    client = app.test_client()
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'g@example.com', 'password': 'pw'
+    }).get_json()['access_token']
+    headers = {'Authorization': f'Bearer {token}'}
+    review = {'text': 'Good', 'rating': 4, 'place_id': place_id}
+
+    assert client.post('/api/v1/reviews/', json=review, headers=headers).status_code == 201
+    second = client.post('/api/v1/reviews/', json=dict(review), headers=headers)
+    assert second.status_code == 400
+    assert second.get_json()['error'] == 'You have already reviewed this place'
+
+
+def test_unique_index_catches_racing_insert(app):
+    place_id, guest_id = _setup()
+    review = {'text': 'Good', 'rating': 4, 'place_id': place_id, 'user_id': guest_id}
+    facade.create_review(review)
+
+    with pytest.raises(DuplicateReviewError):
+        facade.create_review(dict(review))
+    assert facade.get_place(place_id).review_count == 1
@@ -0,0 +1,76 @@
+"""Tests for the read-through entity cache."""
+import pytest
+
+from app.models.db import db
+from app.persistence.cache import LocalSharedStore, SharedCacheBackend, entity_cache
+from app.services import shared_facade as facade
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def cached_app(app, request):
+    if request.param == 'shared':
+        entity_cache.configure(SharedCacheBackend(LocalSharedStore()))
+    yield app
+
+
+def test_get_reads_through_and_counts(cached_app):
+    amenity = facade.create_amenity({'name': 'Sauna'})
+    amenity_id = amenity.id
+    db.session.expunge_all()
+
+    first = facade.get_amenity(amenity_id)
+    db.session.expunge_all()
+    second = facade.get_amenity(amenity_id)
+
+    assert first.name == second.name == 'Sauna'
+    stats = facade.get_cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+
+def test_writes_invalidate(cached_app):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place_id = facade.create_place({
+        'title': 'Old', 'description': 'Nice', 'price': 40.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+    }).id
+    facade.get_place(place_id)
+    facade.update_place(place_id, {'title': 'New'})
+    db.session.expunge_all()
+    assert facade.get_place(place_id).title == 'New'
+
+    facade.delete_place(place_id)
+    assert facade.get_place(place_id) is None
+
+
+def test_cascaded_deletes_are_evicted(cached_app):
+    host = facade.create_user({'first_name': 'Hal', 'last_name': 'Host',
+                               'email': 'hal@example.com', 'password': 'pw'})
+    place_id = facade.create_place({
+        'title': 'Gone', 'description': 'Nice', 'price': 40.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': host.id
+    }).id
+    assert facade.get_place(place_id) is not None
+
+    assert facade.delete_user(host.id)
+    db.session.expunge_all()
+    assert facade.get_place(place_id) is None
+
+
+def test_shared_entries_are_json_without_passwords(app):
+    store = LocalSharedStore()
+    entity_cache.configure(SharedCacheBackend(store))
+    user = facade.create_user({'first_name': 'Sam', 'last_name': 'Secret',
+                               'email': 'sam@example.com', 'password': 'pw'})
+    user_id, created_at = user.id, user.created_at
+    db.session.expunge_all()
+    facade.get_user(user_id)
+
+    raw = store.get(f'hbnb:entity:User:{user_id}')
+    assert raw.startswith(b'{') and b'password' not in raw
+
+    db.session.expunge_all()
+    cached = facade.get_user(user_id)
+    assert entity_cache.stats()['hits'] == 1
+    assert cached.created_at == created_at
+    # The hash is read from the database, not left as None
+    assert cached.verify_password('pw')
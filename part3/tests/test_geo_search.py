@@ -0,0 +1,65 @@
+"""Tests for geospatial place search."""
+from app.services import shared_facade as facade
+from app.utils import geohash
+
+
+def _make_place(title, lat, lng):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    return facade.create_place({
+        'title': title, 'description': 'Nice', 'price': 50.0,
+        'latitude': lat, 'longitude': lng, 'owner_id': owner.id
+    })
+
+
+def test_geohash_encode_known_value():
+    assert geohash.encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+
+
+def test_radius_search_returns_nearest_first(app):
+    _make_place('Louvre', 48.8606, 2.3376)
+    _make_place('Eiffel', 48.8584, 2.2945)
+    _make_place('Lyon', 45.7640, 4.8357)
+
+    body = app.test_client().get(
+        '/api/v1/places/search?lat=48.8606&lng=2.3376&radius_km=10'
+    ).get_json()
+
+    assert [p['title'] for p in body['items']] == ['Louvre', 'Eiffel']
+    assert body['items'][0]['distance_km'] == 0
+
+
+def test_geohash_follows_coordinate_updates(app):
+    place = _make_place('Moving', 10.0, 10.0)
+    facade.update_place(place.id, {'latitude': -33.8688, 'longitude': 151.2093})
+
+    body = app.test_client().get(
+        '/api/v1/places/search/bbox?min_lat=-34&min_lng=151&max_lat=-33&max_lng=152'
+    ).get_json()
+    assert [p['title'] for p in body['items']] == ['Moving']
+
+
+def test_radius_search_crosses_antimeridian(app):
+    _make_place('Taveuni', -16.8, 179.9)
+    _make_place('Samoa side', -16.8, -179.9)
+    _make_place('Far west', -16.8, 170.0)
+
+    body = app.test_client().get(
+        '/api/v1/places/search?lat=-16.8&lng=179.95&radius_km=50'
+    ).get_json()
+    assert sorted(p['title'] for p in body['items']) == ['Samoa side', 'Taveuni']
+
+    body = app.test_client().get(
+        '/api/v1/places/search/bbox?min_lat=-17&min_lng=179&max_lat=-16&max_lng=-179'
+    ).get_json()
+    assert sorted(p['title'] for p in body['items']) == ['Samoa side', 'Taveuni']
+
+
+def test_radius_search_is_bounded(app):
+    for i in range(6):
+        _make_place(f'P{i}', 10.0 + i * 0.01, 20.0)
+
+    results = facade.search_places_near(10.0, 20.0, 50, limit=2)
+    assert [place.title for place, _ in results] == ['P0', 'P1']
+
+    response = app.test_client().get('/api/v1/places/search?lat=10&lng=20&radius_km=20000')
+    assert response.status_code == 400
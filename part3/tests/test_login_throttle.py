@@ -0,0 +1,74 @@
+"""Tests for login throttling."""
+import pytest
+
+from app import create_app
+from app.models.db import db
+from app.services.login_throttle import (
+    LoginThrottle, MemoryBucketStore, SharedBucketStore, login_throttle
+)
+from app.persistence.cache import LocalSharedStore
+from app.persistence.shared_store import SQLiteSharedStore
+from app.utils import passwords
+from config import TestingConfig
+
+
+@pytest.fixture(params=['memory', 'local', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryBucketStore(shards=4)
+    if request.param == 'local':
+        return SharedBucketStore(LocalSharedStore())
+    return SharedBucketStore(SQLiteSharedStore(str(tmp_path / 'shared.db')))
+
+
+def test_bucket_refills_at_rate(store):
+    # Burst of 2, one token back every 30 seconds
+    assert store.take('k', 2, 1 / 30, now=0.0) == 0
+    assert store.take('k', 2, 1 / 30, now=0.0) == 0
+    assert store.take('k', 2, 1 / 30, now=10.0) == pytest.approx(20.0)
+    assert store.take('k', 2, 1 / 30, now=30.0) == 0
+    assert store.take('other', 2, 1 / 30, now=30.0) == 0
+
+
+def test_email_limit_spans_ips():
+    throttle = LoginThrottle(MemoryBucketStore(), ip_limit=(100, 60), email_limit=(2, 1))
+    assert throttle.check('10.0.0.1', 'A@x.com') == 0
+    assert throttle.check('10.0.0.2', 'a@x.com ') == 0
+    assert throttle.check('10.0.0.3', 'a@x.com') == 60
+    assert throttle.check('10.0.0.3', 'b@x.com') == 0
+
+
+def test_blocked_login_skips_lookup_and_bcrypt(app, monkeypatch):
+    login_throttle.limits['email'] = (1, 1)
+    client = app.test_client()
+    credentials = {'email': 'admin@hbnb.com', 'password': 'wrong'}
+    assert client.post('/api/v1/auth/login', json=credentials).status_code == 401
+
+    def fail(*args):
+        raise AssertionError('bcrypt ran for a throttled attempt')
+
+    monkeypatch.setattr(passwords, '_verify', fail)
+    response = client.post('/api/v1/auth/login', json=credentials)
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '60'
+
+
+
+def _ip_blocked(app, forwarded_for):
+    client = app.test_client()
+    response = client.post('/api/v1/auth/login', json={'email': 'a@x.com', 'password': 'pw'},
+                           headers={'X-Forwarded-For': forwarded_for})
+    return response.status_code == 429
+
+
+@pytest.mark.parametrize('hops, blocked', [(0, True), (1, False)])
+def test_client_ip_from_trusted_proxy_hops(monkeypatch, hops, blocked):
+    monkeypatch.setattr(TestingConfig, 'TRUSTED_PROXY_HOPS', hops)
+    monkeypatch.setattr(TestingConfig, 'LOGIN_THROTTLE_PER_IP', (1, 1))
+    monkeypatch.setattr(TestingConfig, 'LOGIN_THROTTLE_PER_EMAIL', (100, 60))
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        assert not _ip_blocked(app, '203.0.113.1')
+        assert _ip_blocked(app, '203.0.113.2') is blocked
+        db.drop_all()
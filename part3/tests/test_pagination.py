@@ -0,0 +1,35 @@
+"""Tests for keyset pagination on list endpoints."""
+from app.services import shared_facade as facade
+
+
+def _make_places(count):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    for i in range(count):
+        facade.create_place({
+            'title': f'Place {i}', 'description': 'Nice', 'price': 10.0 + i,
+            'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+        })
+
+
+def test_places_are_paged_with_cursor(app):
+    _make_places(5)
+    client = app.test_client()
+
+    first = client.get('/api/v1/places/?limit=2').get_json()
+    assert len(first['items']) == 2
+    assert first['next_cursor']
+
+    seen = [p['id'] for p in first['items']]
+    cursor = first['next_cursor']
+    while cursor:
+        page = client.get(f'/api/v1/places/?limit=2&cursor={cursor}').get_json()
+        seen.extend(p['id'] for p in page['items'])
+        cursor = page['next_cursor']
+
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_invalid_pagination_args_are_rejected(app):
+    client = app.test_client()
+    assert client.get('/api/v1/places/?limit=abc').status_code == 400
+    assert client.get('/api/v1/places/?cursor=not-a-cursor').status_code == 400
@@ -0,0 +1,34 @@
+"""Tests for pooled password hashing and rehash-on-login."""
+import pytest
+
+from app.services import shared_facade as facade
+from app.utils.passwords import HasherBusyError, PasswordHasher, hasher
+
+
+def test_pool_hashes_and_sheds_load():
+    pool = PasswordHasher(rounds=4, workers=1, queue_limit=1)
+    hashed = pool.hash('secret')
+    assert pool.verify('secret', hashed)
+    assert not pool.needs_rehash(hashed)
+
+    pool._slots.acquire()
+    with pytest.raises(HasherBusyError):
+        pool.hash('secret')
+    pool._slots.release()
+    pool.configure(4, 0, 1)
+
+
+def test_login_rehashes_when_cost_changes(app):
+    user = facade.create_user({'first_name': 'R', 'last_name': 'H',
+                               'email': 'rehash@example.com', 'password': 'pw'})
+    assert user.password.startswith('$2b$04$')
+
+    hasher.rounds = 5
+    try:
+        response = app.test_client().post('/api/v1/auth/login', json={
+            'email': 'rehash@example.com', 'password': 'pw'
+        })
+        assert response.status_code == 200
+        assert facade.get_user(user.id).password.startswith('$2b$05$')
+    finally:
+        hasher.rounds = 4
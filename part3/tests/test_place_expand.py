@@ -0,0 +1,44 @@
+"""Tests for ?expand= eager loading on place detail."""
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _place_with_related():
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place = facade.create_place({
+        'title': 'Cabin', 'description': 'Cosy', 'price': 70.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+    })
+    place.amenities.append(facade.create_amenity({'name': 'Fireplace'}))
+    db.session.commit()
+    for i in range(3):
+        guest = facade.create_user({'first_name': 'G', 'last_name': str(i),
+                                    'email': f'g{i}@example.com', 'password': 'pw'})
+        facade.create_review({'text': 'Lovely', 'rating': 5,
+                              'place_id': place.id, 'user_id': guest.id})
+    place_id = place.id
+    db.session.remove()
+    return place_id
+
+
+def test_expand_embeds_related_data_in_constant_queries(app):
+    place_id = _place_with_related()
+
+    response = app.test_client().get(
+        f'/api/v1/places/{place_id}?expand=owner,amenities,reviews.author'
+    )
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['owner']['email'] == 'admin@hbnb.com'
+    assert 'password' not in body['owner']
+    assert [a['name'] for a in body['amenities']] == ['Fireplace']
+    assert sorted(r['author']['last_name'] for r in body['reviews']) == ['0', '1', '2']
+    # place+owner, amenities, reviews+authors: independent of the row count
+    assert '3 queries' in response.headers['Server-Timing']
+
+
+def test_unknown_expansion_is_rejected(app):
+    place_id = _place_with_related()
+    response = app.test_client().get(f'/api/v1/places/{place_id}?expand=owner.places')
+    assert response.status_code == 400
@@ -0,0 +1,58 @@
+"""Tests for server-side place filtering and sorting."""
+from app.services import shared_facade as facade
+
+
+def _setup_places():
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    guest = facade.create_user({
+        'first_name': 'Guest', 'last_name': 'User',
+        'email': 'guest@example.com', 'password': 'pw'
+    })
+    places = {}
+    for title, price in [('Cheap', 20.0), ('Mid', 80.0), ('Luxury', 300.0)]:
+        places[title] = facade.create_place({
+            'title': title, 'description': 'Nice', 'price': price,
+            'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+        })
+    facade.create_review({'text': 'Great', 'rating': 5,
+                          'place_id': places['Mid'].id, 'user_id': guest.id})
+    facade.create_review({'text': 'Meh', 'rating': 2,
+                          'place_id': places['Luxury'].id, 'user_id': guest.id})
+    return places
+
+
+def _titles(client, query):
+    body = client.get(f'/api/v1/places/?{query}').get_json()
+    return [p['title'] for p in body['items']]
+
+
+def test_price_range_and_sort(app):
+    _setup_places()
+    client = app.test_client()
+    assert _titles(client, 'max_price=100&sort=-price') == ['Mid', 'Cheap']
+    assert _titles(client, 'min_price=50&sort=price') == ['Mid', 'Luxury']
+
+
+def test_rating_filter_and_sort(app):
+    _setup_places()
+    client = app.test_client()
+    assert _titles(client, 'min_rating=4') == ['Mid']
+    assert _titles(client, 'sort=-rating') == ['Mid', 'Luxury', 'Cheap']
+
+
+def test_sorted_pages_follow_cursor(app):
+    _setup_places()
+    client = app.test_client()
+    first = client.get('/api/v1/places/?sort=-price&limit=2').get_json()
+    second = client.get(
+        f"/api/v1/places/?sort=-price&limit=2&cursor={first['next_cursor']}"
+    ).get_json()
+    assert [p['title'] for p in first['items'] + second['items']] == \
+        ['Luxury', 'Mid', 'Cheap']
+    assert client.get(
+        f"/api/v1/places/?sort=price&cursor={first['next_cursor']}"
+    ).status_code == 400
+
+
+def test_unknown_sort_is_rejected(app):
+    assert app.test_client().get('/api/v1/places/?sort=title').status_code == 400
@@ -0,0 +1,25 @@
+"""Tests for per-request query instrumentation."""
+
+
+def test_server_timing_header_reports_queries(app):
+    response = app.test_client().get('/api/v1/places/')
+    header = response.headers['Server-Timing']
+    assert header.startswith('db;dur=')
+    assert 'queries' in header
+
+
+def test_metrics_endpoint_aggregates_by_route(app):
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = 0
+    client = app.test_client()
+    client.get('/api/v1/amenities/')
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'secret123'
+    }).get_json()['access_token']
+
+    metrics = client.get('/api/v1/admin/metrics',
+                         headers={'Authorization': f'Bearer {token}'}).get_json()
+
+    stats = metrics['endpoints']['GET /api/v1/amenities/']
+    assert stats['requests'] == 1
+    assert stats['avg_queries'] >= 1
+    assert metrics['slow_queries'][0]['endpoint'] == 'GET /api/v1/amenities/'
@@ -0,0 +1,100 @@
+"""Tests for denormalized place rating aggregates."""
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _place_and_guests():
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    place = facade.create_place({
+        'title': 'Loft', 'description': 'Nice', 'price': 90.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': owner.id
+    })
+    guests = [
+        facade.create_user({'first_name': 'G', 'last_name': str(i),
+                            'email': f'g{i}@example.com', 'password': 'pw'})
+        for i in range(2)
+    ]
+    return place, guests
+
+
+def _aggregates(place_id):
+    place = facade.get_place(place_id)
+    db.session.refresh(place)
+    return place.review_count, place.rating_sum, place.avg_rating
+
+
+def test_review_writes_maintain_aggregates(app):
+    place, guests = _place_and_guests()
+    first = facade.create_review({'text': 'A', 'rating': 4,
+                                  'place_id': place.id, 'user_id': guests[0].id})
+    facade.create_review({'text': 'B', 'rating': 2,
+                          'place_id': place.id, 'user_id': guests[1].id})
+    assert _aggregates(place.id) == (2, 6, 3.0)
+
+    facade.update_review(first.id, {'rating': 5})
+    assert _aggregates(place.id) == (2, 7, 3.5)
+
+    facade.delete_review(first.id)
+    assert _aggregates(place.id) == (1, 2, 2.0)
+
+
+def test_recompute_ratings_command_repairs_drift(app):
+    place, guests = _place_and_guests()
+    facade.create_review({'text': 'A', 'rating': 3,
+                          'place_id': place.id, 'user_id': guests[0].id})
+    place.review_count, place.rating_sum, place.avg_rating = 0, 0, 0.0
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['hbnb', 'recompute-ratings'])
+    assert 'Recomputed rating aggregates for 1 places' in result.output
+    assert _aggregates(place.id) == (1, 3, 3.0)
+
+
+def test_deleting_a_reviewer_removes_their_ratings(app):
+    place, guests = _place_and_guests()
+    facade.create_review({'text': 'A', 'rating': 4,
+                          'place_id': place.id, 'user_id': guests[0].id})
+    facade.create_review({'text': 'B', 'rating': 2,
+                          'place_id': place.id, 'user_id': guests[1].id})
+
+    assert facade.delete_user(guests[0].id)
+    assert _aggregates(place.id) == (1, 2, 2.0)
+
+
+def test_owner_cannot_write_rating_aggregates(app):
+    place, _ = _place_and_guests()
+    client = app.test_client()
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'secret123'
+    }).get_json()['access_token']
+
+    response = client.put(f'/api/v1/places/{place.id}',
+                          json={'title': 'Loft', 'avg_rating': 5.0, 'review_count': 99},
+                          headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 400
+    assert 'avg_rating' in response.get_json()['error']
+    assert _aggregates(place.id) == (0, 0, 0.0)
+
+
+def test_review_cannot_move_to_another_place(app):
+    place, guests = _place_and_guests()
+    other = facade.create_place({
+        'title': 'Barn', 'description': 'Nice', 'price': 30.0,
+        'latitude': 0.0, 'longitude': 0.0, 'owner_id': place.owner_id
+    })
+    review = facade.create_review({'text': 'A', 'rating': 5,
+                                   'place_id': place.id, 'user_id': guests[0].id})
+    client = app.test_client()
+    token = client.post('/api/v1/auth/login', json={
+        'email': 'g0@example.com', 'password': 'pw'
+    }).get_json()['access_token']
+
+    response = client.put(f'/api/v1/reviews/{review.id}',
+                          json={'rating': 4, 'place_id': other.id},
+                          headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 400
+    assert 'place_id' in response.get_json()['error']
+
+    facade.update_review(review.id, {'rating': 4, 'place_id': other.id})
+    assert _aggregates(place.id) == (1, 4, 4.0)
+    assert _aggregates(other.id) == (0, 0, 0.0)
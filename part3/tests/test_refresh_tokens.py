@@ -0,0 +1,104 @@
+"""Tests for refresh-token rotation and session revocation."""
+from flask_jwt_extended import decode_token
+
+from app.services.token_store import (
+    MemoryRevocationStore, SharedRevocationStore, token_revocations
+)
+from app.persistence.cache import LocalSharedStore
+from app.utils import passwords
+
+
+def _login(client):
+    return client.post('/api/v1/auth/login', json={
+        'email': 'admin@hbnb.com', 'password': 'secret123'
+    }).get_json()
+
+
+def _bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _jti(token):
+    return decode_token(token)['jti']
+
+
+def test_refresh_rotates_without_bcrypt(app, monkeypatch):
+    client = app.test_client()
+    tokens = _login(client)
+
+    def fail(*args):
+        raise AssertionError('bcrypt ran during a refresh')
+
+    monkeypatch.setattr(passwords, '_verify', fail)
+    response = client.post('/api/v1/auth/refresh', headers=_bearer(tokens['refresh_token']))
+    assert response.status_code == 200
+    rotated = response.get_json()
+    assert rotated['refresh_token'] != tokens['refresh_token']
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(rotated['access_token'])).status_code == 200
+
+    # Access tokens cannot refresh
+    assert client.post('/api/v1/auth/refresh',
+                       headers=_bearer(rotated['access_token'])).status_code == 422
+
+
+def test_reused_refresh_token_revokes_session(app, monkeypatch):
+    monkeypatch.setattr(token_revocations, 'reuse_grace', 0)
+    client = app.test_client()
+    tokens = _login(client)
+    rotated = client.post('/api/v1/auth/refresh',
+                          headers=_bearer(tokens['refresh_token'])).get_json()
+
+    # Replaying the spent token ends the whole session
+    assert client.post('/api/v1/auth/refresh',
+                       headers=_bearer(tokens['refresh_token'])).status_code == 401
+    assert client.post('/api/v1/auth/refresh',
+                       headers=_bearer(rotated['refresh_token'])).status_code == 401
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(rotated['access_token'])).status_code == 401
+
+    # Other sessions are unaffected
+    other = _login(client)
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(other['access_token'])).status_code == 200
+
+
+def test_duplicate_refresh_within_grace_returns_same_pair(app):
+    client = app.test_client()
+    tokens = _login(client)
+    first = client.post('/api/v1/auth/refresh', headers=_bearer(tokens['refresh_token']))
+    second = client.post('/api/v1/auth/refresh', headers=_bearer(tokens['refresh_token']))
+
+    # A second tab refreshing at the same moment keeps the session
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+    rotated = first.get_json()
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(rotated['access_token'])).status_code == 200
+
+    # Once the grace has passed, the spent token is a replay again
+    token_revocations.store.discard(f"rotated:{_jti(tokens['refresh_token'])}")
+    assert client.post('/api/v1/auth/refresh',
+                       headers=_bearer(tokens['refresh_token'])).status_code == 401
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(rotated['access_token'])).status_code == 401
+
+
+def test_logout_revokes_access_tokens(app):
+    client = app.test_client()
+    tokens = _login(client)
+    response = client.post('/api/v1/auth/logout', headers=_bearer(tokens['refresh_token']))
+    assert response.status_code == 200
+    assert client.get('/api/v1/admin/stats',
+                      headers=_bearer(tokens['access_token'])).status_code == 401
+
+
+def test_revocation_stores_record_once():
+    for store in (MemoryRevocationStore(), SharedRevocationStore(LocalSharedStore())):
+        assert store.add('jti:1', 60) is True
+        assert store.add('jti:1', 60) is False
+        assert store.contains('jti:1')
+        assert not store.contains('jti:2')
+        store.discard('jti:1')
+        assert store.add('jti:1', 60, b'pair') is True
+        assert store.get('jti:1') == b'pair'
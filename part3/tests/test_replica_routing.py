@@ -0,0 +1,54 @@
+"""Tests for read/write routing between the primary and a replica."""
+import pytest
+
+from app import create_app
+from app.models.db import db
+from app.persistence.replication import SQLiteReplicaCopier
+from app.services.bootstrap import create_schema
+from app.services import shared_facade as facade
+from config import TestingConfig
+
+
+@pytest.fixture
+def replicated_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI',
+                        f'sqlite:///{tmp_path / "primary.db"}')
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_REPLICA_URIS',
+                        [f'sqlite:///{tmp_path / "replica.db"}'])
+    app = create_app('testing')
+    with app.app_context():
+        create_schema()
+        copier = SQLiteReplicaCopier.from_db(db)
+        copier.sync()
+    yield app, copier
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def test_reads_go_to_replica_until_synced(replicated_app):
+    app, copier = replicated_app
+    with app.app_context():
+        facade.create_amenity({'name': 'Wifi'})
+
+    # A fresh request reads the replica, which has not caught up yet
+    with app.app_context():
+        assert facade.count_amenities() == 0
+    copier.sync()
+    with app.app_context():
+        assert facade.count_amenities() == 1
+
+
+def test_session_reads_its_own_writes(replicated_app):
+    app, _ = replicated_app
+    with app.app_context():
+        assert facade.count_amenities() == 0
+        facade.create_amenity({'name': 'Pool'})
+        assert facade.count_amenities() == 1
+        assert [a.name for a in facade.get_all_amenities()] == ['Pool']
+
+
+def test_without_replicas_everything_uses_primary(app):
+    facade.create_amenity({'name': 'Gym'})
+    assert db.session.get_bind() is db.engine
+    assert facade.count_amenities() == 1
@@ -0,0 +1,64 @@
+"""Tests for the public response cache."""
+from app.models.amenity import Amenity
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _names(response):
+    return [item['name'] for item in response.get_json()['items']]
+
+
+def test_anonymous_lists_are_cached_until_a_write(app):
+    facade.create_amenity({'name': 'Wifi'})
+    client = app.test_client()
+
+    first = client.get('/api/v1/amenities/?limit=5')
+    second = client.get('/api/v1/amenities/?limit=5')
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json() == first.get_json()
+
+    facade.create_amenity({'name': 'Pool'})
+    third = client.get('/api/v1/amenities/?limit=5')
+    assert third.headers['X-Cache'] == 'MISS'
+    assert sorted(_names(third)) == ['Pool', 'Wifi']
+
+    stats = facade.get_response_cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+
+
+def test_cached_hit_answers_if_none_match(app):
+    client = app.test_client()
+    etag = client.get('/api/v1/reviews/').headers['ETag']
+
+    response = client.get('/api/v1/reviews/', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['X-Cache'] == 'HIT'
+
+
+def test_authorized_requests_bypass_the_cache(app):
+    client = app.test_client()
+    client.get('/api/v1/places/')
+
+    response = client.get('/api/v1/places/', headers={'Authorization': 'Bearer x'})
+
+    assert 'X-Cache' not in response.headers
+    assert facade.get_response_cache_stats()['bypasses'] == 1
+
+
+def test_stale_entry_is_served_while_refreshing(app):
+    cache = facade.response_cache
+    cache.ttl = 0
+    cache.run_refresh = lambda job: job()
+    client = app.test_client()
+    client.get('/api/v1/amenities/')
+
+    # A write that bypasses the facade is only picked up by revalidation
+    db.session.add(Amenity('Sauna'))
+    db.session.commit()
+    stale = client.get('/api/v1/amenities/')
+    refreshed = client.get('/api/v1/amenities/')
+
+    assert stale.headers['X-Cache'] == 'STALE'
+    assert _names(stale) == []
+    assert _names(refreshed) == ['Sauna']
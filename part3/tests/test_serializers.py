@@ -0,0 +1,16 @@
+"""Tests for compiled model serializers and the JSON representation."""
+from app.services import shared_facade as facade
+
+
+def test_user_serializer_excludes_password(app):
+    user = facade.get_user_by_email('admin@hbnb.com')
+    data = user.to_dict()
+    assert 'password' not in data
+    assert data['email'] == 'admin@hbnb.com'
+    assert data['created_at'] == user.created_at.isoformat()
+
+
+def test_responses_are_compact_json(app):
+    response = app.test_client().get('/api/v1/amenities/')
+    assert response.mimetype == 'application/json'
+    assert response.get_data() == b'{"items":[],"next_cursor":null}'
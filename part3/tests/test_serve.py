@@ -0,0 +1,67 @@
+"""Tests for the pre-fork production server setup."""
+import multiprocessing
+
+from app import create_app
+from app.models.db import db
+import pytest
+
+from app.serve import (
+    HBnBServer, check_workers, dispose_engines, server_options, worker_count
+)
+from config import ProductionConfig
+
+
+def test_worker_count_sizes_to_cores():
+    assert worker_count(3) == 3
+    assert worker_count(0) == multiprocessing.cpu_count() * 2 + 1
+
+
+def test_server_loads_production_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProductionConfig, 'SQLALCHEMY_DATABASE_URI',
+                        f'sqlite:///{tmp_path / "prod.db"}')
+    monkeypatch.setattr(ProductionConfig, 'SHARED_STORE_URL',
+                        f'sqlite:///{tmp_path / "shared.db"}')
+    app = create_app('production')
+    server = HBnBServer(app, server_options(app.config))
+
+    assert server.cfg.preload_app is True
+    assert server.cfg.bind == [ProductionConfig.SERVER_BIND]
+    assert server.cfg.max_requests == ProductionConfig.SERVER_MAX_REQUESTS
+    assert server.cfg.graceful_timeout == ProductionConfig.SERVER_GRACEFUL_TIMEOUT
+    assert server.load() is app
+
+    # A forked worker starts with a fresh pool
+    with app.app_context():
+        pool = db.engine.pool
+        dispose_engines(app, close=False)
+        assert db.engine.pool is not pool
+    dispose_engines(app)
+
+
+def test_several_workers_need_shared_security_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProductionConfig, 'SQLALCHEMY_DATABASE_URI',
+                        f'sqlite:///{tmp_path / "prod.db"}')
+    monkeypatch.setattr(ProductionConfig, 'SHARED_STORE_URL',
+                        f'sqlite:///{tmp_path / "shared.db"}')
+    create_app('production')
+    check_workers(4)
+
+    # Per-process caches would keep serving entries another worker changed
+    monkeypatch.setattr(ProductionConfig, 'ENTITY_CACHE_BACKEND', 'memory')
+    monkeypatch.setattr(ProductionConfig, 'RESPONSE_CACHE_BACKEND', 'memory')
+    create_app('production')
+    with pytest.raises(RuntimeError, match='ENTITY_CACHE_BACKEND, RESPONSE_CACHE_BACKEND'):
+        check_workers(4)
+
+    monkeypatch.setattr(ProductionConfig, 'SHARED_STORE_URL', None)
+    monkeypatch.setattr(ProductionConfig, 'ENTITY_CACHE_BACKEND', 'shared')
+    monkeypatch.setattr(ProductionConfig, 'RESPONSE_CACHE_BACKEND', 'shared')
+    create_app('production')
+    check_workers(1)
+    with pytest.raises(RuntimeError, match='TOKEN_REVOCATION_BACKEND, LOGIN_THROTTLE_BACKEND'):
+        check_workers(4)
+
+
+def test_workers_hash_passwords_inline():
+    # One process per worker; a bcrypt pool each would multiply them
+    assert ProductionConfig.PASSWORD_HASH_WORKERS == 0
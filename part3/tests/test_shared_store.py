@@ -0,0 +1,53 @@
+"""Tests for the cross-process shared store clients."""
+import multiprocessing
+import time
+
+import pytest
+
+from app.persistence.cache import LocalSharedStore
+from app.persistence.shared_store import SQLiteSharedStore, create_shared_client
+from app.services.token_store import SharedRevocationStore
+
+
+def test_sqlite_store_set_nx_and_expiry(tmp_path):
+    store = SQLiteSharedStore(str(tmp_path / 'shared.db'))
+
+    assert store.set('k', b'1', ex=60, nx=True)
+    assert store.set('k', b'2', ex=60, nx=True) is None
+    assert store.get('k') == b'1'
+
+    store.set('short', b'1', ex=0.01)
+    time.sleep(0.02)
+    assert store.get('short') is None
+    assert store.set('short', b'2', nx=True)
+    assert sorted(store.scan_iter('*')) == ['k', 'short']
+    assert store.delete('k', 'missing') == 1
+
+
+def _spend_in_child(path, queue):
+    queue.put(SharedRevocationStore(SQLiteSharedStore(path)).add('jti:abc', 60))
+
+
+def test_sqlite_store_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    revocations = SharedRevocationStore(SQLiteSharedStore(path))
+    queue = multiprocessing.get_context('fork').Queue()
+
+    child = multiprocessing.get_context('fork').Process(
+        target=_spend_in_child, args=(path, queue)
+    )
+    child.start()
+    child.join(10)
+
+    assert queue.get(timeout=1) is True
+    assert revocations.contains('jti:abc')
+    assert revocations.add('jti:abc', 60) is False
+
+
+def test_create_shared_client(tmp_path):
+    assert create_shared_client(None) is None
+    assert isinstance(create_shared_client('memory://'), LocalSharedStore)
+    client = create_shared_client('sqlite:///shared.db', base_dir=str(tmp_path))
+    assert client.path == str(tmp_path / 'shared.db')
+    with pytest.raises(ValueError):
+        create_shared_client('ftp://example.com')
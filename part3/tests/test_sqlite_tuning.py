@@ -0,0 +1,34 @@
+"""Tests for the SQLite pragma profile."""
+import pytest
+
+from app import create_app
+from app.models.db import db
+from app.utils.sqlite_tuning import _pragma_statements, read_pragmas
+from config import TestingConfig
+
+
+def test_pragmas_applied_to_file_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI',
+                        f'sqlite:///{tmp_path / "tuned.db"}')
+    app = create_app('testing')
+    with app.app_context():
+        applied = app.extensions['sqlite_pragmas']
+        assert applied['journal_mode'] == 'wal'
+        assert applied['synchronous'] == 1
+        assert applied['busy_timeout'] == 5000
+        assert applied['temp_store'] == 2
+
+        # Every pooled connection gets the profile, not just the first
+        with db.engine.connect() as connection:
+            values = read_pragmas(connection.connection.dbapi_connection,
+                                  ['cache_size', 'busy_timeout'])
+        assert values == {'cache_size': -65536, 'busy_timeout': 5000}
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_pragma_values_are_validated():
+    with pytest.raises(ValueError):
+        _pragma_statements({'journal_mode': 'WAL; DROP TABLE users'})
+    with pytest.raises(ValueError):
+        _pragma_statements({'cache_size': 'lots'})
@@ -0,0 +1,98 @@
+"""Tests for keyword search over places."""
+from sqlalchemy import text
+
+from app.cli import hbnb_cli
+from app.models.db import db
+from app.services import shared_facade as facade
+
+
+def _places(titles_and_descriptions):
+    owner = facade.get_user_by_email('admin@hbnb.com')
+    return facade.create_places([
+        {'title': title, 'description': description, 'price': 50.0,
+         'latitude': 1.0, 'longitude': 2.0, 'owner_id': owner.id}
+        for title, description in titles_and_descriptions
+    ])
+
+
+def _search(client, query):
+    return client.get(f'/api/v1/places/search?{query}').get_json()
+
+
+def test_keyword_search_ranks_and_highlights(app):
+    _places([
+        ('City loft', 'Quiet flat near the beach promenade'),
+        ('Beach house', 'Steps from the beach'),
+        ('Mountain cabin', 'Snowy peaks'),
+    ])
+    client = app.test_client()
+
+    body = _search(client, 'q=beach')
+
+    assert [p['title'] for p in body['items']] == ['Beach house', 'City loft']
+    assert body['items'][0]['rank'] < body['items'][1]['rank']
+    assert '**beach**' in body['items'][1]['snippet'].lower()
+
+
+def test_prefix_match_and_pagination(app):
+    _places([(f'Seaside {i}', 'Ocean views') for i in range(3)])
+    client = app.test_client()
+
+    first = _search(client, 'q=seas&limit=2')
+    second = _search(client, f'q=seas&limit=2&cursor={first["next_cursor"]}')
+
+    assert len(first['items']) == 2 and second['next_cursor'] is None
+    ids = [p['id'] for p in first['items'] + second['items']]
+    assert len(set(ids)) == 3
+
+
+def test_index_follows_updates_and_deletes(app):
+    place, other = _places([('Old title', 'Plain'), ('Gone', 'Plain')])
+    facade.update_place(place.id, {'title': 'Renovated villa'})
+    facade.delete_place(other.id)
+    client = app.test_client()
+
+    assert _search(client, 'q=villa')['items'][0]['id'] == place.id
+    assert _search(client, 'q=old')['items'] == []
+    assert _search(client, 'q=gone')['items'] == []
+
+
+def test_rebuild_command_indexes_existing_rows(app):
+    _places([('Harbour studio', 'Boats')])
+    db.session.execute(text("INSERT INTO places_fts(places_fts) VALUES ('delete-all')"))
+    db.session.commit()
+    client = app.test_client()
+    facade.response_cache.clear()
+    assert _search(client, 'q=harbour')['items'] == []
+
+    result = app.test_cli_runner().invoke(hbnb_cli, ['rebuild-search'])
+
+    assert 'Indexed 1 places' in result.output
+    facade.response_cache.clear()
+    assert len(_search(client, 'q=harbour')['items']) == 1
+
+
+def test_like_fallback(app):
+    _places([('Garden_room', 'Lovely garden')])
+    repo = facade._get_repo('Place')
+
+    results, _ = repo._search_like(['garden'], 10, None)
+
+    assert results[0][1] is None
+    assert results[0][2] == 'Lovely **garden**'
+
+
+def test_search_requires_words(app):
+    client = app.test_client()
+    assert client.get('/api/v1/places/search?q=%20!').status_code == 400
+
+
+def test_vacuum_command_rebuilds_index(app):
+    _places([('Harbour studio', 'Boats'), ('Hill cabin', 'Pines')])
+
+    result = app.test_cli_runner().invoke(hbnb_cli, ['vacuum'])
+
+    assert 'Indexed 2 places' in result.output
+    facade.response_cache.clear()
+    titles = [p['title'] for p in _search(app.test_client(), 'q=cabin')['items']]
+    assert titles == ['Hill cabin']
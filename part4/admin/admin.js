@@ -3,17 +3,9 @@
 
    // ==================== AUTHENTICATION ====================
    
-   function getCookie(name) {
-       const value = `; ${document.cookie}`;
-       const parts = value.split(`; ${name}=`);
-       if (parts.length === 2) {
-           return parts.pop().split(';').shift();
-       }
-       return null;
-   }
-   
-   function checkAdminAuth() {
-       const token = getCookie('token');
+   async function checkAdminAuth() {
+       // An expired access token is renewed from the refresh token
+       const token = await getAccessToken();
        
        // If on login page, allow access
        if (window.location.pathname.includes('login.html')) {
@@ -52,15 +44,15 @@
            if (response.ok) {
                const data = await response.json();
                
-               // Store token
-               document.cookie = `token=${data.access_token}; path=/; max-age=3600`;
+               // Store the access and refresh tokens
+               storeTokens(data);
                
                // Verify user is admin (check JWT claims)
                const tokenPayload = JSON.parse(atob(data.access_token.split('.')[1]));
                
                if (!tokenPayload.is_admin) {
                    alert('Access denied. Admin privileges required.');
-                   document.cookie = 'token=; path=/; max-age=0';
+                   await endSession();
                    return;
                }
                
@@ -76,20 +68,19 @@
        }
    }
    
-   function logout() {
-       document.cookie = 'token=; path=/; max-age=0';
+   async function logout() {
+       await endSession();
        alert('Logged out successfully!');
        window.location.href = 'login.html';
    }
    
    // ==================== DASHBOARD ====================
    
-   async function loadDashboardStats(token) {
+   async function loadDashboardStats() {
        try {
-           const response = await fetch(`${API_BASE_URL}/admin/stats`, {
+           const response = await authFetch(`${API_BASE_URL}/admin/stats`, {
                method: 'GET',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                }
            });
@@ -109,20 +100,43 @@
        }
    }
    
-   // ==================== USERS MANAGEMENT ====================
+   // ==================== LISTS ====================
    
-   async function loadUsers(token) {
-       try {
-           const response = await fetch(`${API_BASE_URL}/users/`, {
+   // Admin tables show every row: follow next_cursor until the last page.
+   // Returns null if any page fails to load.
+   const LIST_PAGE_SIZE = 200;
+   
+   async function fetchAllItems(path) {
+       const items = [];
+       let cursor = null;
+       do {
+           const params = new URLSearchParams({ limit: LIST_PAGE_SIZE });
+           if (cursor) {
+               params.set('cursor', cursor);
+           }
+           const response = await authFetch(`${API_BASE_URL}${path}?${params}`, {
                method: 'GET',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                }
            });
+           if (!response.ok) {
+               return null;
+           }
+           const page = await response.json();
+           items.push(...page.items);
+           cursor = page.next_cursor;
+       } while (cursor);
+       return items;
+   }
    
-           if (response.ok) {
-               const users = await response.json();
+   // ==================== USERS MANAGEMENT ====================
+   
+   async function loadUsers() {
+       try {
+           const users = await fetchAllItems('/users/');
+   
+           if (users) {
                displayUsers(users);
            } else {
                document.getElementById('users-table-body').innerHTML = 
@@ -169,7 +183,6 @@
    async function handleCreateUser(event) {
        event.preventDefault();
        
-       const token = getCookie('token');
        const userData = {
            first_name: document.getElementById('first_name').value,
            last_name: document.getElementById('last_name').value,
@@ -179,7 +192,7 @@
        };
    
        try {
-           const response = await fetch(`${API_BASE_URL}/users/`, {
+           const response = await authFetch(`${API_BASE_URL}/users/`, {
                method: 'POST',
                headers: {
                    'Content-Type': 'application/json'
@@ -190,7 +203,7 @@
            if (response.ok) {
                alert('User created successfully!');
                closeCreateUserModal();
-               loadUsers(token);
+               loadUsers();
            } else {
                const errorData = await response.json();
                alert('Failed to create user: ' + (errorData.error || response.statusText));
@@ -206,20 +219,17 @@
            return;
        }
        
-       const token = getCookie('token');
-       
        try {
-           const response = await fetch(`${API_BASE_URL}/users/${userId}`, {
+           const response = await authFetch(`${API_BASE_URL}/users/${userId}`, {
                method: 'DELETE',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                }
            });
    
            if (response.ok) {
                alert('User deleted successfully!');
-               loadUsers(token);
+               loadUsers();
            } else {
                alert('Failed to delete user');
            }
@@ -231,18 +241,11 @@
    
    // ==================== PLACES MANAGEMENT ====================
    
-   async function loadPlaces(token) {
+   async function loadPlaces() {
        try {
-           const response = await fetch(`${API_BASE_URL}/places/`, {
-               method: 'GET',
-               headers: {
-                   'Authorization': `Bearer ${token}`,
-                   'Content-Type': 'application/json'
-               }
-           });
+           const places = await fetchAllItems('/places/');
    
-           if (response.ok) {
-               const places = await response.json();
+           if (places) {
                displayPlaces(places);
            } else {
                document.getElementById('places-table-body').innerHTML = 
@@ -279,18 +282,11 @@
    
    // ==================== REVIEWS MANAGEMENT ====================
    
-   async function loadReviews(token) {
+   async function loadReviews() {
        try {
-           const response = await fetch(`${API_BASE_URL}/reviews/`, {
-               method: 'GET',
-               headers: {
-                   'Authorization': `Bearer ${token}`,
-                   'Content-Type': 'application/json'
-               }
-           });
+           const reviews = await fetchAllItems('/reviews/');
    
-           if (response.ok) {
-               const reviews = await response.json();
+           if (reviews) {
                displayReviews(reviews);
            } else {
                document.getElementById('reviews-table-body').innerHTML = 
@@ -331,20 +327,17 @@
            return;
        }
        
-       const token = getCookie('token');
-       
        try {
-           const response = await fetch(`${API_BASE_URL}/reviews/${reviewId}`, {
+           const response = await authFetch(`${API_BASE_URL}/reviews/${reviewId}`, {
                method: 'DELETE',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                }
            });
    
            if (response.ok) {
                alert('Review deleted successfully!');
-               loadReviews(token);
+               loadReviews();
            } else {
                alert('Failed to delete review');
            }
@@ -356,18 +349,11 @@
    
    // ==================== AMENITIES MANAGEMENT ====================
    
-   async function loadAmenities(token) {
+   async function loadAmenities() {
        try {
-           const response = await fetch(`${API_BASE_URL}/amenities/`, {
-               method: 'GET',
-               headers: {
-                   'Authorization': `Bearer ${token}`,
-                   'Content-Type': 'application/json'
-               }
-           });
+           const amenities = await fetchAllItems('/amenities/');
    
-           if (response.ok) {
-               const amenities = await response.json();
+           if (amenities) {
                displayAmenities(amenities);
            } else {
                document.getElementById('amenities-table-body').innerHTML = 
@@ -412,16 +398,14 @@
    async function handleCreateAmenity(event) {
        event.preventDefault();
        
-       const token = getCookie('token');
        const amenityData = {
            name: document.getElementById('amenity_name').value
        };
    
        try {
-           const response = await fetch(`${API_BASE_URL}/amenities/`, {
+           const response = await authFetch(`${API_BASE_URL}/amenities/`, {
                method: 'POST',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                },
                body: JSON.stringify(amenityData)
@@ -430,7 +414,7 @@
            if (response.ok) {
                alert('Amenity created successfully!');
                closeCreateAmenityModal();
-               loadAmenities(token);
+               loadAmenities();
            } else {
                const errorData = await response.json();
                alert('Failed to create amenity: ' + (errorData.error || response.statusText));
@@ -446,20 +430,17 @@
            return;
        }
        
-       const token = getCookie('token');
-       
        try {
-           const response = await fetch(`${API_BASE_URL}/amenities/${amenityId}`, {
+           const response = await authFetch(`${API_BASE_URL}/amenities/${amenityId}`, {
                method: 'DELETE',
                headers: {
-                   'Authorization': `Bearer ${token}`,
                    'Content-Type': 'application/json'
                }
            });
    
            if (response.ok) {
                alert('Amenity deleted successfully!');
-               loadAmenities(token);
+               loadAmenities();
            } else {
                alert('Failed to delete amenity');
            }
@@ -471,8 +452,8 @@
    
    // ==================== PAGE INITIALIZATION ====================
    
-   document.addEventListener('DOMContentLoaded', () => {
-       const token = checkAdminAuth();
+   document.addEventListener('DOMContentLoaded', async () => {
+       const token = await checkAdminAuth();
        
        // Login page
        const loginForm = document.getElementById('admin-login-form');
@@ -494,12 +475,14 @@
        
        // Dashboard
        if (window.location.pathname.includes('admin/index.html')) {
-           loadDashboardStats(token);
+           loadDashboardStats();
+           // Stats are served from a cached snapshot, so polling is cheap
+           setInterval(loadDashboardStats, 30000);
        }
        
        // Users page
        if (window.location.pathname.includes('users.html')) {
-           loadUsers(token);
+           loadUsers();
            
            const createUserForm = document.getElementById('create-user-form');
            if (createUserForm) {
@@ -509,17 +492,17 @@
        
        // Places page
        if (window.location.pathname.includes('places.html')) {
-           loadPlaces(token);
+           loadPlaces();
        }
        
        // Reviews page
        if (window.location.pathname.includes('reviews.html')) {
-           loadReviews(token);
+           loadReviews();
        }
        
        // Amenities page
        if (window.location.pathname.includes('amenities.html')) {
-           loadAmenities(token);
+           loadAmenities();
            
            const createAmenityForm = document.getElementById('create-amenity-form');
            if (createAmenityForm) {
@@ -0,0 +1,123 @@
+// Session handling shared by the public pages and the admin panel.
+// The access token lasts an hour; the refresh token renews it without
+// asking for the password again, and is replaced on every refresh.
+const AUTH_API_URL = 'http://127.0.0.1:5003/api/v1/auth';
+const ACCESS_TOKEN_MAX_AGE = 3600;
+const REFRESH_TOKEN_MAX_AGE = 30 * 24 * 3600;
+
+function readCookie(name) {
+    const value = `; ${document.cookie}`;
+    const parts = value.split(`; ${name}=`);
+    if (parts.length === 2) {
+        return parts.pop().split(';').shift();
+    }
+    return null;
+}
+
+function storeTokens(data) {
+    document.cookie = `token=${data.access_token}; path=/; max-age=${ACCESS_TOKEN_MAX_AGE}`;
+    if (data.refresh_token) {
+        document.cookie = `refresh_token=${data.refresh_token}; path=/; max-age=${REFRESH_TOKEN_MAX_AGE}`;
+    }
+}
+
+function clearTokens() {
+    document.cookie = 'token=; path=/; max-age=0';
+    document.cookie = 'refresh_token=; path=/; max-age=0';
+}
+
+// Concurrent callers share one refresh: a refresh token only works once.
+// Tabs take turns through a Web Lock; a tab that waited finds the
+// cookies already rotated by another tab and does not refresh again.
+// The server also returns the same pair to a duplicate refresh for a few
+// seconds, which covers browsers without navigator.locks.
+const REFRESH_LOCK_NAME = 'hbnb-token-refresh';
+let pendingRefresh = null;
+
+function withRefreshLock(task) {
+    if (navigator.locks) {
+        return navigator.locks.request(REFRESH_LOCK_NAME, task);
+    }
+    return task();
+}
+
+async function rotateTokens(staleRefreshToken) {
+    const refreshToken = readCookie('refresh_token');
+    if (!refreshToken) {
+        return null;
+    }
+    const accessToken = readCookie('token');
+    if (refreshToken !== staleRefreshToken && accessToken) {
+        return accessToken;
+    }
+    const response = await fetch(`${AUTH_API_URL}/refresh`, {
+        method: 'POST',
+        headers: { 'Authorization': `Bearer ${refreshToken}` }
+    });
+    if (!response.ok) {
+        // Another tab may have rotated the cookies meanwhile
+        if (readCookie('refresh_token') === refreshToken) {
+            clearTokens();
+        }
+        return readCookie('token');
+    }
+    const data = await response.json();
+    storeTokens(data);
+    return data.access_token;
+}
+
+async function refreshAccessToken() {
+    const staleRefreshToken = readCookie('refresh_token');
+    if (!staleRefreshToken) {
+        return null;
+    }
+    if (!pendingRefresh) {
+        pendingRefresh = withRefreshLock(() => rotateTokens(staleRefreshToken))
+            .catch((error) => {
+                console.error('Error refreshing session:', error);
+                return null;
+            })
+            .finally(() => {
+                pendingRefresh = null;
+            });
+    }
+    return pendingRefresh;
+}
+
+// Current access token, refreshed first if it has expired
+async function getAccessToken() {
+    return readCookie('token') || await refreshAccessToken();
+}
+
+// fetch with the access token, retried once after a refresh on 401
+async function authFetch(url, options = {}) {
+    const send = (token) => fetch(url, {
+        ...options,
+        headers: { ...(options.headers || {}), 'Authorization': `Bearer ${token}` }
+    });
+
+    let response = await send(await getAccessToken());
+    if (response.status === 401) {
+        const token = await refreshAccessToken();
+        if (token) {
+            response = await send(token);
+        }
+    }
+    return response;
+}
+
+// Revoke the session on the server, then forget the tokens
+async function endSession() {
+    const refreshToken = readCookie('refresh_token');
+    clearTokens();
+    if (refreshToken) {
+        try {
+            await fetch(`${AUTH_API_URL}/logout`, {
+                method: 'POST',
+                headers: { 'Authorization': `Bearer ${refreshToken}` }
+            });
+        } catch (error) {
+            console.error('Error during logout:', error);
+        }
+    }
+}
@@ -20,6 +20,11 @@ document.addEventListener('DOMContentLoaded', () => {
     if (placesContainer) {
         fetchPlaces();
     }
+
+    const loadMore = document.getElementById('load-more');
+    if (loadMore) {
+        loadMore.addEventListener('click', loadMorePlaces);
+    }
 });
 
 async function handleLogin(event) {
@@ -40,7 +45,7 @@ async function handleLogin(event) {
 
         if (response.ok) {
             const data = await response.json();
-            document.cookie = `token=${data.access_token}; path=/; max-age=3600`;
+            storeTokens(data);
             alert('Login successful!');
             window.location.href = 'index.html';
         } else {
@@ -53,17 +58,9 @@ async function handleLogin(event) {
     }
 }
 
-function getCookie(name) {
-    const value = `; ${document.cookie}`;
-    const parts = value.split(`; ${name}=`);
-    if (parts.length === 2) {
-        return parts.pop().split(';').shift();
-    }
-    return null;
-}
-
-function checkAuthentication() {
-    const token = getCookie('token');
+async function checkAuthentication() {
+    // An expired access token is renewed from the refresh token
+    const token = await getAccessToken();
     const loginLink = document.getElementById('login-link');
     
     if (token) {
@@ -81,16 +78,28 @@ function checkAuthentication() {
     }
 }
 
-function handleLogout(event) {
+async function handleLogout(event) {
     event.preventDefault();
-    document.cookie = 'token=; path=/; max-age=0';
+    await endSession();
     alert('Logged out successfully!');
     window.location.href = 'index.html';
 }
 
-async function fetchPlaces() {
+// Places arrive a page at a time; "Load more" follows next_cursor
+let placesFilter = null;
+let placesCursor = null;
+
+async function fetchPlaces(maxPrice, cursor) {
     try {
-        const response = await fetch('http://127.0.0.1:5003/api/v1/places/', {
+        const params = new URLSearchParams();
+        if (maxPrice) {
+            params.set('max_price', maxPrice);
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        const query = params.toString() ? `?${params}` : '';
+        const response = await fetch(`http://127.0.0.1:5003/api/v1/places/${query}`, {
             method: 'GET',
             headers: {
                 'Content-Type': 'application/json'
@@ -98,8 +107,11 @@ async function fetchPlaces() {
         });
 
         if (response.ok) {
-            const places = await response.json();
-            displayPlaces(places);
+            const page = await response.json();
+            placesFilter = maxPrice;
+            placesCursor = page.next_cursor;
+            displayPlaces(page.items, Boolean(cursor));
+            updateLoadMore();
         } else {
             alert('Failed to fetch places.');
         }
@@ -109,11 +121,26 @@ async function fetchPlaces() {
     }
 }
 
-function displayPlaces(places) {
+function updateLoadMore() {
+    const loadMore = document.getElementById('load-more');
+    if (loadMore) {
+        loadMore.style.display = placesCursor ? 'block' : 'none';
+    }
+}
+
+function loadMorePlaces() {
+    if (placesCursor) {
+        fetchPlaces(placesFilter, placesCursor);
+    }
+}
+
+function displayPlaces(places, append = false) {
     const placesContainer = document.getElementById('places-list');
-    placesContainer.innerHTML = '';
+    if (!append) {
+        placesContainer.innerHTML = '';
+    }
 
-    if (places.length === 0) {
+    if (places.length === 0 && !append) {
         placesContainer.innerHTML = '<p>No places available.</p>';
         return;
     }
@@ -135,20 +162,7 @@ function displayPlaces(places) {
 
 function filterByPrice() {
     const selectedPrice = document.getElementById('price-filter').value;
-    const placeCards = document.querySelectorAll('.place-card');
 
-    placeCards.forEach(card => {
-        const cardPrice = parseFloat(card.getAttribute('data-price'));
-        
-        if (selectedPrice === 'all') {
-            card.style.display = 'block';
-        } else {
-            const maxPrice = parseFloat(selectedPrice);
-            if (cardPrice <= maxPrice) {
-                card.style.display = 'block';
-            } else {
-                card.style.display = 'none';
-            }
-        }
-    });
+    // Filtering happens server-side so only matching places are sent
+    fetchPlaces(selectedPrice === 'all' ? null : selectedPrice);
 }
\ No newline at end of file